@@ -1,6 +1,7 @@
 """Runtime helpers that map ROS-style nodes onto the Qt UI."""
 
+from .headless_renderer import HeadlessFaceRenderer, load_telemetry
 from .robot_main_window import RobotMainWindow
 from .robot_runtime import RobotRuntime
 
-__all__ = ["RobotMainWindow", "RobotRuntime"]
+__all__ = ["HeadlessFaceRenderer", "RobotMainWindow", "RobotRuntime", "load_telemetry"]
@@ -0,0 +1,187 @@
+"""Offscreen rendering of the face from recorded telemetry at fixed timesteps."""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import BinaryIO, Deque, Iterator, List, Sequence, Tuple
+
+from PySide6.QtGui import QImage
+from PySide6.QtWidgets import QWidget
+
+from robot_control import FaceController
+from robot_control.gyro_calibrator import GyroCalibrator
+from robot_control.sensor_data import SensorSample
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_SAMPLE_RATE = 50.0
+# QImage.save quality for PNG: zlib level 1, about twice as fast as the default.
+PNG_QUALITY = 80
+
+
+def load_telemetry(path: str, sample_rate: float = DEFAULT_SAMPLE_RATE) -> List[SensorSample]:
+    """Read a capture of serial lines, one telemetry frame per line.
+
+    A line may start with its receive time in seconds (``12.345 {"T":1001,...}``);
+    lines without one are spaced ``1 / sample_rate`` after the previous frame.
+    Lines that do not parse as telemetry are skipped, as the serial reader does.
+    """
+
+    samples: List[SensorSample] = []
+    step = 1.0 / sample_rate
+    clock = -step
+    skipped = 0
+    with open(path, "r", encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            stamp, _, payload = line.partition(" ")
+            try:
+                clock = float(stamp)
+            except ValueError:
+                payload = line
+                clock += step
+            try:
+                sample = SensorSample.from_json(payload, received_at=clock)
+            except (ValueError, KeyError):
+                skipped += 1
+                continue
+            if sample.is_robot_frame:
+                samples.append(sample)
+    if skipped:
+        LOGGER.info("Skipped %d unparseable lines in %s", skipped, path)
+    return samples
+
+
+class HeadlessFaceRenderer:
+    """Drive a face widget from telemetry on a virtual clock and render each frame.
+
+    Frame ``k`` is taken at ``start + k / fps`` where ``start`` is the first
+    sample's time.  Every sample received up to that instant goes through the
+    calibrator and :class:`FaceController` as one batch, exactly as
+    ``RobotRuntime`` does live, then the face animation advances by one
+    timestep and the widget is painted into a reused ``QImage``.  Nothing
+    waits on wall-clock time, so rendering runs as fast as painting allows and
+    is reproducible for a given ``random`` seed.
+    """
+
+    def __init__(
+        self,
+        face: QWidget,
+        controller: FaceController,
+        *,
+        size: Tuple[int, int] = (800, 480),
+        fps: float = 30.0,
+        calibrator: GyroCalibrator | None = None,
+    ) -> None:
+        if fps <= 0:
+            raise ValueError("fps must be positive")
+        self._face = face
+        self._controller = controller
+        self._calibrator = calibrator or GyroCalibrator()
+        self._fps = fps
+        width, height = size
+        self._face.resize(width, height)
+        self._face.set_manual_clock(True)
+        self._image = QImage(width, height, QImage.Format.Format_RGB888)
+
+    @property
+    def fps(self) -> float:
+        return self._fps
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return self._image.width(), self._image.height()
+
+    def frames(self, samples: Sequence[SensorSample], tail: float = 0.0) -> Iterator[Tuple[int, float, QImage]]:
+        """Yield ``(index, time, image)`` for each frame; *image* is overwritten by the next one.
+
+        Rendering stops *tail* seconds after the last sample.
+        """
+
+        if not samples:
+            return
+        dt = 1.0 / self._fps
+        start = samples[0].timestamp()
+        end = samples[-1].timestamp() + tail
+        cursor = 0
+        index = 0
+        while True:
+            now = start + index * dt
+            if now > end + 1e-9:
+                return
+            first = cursor
+            while cursor < len(samples) and samples[cursor].timestamp() <= now + 1e-9:
+                cursor += 1
+            if cursor > first:
+                batch = samples[first:cursor]
+                for sample in batch:
+                    self._calibrator.observe(sample)
+                self._controller.apply_samples(batch)
+            self._face.advance(dt)
+            self._face.render(self._image)
+            yield index, now, self._image
+            index += 1
+
+    def render_png_sequence(
+        self,
+        samples: Sequence[SensorSample],
+        directory: str,
+        prefix: str = "frame",
+        tail: float = 0.0,
+        *,
+        quality: int = PNG_QUALITY,
+        workers: int | None = None,
+    ) -> int:
+        """Write ``<prefix>_000000.png``, ... into *directory*; return the frame count.
+
+        PNG encoding costs several times more than painting, so frames are
+        copied and encoded on *workers* threads (Qt releases the GIL while
+        saving) while the next one is painted.  *quality* follows
+        ``QImage.save``: higher is faster and larger, 100 is uncompressed.
+        """
+
+        os.makedirs(directory, exist_ok=True)
+        workers = workers or min(4, os.cpu_count() or 1)
+        pending: Deque[Tuple[str, Future]] = deque()
+        count = 0
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="png") as pool:
+            for index, _, image in self.frames(samples, tail):
+                path = os.path.join(directory, f"{prefix}_{index:06d}.png")
+                pending.append((path, pool.submit(image.copy().save, path, "PNG", quality)))
+                count += 1
+                while len(pending) > 2 * workers:
+                    _check_saved(*pending.popleft())
+            while pending:
+                _check_saved(*pending.popleft())
+        return count
+
+    def render_raw(self, samples: Sequence[SensorSample], stream: BinaryIO, tail: float = 0.0) -> int:
+        """Write tightly packed RGB24 frames to *stream*; return the frame count.
+
+        The output can be fed straight to an encoder, e.g.
+        ``ffmpeg -f rawvideo -pix_fmt rgb24 -s WxH -r FPS -i - out.mp4``.
+        """
+
+        width, height = self.size
+        row_bytes = width * 3
+        count = 0
+        for _, _, image in self.frames(samples, tail):
+            bits = image.constBits()
+            if image.bytesPerLine() == row_bytes:
+                stream.write(bits)
+            else:
+                stride = image.bytesPerLine()
+                for row in range(height):
+                    stream.write(bits[row * stride : row * stride + row_bytes])
+            count += 1
+        return count
+
+
+def _check_saved(path: str, future: Future) -> None:
+    if not future.result():
+        raise OSError(f"Could not write {path}")
@@ -2,49 +2,87 @@
 
 from __future__ import annotations
 
+import logging
+from time import monotonic
 from typing import Optional
 
-from PySide6.QtCore import QObject, QTimer
+from PySide6.QtCore import QEvent, QObject, Qt, QTimer, Signal
+from PySide6.QtGui import QGuiApplication
 
-from robot_control import FaceController, SerialReadWriter
+from robot_control import FaceController, SampleSource
 from robot_control.gyro_calibrator import GyroCalibrator
+from robot_control.sensor_data import SensorSample
 from robot_control.serial_bridge_server import SerialBridgeServer
 from axon_ui import TelemetryPanel
+from axon_ui.frame_stats import PercentileSummary, RollingPercentiles
+
+LOGGER = logging.getLogger(__name__)
+
+_FALLBACK_REFRESH_HZ = 60.0
 
 
 class RobotRuntime(QObject):
-    """Manage the serial polling loop inside the Qt event loop."""
+    """Drive the face from serial telemetry inside the Qt event loop.
+
+    The reader thread wakes the Qt thread through a queued signal whenever a
+    sample is buffered.  Wake-ups are coalesced: at most one signal is in
+    flight, and batches are applied at most once per display frame, so bursts
+    of UART frames cost a single face update.  When no data arrives for
+    ``stall_timeout_ms`` the telemetry overlay is marked as not streaming.
+    ``max_fps`` lowers the batch rate below the display refresh rate.
+    """
+
+    samplesAvailable = Signal()
 
     def __init__(
         self,
-        reader: SerialReadWriter,
+        reader: SampleSource,
         controller: FaceController,
         telemetry: TelemetryPanel,
-        poll_interval_ms: int = 40,
+        frame_interval_ms: float | None = None,
         calibrator: GyroCalibrator | None = None,
         bridge: SerialBridgeServer | None = None,
         parent: Optional[QObject] = None,
+        *,
+        stall_timeout_ms: int = 400,
+        max_fps: float | None = None,
     ) -> None:
         super().__init__(parent)
         self._reader = reader
         self._controller = controller
         self._telemetry = telemetry
         self._calibrator = calibrator or GyroCalibrator()
-        self._timer = QTimer(self)
-        self._timer.setInterval(poll_interval_ms)
-        self._timer.timeout.connect(self._poll)
-        self._missed_cycles = 0
-        self._running = False
         self._bridge = bridge
+        self._running = False
+        frame_interval = frame_interval_ms or _display_frame_interval_ms()
+        if max_fps:
+            frame_interval = max(frame_interval, 1000.0 / max_fps)
+        self._frame_interval = frame_interval / 1000.0
+        self._last_update = 0.0
+        # Set on the reader thread, cleared on the Qt thread right before draining.
+        self._notify_pending = False
+        self._paint_pending_since: float | None = None
+        self._latency = RollingPercentiles()
+
+        self.samplesAvailable.connect(self._handle_samples_available, Qt.ConnectionType.QueuedConnection)
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setSingleShot(True)
+        self._frame_timer.timeout.connect(self._process_samples)
+        self._stall_timer = QTimer(self)
+        self._stall_timer.setSingleShot(True)
+        self._stall_timer.setInterval(stall_timeout_ms)
+        self._stall_timer.timeout.connect(self._handle_stall)
+        self._controller.face.installEventFilter(self)
 
     def start(self) -> None:
         if self._running:
             return
         self._running = True
+        self._reader.add_sample_consumer(self._on_sample_received)
         self._reader.start()
         if self._bridge is not None:
             self._bridge.start()
-        self._timer.start()
+        self._stall_timer.start()
 
     def stop(self) -> None:
         if not self._running:
@@ -53,22 +91,82 @@ class RobotRuntime(QObject):
                 self._bridge.stop()
             return
         self._running = False
-        self._timer.stop()
+        self._reader.remove_sample_consumer(self._on_sample_received)
+        self._frame_timer.stop()
+        self._stall_timer.stop()
         self._reader.stop()
         if self._bridge is not None:
             self._bridge.stop()
+        if len(self._latency):
+            LOGGER.info("UART-to-paint latency: %s", self.latency_summary().scaled(1000.0).describe("ms"))
+
+    def latency_summary(self) -> PercentileSummary:
+        """Return UART receive → face paint latency percentiles, in seconds.
+
+        Only batches that scheduled a repaint of the face are measured.
+        """
+
+        return self._latency.summary()
 
-    def _poll(self) -> None:
-        sample = self._reader.pop_latest()
-        if sample is None:
-            self._missed_cycles += 1
-            if self._missed_cycles >= 10:
-                self._telemetry.set_streaming(False)
+    # ------------------------------------------------------------------
+    # Reader thread
+    # ------------------------------------------------------------------
+    def _on_sample_received(self, _sample: SensorSample) -> None:
+        if self._notify_pending:
             return
+        self._notify_pending = True
+        self.samplesAvailable.emit()
 
-        self._missed_cycles = 0
-        self._calibrator.observe(sample)
-        self._controller.apply_sample(sample)
-        self._telemetry.update_sample(sample)
+    # ------------------------------------------------------------------
+    # Qt thread
+    # ------------------------------------------------------------------
+    def _handle_samples_available(self) -> None:
+        if not self._running or self._frame_timer.isActive():
+            return
+        wait = self._last_update + self._frame_interval - monotonic()
+        if wait > 0:
+            self._frame_timer.start(max(1, int(wait * 1000.0 + 0.5)))
+            return
+        self._process_samples()
+
+    def _process_samples(self) -> None:
+        # Re-arm before draining so frames arriving meanwhile signal again.
+        self._notify_pending = False
+        samples = self._reader.pop_batch()
+        if not samples:
+            return
+
+        self._last_update = monotonic()
+        self._stall_timer.start()
+        # Every frame feeds calibration and the emotion state machine; only the
+        # newest one is rendered and mirrored to the overlays and bridge.
+        for sample in samples:
+            self._calibrator.observe(sample)
+        face = self._controller.face
+        requests = getattr(face, "repaint_requests", None)
+        self._controller.apply_samples(samples)
+        latest = samples[-1]
+        self._telemetry.update_sample(latest)
         if self._bridge is not None:
-            self._bridge.publish_sample(sample)
+            self._bridge.publish_sample(latest)
+        # Only a batch that invalidated the face is timed; otherwise the next
+        # blink or idle paint would be booked as its latency.
+        if self._paint_pending_since is None and (requests is None or face.repaint_requests != requests):
+            self._paint_pending_since = latest.timestamp()
+
+    def _handle_stall(self) -> None:
+        self._telemetry.set_streaming(False)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:  # noqa: N802 - Qt API
+        if event.type() == QEvent.Type.Paint and self._paint_pending_since is not None:
+            self._latency.add(monotonic() - self._paint_pending_since)
+            self._paint_pending_since = None
+        return False
+
+
+def _display_frame_interval_ms() -> float:
+    screen = QGuiApplication.primaryScreen()
+    refresh = screen.refreshRate() if screen is not None else 0.0
+    if refresh <= 0:
+        refresh = _FALLBACK_REFRESH_HZ
+    return 1000.0 / refresh
@@ -221,12 +221,15 @@ class FaceTelemetryDisplay(QWidget):
         if self._telemetry_panel.is_collapsed():
             width = collapsed_width
         else:
-            reserved = 0
-            if self._info_panel:
-                reserved = self._info_panel.collapsed_width()
+            # Leave room for every other panel's toggle (info, profiler).
             spacing = self._dock_layout.spacing() if self._dock_layout else 0
+            reserved = sum(
+                panel.collapsed_width() + spacing
+                for panel in self._collapsible_panels
+                if panel is not self._telemetry_panel
+            )
 
-            width = max(collapsed_width, available_width - reserved - spacing)
+            width = max(collapsed_width, available_width - reserved)
 
         self._set_panel_width(self._telemetry_panel, width)
 
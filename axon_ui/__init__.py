@@ -1,12 +1,16 @@
 """Shared UI components for Axon demos and runtime."""
 
 from .face_widget import RoboticFaceWidget
+from .frame_profiler import FrameProfiler
 from .info_panel import InfoPanel
 from .palette import apply_dark_palette
+from .profiler_panel import FrameProfilerPanel
 from .telemetry_panel import TelemetryPanel
 
 __all__ = [
     "RoboticFaceWidget",
+    "FrameProfiler",
+    "FrameProfilerPanel",
     "InfoPanel",
     "TelemetryPanel",
     "apply_dark_palette",
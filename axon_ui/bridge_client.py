@@ -7,6 +7,21 @@ import json
 from PySide6.QtCore import QObject, Signal
 from PySide6.QtNetwork import QAbstractSocket, QTcpSocket
 
+from robot_control.bridge_protocol import (
+    FRAME_TELEMETRY,
+    FRAME_TEXT,
+    PROTOCOL_VERSION,
+    SUBSCRIBE_COMMAND,
+    TELEMETRY_PREFIX,
+    Subscription,
+    WireFormat,
+    decode_telemetry,
+    format_ack,
+    format_command,
+    iter_frames,
+    subscribe_command,
+)
+
 
 class SerialBridgeConnection(QObject):
     """Minimal client for the TCP serial bridge exposed by the robot."""
@@ -16,14 +31,25 @@ class SerialBridgeConnection(QObject):
     stateChanged = Signal(QAbstractSocket.SocketState)
     errorOccurred = Signal(str)
 
-    def __init__(self, parent: QObject | None = None) -> None:
+    def __init__(
+        self,
+        parent: QObject | None = None,
+        *,
+        wire_format: WireFormat = WireFormat.JSON,
+        subscription: Subscription | None = None,
+    ) -> None:
         super().__init__(parent)
         self._socket = QTcpSocket(self)
         self._socket.readyRead.connect(self._handle_ready_read)
         self._socket.errorOccurred.connect(self._handle_error)
         self._socket.stateChanged.connect(self._handle_state_changed)
-        self._buffer = ""
+        self._buffer = bytearray()
         self._last_plain_payload: str | None = None
+        # Format requested on connect vs. format the server is currently sending.
+        self._requested_format = wire_format
+        self._active_format = WireFormat.JSON
+        # Sent on every connect; ``None`` keeps the server default (everything).
+        self._subscription = subscription
 
     # ------------------------------------------------------------------
     # Connection helpers
@@ -61,6 +87,13 @@ class SerialBridgeConnection(QObject):
     # Socket callbacks
     # ------------------------------------------------------------------
     def _handle_state_changed(self, state: QAbstractSocket.SocketState) -> None:  # pragma: no cover - Qt callback
+        if state == QAbstractSocket.SocketState.ConnectedState:
+            self._buffer.clear()
+            self._active_format = WireFormat.JSON
+            if self._requested_format is not WireFormat.JSON:
+                self.send_command(format_command(self._requested_format))
+            if self._subscription is not None:
+                self.send_command(subscribe_command(self._subscription))
         self.stateChanged.emit(state)
 
     def _handle_error(self, error: QAbstractSocket.SocketError) -> None:  # pragma: no cover - Qt callback
@@ -70,18 +103,57 @@ class SerialBridgeConnection(QObject):
         self.errorOccurred.emit(self._socket.errorString())
 
     def _handle_ready_read(self) -> None:  # pragma: no cover - Qt callback
-        data = bytes(self._socket.readAll()).decode("utf-8", errors="ignore")
+        data = self._socket.readAll().data()
         if not data:
             return
         self._buffer += data
-        while "\n" in self._buffer:
-            line, self._buffer = self._buffer.split("\n", 1)
-            self._process_line(line.strip())
+        # A format acknowledgement switches parsers mid-buffer, so loop until
+        # the active parser stops making progress.
+        while self._buffer:
+            active = self._active_format
+            if active is WireFormat.BINARY:
+                self._process_frames()
+            else:
+                self._process_lines()
+            if self._active_format is active:
+                break
+
+    def _process_lines(self) -> None:
+        start = 0
+        while True:
+            end = self._buffer.find(b"\n", start)
+            if end < 0:
+                break
+            line = self._buffer[start:end].decode("utf-8", errors="ignore").strip()
+            start = end + 1
+            self._process_line(line)
+            if self._active_format is not WireFormat.JSON:
+                break
+        del self._buffer[:start]
+
+    def _process_frames(self) -> None:
+        for version, kind, payload in iter_frames(self._buffer):
+            if version != PROTOCOL_VERSION:
+                continue
+            if kind == FRAME_TELEMETRY:
+                self._last_plain_payload = None
+                self.telemetryReceived.emit(decode_telemetry(payload))
+            elif kind == FRAME_TEXT:
+                self._process_line(payload.decode("utf-8", errors="ignore").strip())
+                if self._active_format is not WireFormat.BINARY:
+                    break
 
     def _process_line(self, line: str) -> None:
         if not line:
             return
-        if line.startswith("telemetry "):
+        if line.startswith("ok: "):
+            for wire_format in WireFormat:
+                if line == format_ack(wire_format):
+                    self._active_format = wire_format
+                    return
+            if line.startswith(f"ok: {SUBSCRIBE_COMMAND} "):
+                return
+        if line.startswith(TELEMETRY_PREFIX):
             payload = line.split(" ", 1)[1]
             if self._last_plain_payload != payload:
                 self.lineReceived.emit(payload)
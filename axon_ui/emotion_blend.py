@@ -0,0 +1,133 @@
+"""Weighted blending of emotion presets driven by a per-frame integrator."""
+
+from __future__ import annotations
+
+import math
+from typing import Dict, Mapping, Tuple
+
+import numpy as np
+
+from axon_ui.emotion_preset import STATE_SIZE
+
+
+class EmotionBlender:
+    """Blend any number of compiled presets by per-emotion weights.
+
+    Callers set normalised target weights with :meth:`set_targets`; the face
+    calls :meth:`step` once per frame, which moves the current weights toward
+    the targets with exponential smoothing (time constant ``response``) and
+    writes the weighted sum of preset vectors into :attr:`state` in place.
+    Retargeting never restarts anything, so an input that flips faster than
+    ``response`` settles on its average instead of replaying transitions.
+    """
+
+    def __init__(
+        self,
+        vectors: Mapping[str, np.ndarray],
+        initial: str,
+        response: float = 0.15,
+        tolerance: float = 1e-3,
+    ) -> None:
+        if response <= 0:
+            raise ValueError("response must be positive")
+        self._names: Tuple[str, ...] = tuple(vectors)
+        self._index: Dict[str, int] = {name: index for index, name in enumerate(self._names)}
+        self._presets = np.stack([vectors[name] for name in self._names]).astype(np.float64)
+        self._response = response
+        self._tolerance = tolerance
+
+        self._weights = np.zeros(len(self._names))
+        self._targets = np.zeros(len(self._names))
+        self._request = np.zeros(len(self._names))
+        self._delta = np.zeros(len(self._names))
+        self._state = np.zeros(STATE_SIZE)
+        self._settled = True
+        self._request[self._check(initial)] = 1.0
+        np.copyto(self._targets, self._request)
+        self.snap()
+
+    # ------------------------------------------------------------------
+    # Targets
+    # ------------------------------------------------------------------
+    @property
+    def emotions(self) -> Tuple[str, ...]:
+        return self._names
+
+    def set_target(self, emotion: str) -> bool:
+        """Converge on a single emotion; see :meth:`set_targets`."""
+
+        return self.set_targets({emotion: 1.0})
+
+    def set_targets(self, weights: Mapping[str, float]) -> bool:
+        """Set the target weights; emotions left out get zero.
+
+        Weights are normalised to sum to one.  Returns whether the targets
+        actually changed, so callers can skip work for repeated inputs.
+        """
+
+        request = self._request
+        request.fill(0.0)
+        for name, weight in weights.items():
+            if weight < 0:
+                raise ValueError(f"Emotion weight for '{name}' must not be negative")
+            request[self._check(name)] += weight
+        total = float(request.sum())
+        if total <= 0.0:
+            raise ValueError("At least one emotion weight must be positive")
+        request /= total
+        if np.array_equal(request, self._targets):
+            return False
+        np.copyto(self._targets, request)
+        self._settled = False
+        return True
+
+    @property
+    def dominant(self) -> str:
+        """Emotion with the highest target weight (the first one on ties)."""
+
+        return self._names[int(np.argmax(self._targets))]
+
+    def weight(self, emotion: str) -> float:
+        """Current (not target) weight of *emotion*."""
+
+        return float(self._weights[self._check(emotion)])
+
+    # ------------------------------------------------------------------
+    # Integration
+    # ------------------------------------------------------------------
+    @property
+    def state(self) -> np.ndarray:
+        """Blended state vector indexed by ``STATE_FIELDS``; updated in place."""
+
+        return self._state
+
+    @property
+    def settled(self) -> bool:
+        return self._settled
+
+    def step(self, dt: float) -> bool:
+        """Advance the weights by *dt* seconds; return whether the state moved."""
+
+        if self._settled:
+            return False
+        np.subtract(self._targets, self._weights, out=self._delta)
+        if float(np.abs(self._delta).max()) <= self._tolerance:
+            self.snap()
+            return True
+        self._delta *= 1.0 - math.exp(-max(0.0, dt) / self._response)
+        self._weights += self._delta
+        np.dot(self._weights, self._presets, out=self._state)
+        return True
+
+    def snap(self) -> None:
+        """Jump straight to the targets."""
+
+        np.copyto(self._weights, self._targets)
+        np.dot(self._weights, self._presets, out=self._state)
+        self._settled = True
+
+    def _check(self, emotion: str) -> int:
+        try:
+            return self._index[emotion]
+        except KeyError:
+            raise ValueError(f"Unknown emotion '{emotion}'. Available: {self._names}") from None
@@ -1,7 +1,42 @@
 """Definition of the face widget's emotion presets."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Dict, Mapping, Tuple
+
+import numpy as np
+
+# Layout of a compiled face state vector, see EmotionPreset.to_vector().
+STATE_FIELDS: Tuple[str, ...] = (
+    "eye_openness",
+    "eye_curve",
+    "brow_raise",
+    "brow_tilt",
+    "mouth_curve",
+    "mouth_open",
+    "mouth_width",
+    "mouth_height",
+    "iris_size",
+    "accent_red",
+    "accent_green",
+    "accent_blue",
+)
+(
+    EYE_OPENNESS,
+    EYE_CURVE,
+    BROW_RAISE,
+    BROW_TILT,
+    MOUTH_CURVE,
+    MOUTH_OPEN,
+    MOUTH_WIDTH,
+    MOUTH_HEIGHT,
+    IRIS_SIZE,
+    ACCENT_RED,
+    ACCENT_GREEN,
+    ACCENT_BLUE,
+) = range(len(STATE_FIELDS))
+STATE_SIZE = len(STATE_FIELDS)
 
 
 @dataclass
@@ -17,3 +52,30 @@ class EmotionPreset:
     mouth_height: float
     iris_size: float
     accent_color: Tuple[int, int, int]
+
+    def to_vector(self) -> np.ndarray:
+        """Return the preset as a read-only float vector indexed by ``STATE_FIELDS``."""
+
+        vector = np.array(
+            (
+                self.eye_openness,
+                self.eye_curve,
+                self.brow_raise,
+                self.brow_tilt,
+                self.mouth_curve,
+                self.mouth_open,
+                self.mouth_width,
+                self.mouth_height,
+                self.iris_size,
+                *self.accent_color,
+            ),
+            dtype=np.float64,
+        )
+        vector.setflags(write=False)
+        return vector
+
+
+def compile_presets(presets: Mapping[str, EmotionPreset]) -> Dict[str, np.ndarray]:
+    """Compile every preset once so transitions only touch preallocated vectors."""
+
+    return {name: preset.to_vector() for name, preset in presets.items()}
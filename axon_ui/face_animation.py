@@ -0,0 +1,186 @@
+"""Emotion, orientation and idle animation state shared by the face widgets."""
+
+from __future__ import annotations
+
+import math
+import random
+from typing import Dict, Mapping, Tuple
+
+from PySide6.QtCore import QPointF, QRectF
+from PySide6.QtGui import QColor
+
+from axon_ui.emotion_blend import EmotionBlender
+from axon_ui.emotion_preset import ACCENT_BLUE, ACCENT_GREEN, ACCENT_RED, EYE_OPENNESS, EmotionPreset, compile_presets
+from axon_ui.frame_pacer import FramePacer, PacingConfig
+
+# Orientation changes smaller than this (sensor noise) do not wake the frame pacer.
+_ORIENTATION_WAKE_DEGREES = 0.5
+
+# Below this battery voltage the face is held on the fearful expression.
+_LOW_BATTERY_VOLTS = 10.0
+
+
+class FaceAnimationMixin:
+    """Control API and idle animation common to every face renderer.
+
+    Holds the emotion blend, head orientation, blink/breathing clock and the
+    low-battery override, so the software and OpenGL faces only differ in how
+    they draw.  Widgets call :meth:`_init_animation` from ``__init__`` and
+    override :meth:`_schedule_repaint` when they can repaint less than the
+    whole widget.
+    """
+
+    def _init_animation(self, presets: Dict[str, EmotionPreset]) -> None:
+        self._presets = presets
+        self._default_emotion = "neutral"
+        self._current_emotion = self._default_emotion
+        self._blend = EmotionBlender(compile_presets(self._presets), self._current_emotion)
+        self._state = self._blend.state
+
+        self._orientation = {
+            "yaw": 0.0,
+            "pitch": 0.0,
+            "roll": 0.0,
+        }
+
+        self._pacer = FramePacer(self._update_idle, parent=self)
+        self._pacer.start()
+
+        self._time = 0.0
+        self._breathe_offset = 0.0
+        self._sparkle = 0.0
+        self._blink_phase = 0.0
+        self._blinking = False
+        self._next_blink_at = random.uniform(2.0, 5.0)
+        self._time_since_blink = 0.0
+        self._emotion_hold_time = 0.0
+        self._battery_voltage: float | None = None
+        self._low_battery_forced = False
+        self._requested_weights: Dict[str, float] | None = None
+
+    def available_emotions(self) -> Tuple[str, ...]:
+        return tuple(self._presets.keys())
+
+    def set_emotion(self, emotion: str) -> None:
+        """Blend to the requested emotion."""
+        self.set_emotion_weights({emotion: 1.0})
+
+    def set_emotion_weights(self, weights: Mapping[str, float]) -> None:
+        """Blend toward a mix of emotions, e.g. ``{"happy": 0.7, "surprised": 0.3}``.
+
+        Weights are normalised.  Changing them mid-transition just retargets
+        the per-frame integrator (see EmotionBlender); the mouth shape and
+        icon follow the emotion with the largest weight.  While the battery is
+        critically low the fearful face stays up and the newest weights are
+        applied once it recovers.
+        """
+        self._requested_weights = dict(weights)
+        if not self._low_battery_forced:
+            self._blend_to(weights)
+
+    def _blend_to(self, weights: Mapping[str, float]) -> None:
+        if not self._blend.set_targets(weights):
+            return
+        dominant = self._blend.dominant
+        if dominant != self._current_emotion:
+            self._current_emotion = dominant
+            self._emotion_hold_time = 0.0
+        self._pacer.wake()
+
+    def set_orientation(self, yaw: float | None = None, pitch: float | None = None, roll: float | None = None) -> None:
+        """Update the head orientation in degrees."""
+        previous = dict(self._orientation)
+        if yaw is not None:
+            self._orientation["yaw"] = float(max(-45.0, min(45.0, yaw)))
+        if pitch is not None:
+            self._orientation["pitch"] = float(max(-30.0, min(30.0, pitch)))
+        if roll is not None:
+            self._orientation["roll"] = float(max(-30.0, min(30.0, roll)))
+        if any(abs(self._orientation[axis] - previous[axis]) > _ORIENTATION_WAKE_DEGREES for axis in previous):
+            self._pacer.wake()
+        self._schedule_repaint()
+
+    def set_battery_voltage(self, voltage: float) -> None:
+        """Update battery voltage and enforce default fear when critically low."""
+        self._battery_voltage = float(voltage)
+        self._enforce_low_battery_face()
+
+    def set_frame_pacing(self, config: PacingConfig) -> None:
+        """Set the animation FPS cap and idle throttling, see FramePacer."""
+        self._pacer.set_config(config)
+
+    def set_manual_clock(self, enabled: bool) -> None:
+        """Stop the frame pacer so only :meth:`advance` moves the animation (offline rendering)."""
+        if enabled:
+            self._pacer.stop()
+        else:
+            self._pacer.start()
+
+    def advance(self, dt: float) -> None:
+        """Advance blinks, breathing and emotion blending by *dt* seconds."""
+        self._update_idle(dt)
+
+    # ------------------------------------------------------------------
+    # Animation helpers
+    # ------------------------------------------------------------------
+    def _update_idle(self, dt: float = 0.016) -> bool:
+        """Advance idle animations by *dt* seconds; return whether smooth motion is needed."""
+        self._time += dt
+        self._time_since_blink += dt
+        self._emotion_hold_time += dt
+        self._enforce_low_battery_face()
+
+        blending = self._blend.step(dt)
+        self._breathe_offset = math.sin(self._time * 0.7) * 6.0
+        self._sparkle = (math.sin(self._time * 3.0) + 1.0) * 0.5
+
+        if self._blinking:
+            self._blink_phase += dt / 0.18
+            if self._blink_phase >= 1.0:
+                self._blinking = False
+                self._blink_phase = 0.0
+        elif self._time_since_blink > self._next_blink_at:
+            self._blinking = True
+            self._blink_phase = 0.0
+            self._time_since_blink = 0.0
+            self._next_blink_at = random.uniform(2.0, 5.0)
+
+        self._schedule_repaint()
+        return self._blinking or blending
+
+    def _schedule_repaint(self) -> None:
+        self.update()
+
+    def _accent_color(self) -> QColor:
+        return QColor(int(self._state[ACCENT_RED]), int(self._state[ACCENT_GREEN]), int(self._state[ACCENT_BLUE]))
+
+    def _eye_centers(self, face_rect: QRectF, center: QPointF) -> Tuple[QPointF, QPointF]:
+        eye_spacing = face_rect.width() * 0.18
+        yaw_offset = self._orientation["yaw"] / 45.0
+        pitch_offset = self._orientation["pitch"] / 45.0
+        eye_center_offset_x = yaw_offset * face_rect.width() * 0.05
+        eye_y = center.y() - face_rect.height() * 0.05 + pitch_offset * 14.0
+        return (
+            QPointF(center.x() - eye_spacing + eye_center_offset_x, eye_y),
+            QPointF(center.x() + eye_spacing + eye_center_offset_x, eye_y),
+        )
+
+    def _effective_eye_openness(self) -> float:
+        eye_openness = max(0.05, min(1.3, self._state[EYE_OPENNESS]))
+        blink_factor = 1.0
+        if self._blinking:
+            blink_factor -= math.sin(min(1.0, self._blink_phase) * math.pi)
+            blink_factor = max(0.0, blink_factor)
+        return max(0.02, eye_openness * blink_factor)
+
+    def _enforce_low_battery_face(self) -> None:
+        """Force fearful face when battery is critically low."""
+        if self._battery_voltage is None:
+            return
+        low_battery = self._battery_voltage < _LOW_BATTERY_VOLTS
+        if low_battery and not self._low_battery_forced:
+            self._low_battery_forced = True
+            self._blend_to({"fearful": 1.0})
+        elif not low_battery and self._low_battery_forced:
+            self._low_battery_forced = False
+            self._blend_to(self._requested_weights or {self._default_emotion: 1.0})
@@ -0,0 +1,66 @@
+"""Runtime selection between the software and OpenGL face renderers."""
+
+from __future__ import annotations
+
+import logging
+from enum import Enum
+
+from PySide6.QtGui import QGuiApplication, QOpenGLContext
+from PySide6.QtWidgets import QWidget
+
+from axon_ui.face_widget import RoboticFaceWidget
+
+LOGGER = logging.getLogger(__name__)
+
+# Platform plugins that never provide an OpenGL context (headless tests, CI).
+_SOFTWARE_ONLY_PLATFORMS = frozenset({"offscreen", "minimal"})
+
+
+class FaceBackend(Enum):
+    """Renderer used for the robotic face."""
+
+    AUTO = "auto"
+    SOFTWARE = "software"
+    OPENGL = "opengl"
+
+    @classmethod
+    def parse(cls, value: str) -> "FaceBackend":
+        try:
+            return cls(value.strip().lower())
+        except ValueError:
+            options = ", ".join(backend.value for backend in cls)
+            raise ValueError(f"Unknown face backend '{value}'. Available: {options}") from None
+
+
+def opengl_available() -> bool:
+    """Return whether the running application can create an OpenGL context."""
+
+    if QGuiApplication.instance() is None:
+        return False
+    if QGuiApplication.platformName() in _SOFTWARE_ONLY_PLATFORMS:
+        return False
+    return QOpenGLContext().create()
+
+
+def create_face_widget(backend: FaceBackend | str = FaceBackend.AUTO, parent: QWidget | None = None) -> QWidget:
+    """Create the face for *backend*, falling back to software rendering.
+
+    ``auto`` and ``opengl`` both use the shader face when a context can be
+    created; ``opengl`` additionally warns when it cannot.  Both widgets accept
+    ``set_emotion``, ``set_orientation``, ``set_battery_voltage`` and
+    ``set_frame_pacing``.
+    """
+
+    if isinstance(backend, str):
+        backend = FaceBackend.parse(backend)
+    if backend is not FaceBackend.SOFTWARE:
+        if opengl_available():
+            from axon_ui.face_widget_gl import GLFaceWidget
+
+            return GLFaceWidget(parent)
+        if backend is FaceBackend.OPENGL:
+            LOGGER.warning(
+                "OpenGL is not available on the '%s' platform; using the software face",
+                QGuiApplication.platformName(),
+            )
+    return RoboticFaceWidget(parent)
@@ -1,17 +1,50 @@
 from __future__ import annotations
 
 import math
-import random
-from typing import Dict, Tuple
+from typing import Dict, Hashable, Tuple
 
-from PySide6.QtCore import QEasingCurve, QPointF, QRectF, QTimer, QVariantAnimation, Qt
-from PySide6.QtGui import QColor, QFont, QLinearGradient, QPainter, QPainterPath, QPen
+from PySide6.QtCore import QPointF, QRectF, Qt
+from PySide6.QtGui import QBrush, QColor, QFont, QLinearGradient, QPainter, QPainterPath, QPen, QRegion
 from PySide6.QtWidgets import QSizePolicy, QWidget
 
-from axon_ui.emotion_preset import EmotionPreset
-
-
-class RoboticFaceWidget(QWidget):
+from axon_ui.dirty_regions import FeatureRepaintTracker, feature_region, rotation_about
+from axon_ui.emotion_preset import (
+    ACCENT_BLUE,
+    ACCENT_GREEN,
+    ACCENT_RED,
+    BROW_RAISE,
+    BROW_TILT,
+    EYE_CURVE,
+    IRIS_SIZE,
+    MOUTH_CURVE,
+    MOUTH_HEIGHT,
+    MOUTH_OPEN,
+    MOUTH_WIDTH,
+    EmotionPreset,
+)
+from axon_ui.face_animation import FaceAnimationMixin
+from axon_ui.render_cache import PathCache, StaticLayerCache, quantize
+
+# Animated shape parameters are snapped to this step before they key the PathCache.
+_SHAPE_STEP = 1.0 / 1024.0
+
+# Icon anchors (x, y factors of the face rect) used per emotion by _draw_emotion_icon.
+_ICON_ANCHORS: Dict[str, Tuple[Tuple[float, float], ...]] = {
+    "happy": ((-0.34, -0.24), (0.34, -0.24), (0.0, -0.28)),
+    "sad": ((-0.32, 0.18),),
+    "surprised": ((0.45, -0.06),),
+    "sleepy": ((0.34, -0.24),),
+    "curious": ((0.45, -0.06),),
+    "excited": ((0.34, -0.24), (-0.34, -0.24), (0.0, -0.28)),
+    "angry": ((-0.34, -0.24),),
+    "fearful": ((-0.45, -0.06), (0.34, -0.24), (-0.34, -0.24)),
+    "disgusted": ((0.34, -0.24),),
+    "smirk": ((0.32, 0.18),),
+    "proud": ((0.0, -0.28),),
+}
+
+
+class RoboticFaceWidget(FaceAnimationMixin, QWidget):
     """Animated robotic face widget with emotion and orientation controls."""
 
     def __init__(self, parent: QWidget | None = None) -> None:
@@ -19,219 +52,251 @@ class RoboticFaceWidget(QWidget):
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.setMinimumSize(480, 320)
 
-        self._presets: Dict[str, EmotionPreset] = self._build_presets()
-        self._default_emotion = "neutral"
-        self._current_emotion = self._default_emotion
-        self._state = self._preset_to_state(self._presets[self._current_emotion])
-        self._start_state = self._state.copy()
-        self._target_state = self._state.copy()
-
-        self._orientation = {
-            "yaw": 0.0,
-            "pitch": 0.0,
-            "roll": 0.0,
-        }
-
-        self._animation = QVariantAnimation(self)
-        self._animation.setEasingCurve(QEasingCurve.OutCubic)
-        self._animation.valueChanged.connect(self._update_state_from_animation)
-        self._animation.finished.connect(self.update)
-
-        self._idle_timer = QTimer(self)
-        self._idle_timer.timeout.connect(self._update_idle)
-        self._idle_timer.start(16)
-
-        self._time = 0.0
-        self._breathe_offset = 0.0
-        self._sparkle = 0.0
-        self._blink_phase = 0.0
-        self._blinking = False
-        self._next_blink_at = random.uniform(2.0, 5.0)
-        self._time_since_blink = 0.0
-        self._emotion_hold_time = 0.0
-        self._battery_voltage: float | None = None
-        self._low_battery_forced = False
+        self._init_animation(self._build_presets())
+        self._static_layers = StaticLayerCache()
+        self._paths = PathCache()
+        self._repaint = FeatureRepaintTracker(self)
 
         self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
 
-    def available_emotions(self) -> Tuple[str, ...]:
-        return tuple(self._presets.keys())
-
-    def set_emotion(self, emotion: str) -> None:
-        """Animate to the requested emotion."""
-        if emotion not in self._presets:
-            raise ValueError(f"Unknown emotion '{emotion}'. Available: {self.available_emotions()}")
-
-        if emotion == self._current_emotion:
-            return
+    def set_static_layer_caching(self, enabled: bool) -> None:
+        """Toggle pre-rendering of the size-dependent background (on by default)."""
+        self._static_layers.enabled = enabled
+        self.update()
 
-        self._current_emotion = emotion
-        self._emotion_hold_time = 0.0
-        target_state = self._preset_to_state(self._presets[emotion])
-        self._start_state = self._state.copy()
-
-        self._animation.stop()
-        self._animation.setStartValue(0.0)
-        self._animation.setEndValue(1.0)
-        self._animation.setDuration(550)
-        self._target_state = target_state
-        self._animation.start()
-
-    def set_orientation(self, yaw: float | None = None, pitch: float | None = None, roll: float | None = None) -> None:
-        """Update the head orientation in degrees."""
-        if yaw is not None:
-            self._orientation["yaw"] = float(max(-45.0, min(45.0, yaw)))
-        if pitch is not None:
-            self._orientation["pitch"] = float(max(-30.0, min(30.0, pitch)))
-        if roll is not None:
-            self._orientation["roll"] = float(max(-30.0, min(30.0, roll)))
+    def set_path_caching(self, enabled: bool) -> None:
+        """Toggle reuse of icon, eye and mouth geometry across frames (on by default)."""
+        self._paths.enabled = enabled
         self.update()
 
-    def set_battery_voltage(self, voltage: float) -> None:
-        """Update battery voltage and enforce default fear when critically low."""
-        self._battery_voltage = float(voltage)
-        self._enforce_low_battery_face()
+    def set_repaint_mode(self, mode: str) -> None:
+        """Choose ``regions`` (default), ``changed`` or ``full`` repaints, see FeatureRepaintTracker."""
+        self._repaint.mode = mode
+
+    @property
+    def repaint_requests(self) -> int:
+        """Repaints scheduled so far; lets callers tell whether an update changed anything."""
+        return self._repaint.requests
 
     # ------------------------------------------------------------------
-    # Animation helpers
+    # Repaint tracking
     # ------------------------------------------------------------------
-    def _update_state_from_animation(self, progress: float) -> None:
-        for key, start_value in self._start_state.items():
-            end_value = self._target_state[key]
-            if isinstance(start_value, QColor) and isinstance(end_value, QColor):
-                interpolated = QColor(
-                    start_value.red() + (end_value.red() - start_value.red()) * progress,
-                    start_value.green() + (end_value.green() - start_value.green()) * progress,
-                    start_value.blue() + (end_value.blue() - start_value.blue()) * progress,
-                )
-                self._state[key] = interpolated
-            else:
-                self._state[key] = start_value + (end_value - start_value) * progress
-        self.update()
+    def _schedule_repaint(self) -> None:
+        self._repaint.invalidate(self._repaint_signatures(), self._feature_bounds)
 
-    def _update_idle(self) -> None:
-        dt = 0.016
-        self._time += dt
-        self._time_since_blink += dt
-        self._emotion_hold_time += dt
-        self._enforce_low_battery_face()
-
-        self._breathe_offset = math.sin(self._time * 0.7) * 6.0
-        self._sparkle = (math.sin(self._time * 3.0) + 1.0) * 0.5
-
-        if self._blinking:
-            self._blink_phase += dt / 0.18
-            if self._blink_phase >= 1.0:
-                self._blinking = False
-                self._blink_phase = 0.0
-        elif self._time_since_blink > self._next_blink_at:
-            self._blinking = True
-            self._blink_phase = 0.0
-            self._time_since_blink = 0.0
-            self._next_blink_at = random.uniform(2.0, 5.0)
+    def _repaint_signatures(self) -> Dict[str, Hashable]:
+        state = self._state
+        pose = (self.width(), self.height(), self._orientation["yaw"], self._orientation["pitch"], self._orientation["roll"])
+        accent = (int(state[ACCENT_RED]), int(state[ACCENT_GREEN]), int(state[ACCENT_BLUE]))
+        return {
+            "eyes": (
+                pose,
+                self._effective_eye_openness(),
+                state[EYE_CURVE],
+                state[IRIS_SIZE],
+                self._sparkle,
+                self._breathe_offset,
+                accent,
+            ),
+            "brows": (pose, state[BROW_RAISE], state[BROW_TILT], accent),
+            "mouth": (
+                pose,
+                self._current_emotion,
+                state[MOUTH_CURVE],
+                state[MOUTH_OPEN],
+                state[MOUTH_WIDTH],
+                state[MOUTH_HEIGHT],
+                self._breathe_offset,
+                accent,
+            ),
+            "icon": (pose, self._current_emotion, self._time, self._breathe_offset, accent)
+            if self._icon_visible()
+            else None,
+        }
 
-        self.update()
+    def _feature_bounds(self) -> Dict[str, QRegion]:
+        """Conservative device-space bounds of each feature for the current state."""
+        face_rect, center = self._face_layout()
+        roll = rotation_about(center, self._orientation["roll"] * 0.8)
+        eye_width = face_rect.width() * 0.26
+        eye_height = face_rect.height() * 0.24
+        left_eye_center, right_eye_center = self._eye_centers(face_rect, center)
+        yaw_offset = self._orientation["yaw"] / 45.0
+        pitch_offset = self._orientation["pitch"] / 45.0
+
+        scaled_height = eye_height * self._effective_eye_openness()
+        iris_radius = min(eye_width, scaled_height) * 0.32 * self._state[IRIS_SIZE]
+        stroke = max(2.0, eye_width * 0.035)
+        eyes = QRegion()
+        for eye_center, direction in ((left_eye_center, -1), (right_eye_center, 1)):
+            eye_rect = QRectF(
+                eye_center.x() - eye_width * 0.5,
+                eye_center.y() - scaled_height * 0.5 + self._breathe_offset * 0.1,
+                eye_width,
+                scaled_height,
+            )
+            iris_center = QPointF(
+                eye_center.x() + yaw_offset * eye_width * 0.45,
+                eye_center.y() + pitch_offset * scaled_height * 0.35,
+            )
+            iris_rect = QRectF(iris_center.x() - iris_radius, iris_center.y() - iris_radius, iris_radius * 2, iris_radius * 2)
+            tilt = rotation_about(eye_rect.center(), self._state[EYE_CURVE] * direction * 12.0)
+            eyes = eyes.united(feature_region(eye_rect.united(iris_rect), tilt * roll, stroke))
+
+        brow_width = eye_width * 1.1
+        brow_height = eye_width * 0.25
+        brow_offset_y = -eye_width * (0.55 + self._state[BROW_RAISE] * 0.4)
+        brows = QRegion()
+        for eye_center, direction in ((left_eye_center, -1), (right_eye_center, 1)):
+            brow_rect = QRectF(eye_center.x() - brow_width * 0.5, eye_center.y() + brow_offset_y, brow_width, brow_height)
+            tilt = rotation_about(brow_rect.center(), self._state[BROW_TILT] * 18.0 * direction)
+            brows = brows.united(feature_region(brow_rect, tilt * roll))
+
+        # Every mouth shape is clamped inside the face margins.  The tallest one,
+        # the surprised ellipse, is pushed up by its clamp to about 0.18 face
+        # heights above the unclamped centre; nothing reaches 0.2 below it.
+        mouth_center = QPointF(
+            center.x() + yaw_offset * face_rect.width() * 0.05,
+            center.y()
+            + face_rect.height() * 0.26
+            + self._breathe_offset * 0.12
+            - face_rect.height() * 0.035 * self._state[MOUTH_CURVE],
+        )
+        mouth_rect = QRectF(
+            mouth_center.x() - face_rect.width() * 0.3,
+            mouth_center.y() - face_rect.height() * 0.2,
+            face_rect.width() * 0.6,
+            face_rect.height() * 0.4,
+        )
+        bounds = {
+            "eyes": eyes,
+            "brows": brows,
+            "mouth": feature_region(mouth_rect, roll, 4.0),
+        }
+
+        if self._icon_visible():
+            reach = face_rect.width() * 0.07 * 1.6 + 16.0
+            icon = QRegion()
+            for x_factor, y_factor in _ICON_ANCHORS.get(self._current_emotion, ()):
+                anchor = self._icon_anchor(face_rect, x_factor, y_factor)
+                icon = icon.united(feature_region(QRectF(anchor.x() - reach, anchor.y() - reach, reach * 2, reach * 2), roll))
+            bounds["icon"] = icon
+        return bounds
 
     # ------------------------------------------------------------------
     # Drawing
     # ------------------------------------------------------------------
+    def resizeEvent(self, event) -> None:  # type: ignore[override]
+        self._static_layers.invalidate()
+        self._repaint.reset()
+        super().resizeEvent(event)
+
     def paintEvent(self, event) -> None:  # type: ignore[override]
         painter = QPainter(self)
         painter.setRenderHints(QPainter.RenderHint.Antialiasing | QPainter.RenderHint.SmoothPixmapTransform)
 
         rect = self.rect()
+        region = event.region()
 
-        bg_gradient = QLinearGradient(0, 0, 0, rect.height())
-        bg_gradient.setColorAt(0.0, QColor(10, 12, 28))
-        bg_gradient.setColorAt(1.0, QColor(2, 4, 12))
-        painter.fillRect(rect, bg_gradient)
-
-        face_margin = min(rect.width(), rect.height()) * 0.035
-        face_rect = QRectF(
-            rect.left() + face_margin,
-            rect.top() + face_margin,
-            rect.width() - face_margin * 2,
-            rect.height() - face_margin * 2,
-        )
+        self._static_layers.paint(painter, "background", rect, self._render_background, opaque=True)
 
-        center = face_rect.center()
-        head_size = min(face_rect.width(), face_rect.height()) * 1.2
-        face_rect = QRectF(
-            center.x() - head_size * 0.5,
-            center.y() - head_size * 0.5,
-            head_size,
-            head_size,
-        )
-        center = face_rect.center()
+        face_rect, center = self._face_layout()
         painter.save()
         painter.translate(center)
         painter.rotate(self._orientation["roll"] * 0.8)
         painter.translate(-center)
 
-        head_gradient = QLinearGradient(face_rect.topLeft(), face_rect.bottomLeft())
-        head_gradient.setColorAt(0.0, QColor(40, 48, 82))
-        head_gradient.setColorAt(0.4, QColor(26, 32, 58))
-        head_gradient.setColorAt(1.0, QColor(10, 14, 28))
-        painter.setBrush(head_gradient)
-        painter.setPen(QPen(QColor(110, 140, 220, 140), face_rect.width() * 0.012))
+        head_brush, head_pen = self._static_layers.resource(
+            "head", (face_rect.x(), face_rect.y(), face_rect.width()), lambda: self._head_style(face_rect)
+        )
+        painter.setBrush(head_brush)
+        painter.setPen(head_pen)
         head_path = QPainterPath()
         # head_path.addEllipse(face_rect)
         painter.drawPath(head_path)
 
-        accent_color: QColor = self._state["accent_color"]
+        accent_color = self._accent_color()
 
         eye_height = face_rect.height() * 0.24
         eye_width = face_rect.width() * 0.26
-        eye_spacing = face_rect.width() * 0.18
 
         yaw_offset = self._orientation["yaw"] / 45.0
         pitch_offset = self._orientation["pitch"] / 45.0
-        eye_center_offset_x = yaw_offset * face_rect.width() * 0.05
+        left_eye_center, right_eye_center = self._eye_centers(face_rect, center)
 
-        left_eye_center = QPointF(
-            center.x() - eye_spacing + eye_center_offset_x,
-            center.y() - face_rect.height() * 0.05 + pitch_offset * 14.0,
-        )
-        right_eye_center = QPointF(
-            center.x() + eye_spacing + eye_center_offset_x,
-            center.y() - face_rect.height() * 0.05 + pitch_offset * 14.0,
-        )
+        eye_curve = self._state[EYE_CURVE]
+        brow_raise = self._state[BROW_RAISE]
+        brow_tilt = self._state[BROW_TILT]
+        iris_size = self._state[IRIS_SIZE]
 
-        eye_openness = max(0.05, min(1.3, self._state["eye_openness"]))
-        eye_curve = self._state["eye_curve"]
-        brow_raise = self._state["brow_raise"]
-        brow_tilt = self._state["brow_tilt"]
-        iris_size = self._state["iris_size"]
-
-        blink_factor = 1.0
-        if self._blinking:
-            blink_factor -= math.sin(min(1.0, self._blink_phase) * math.pi)
-            blink_factor = max(0.0, blink_factor)
-        effective_openness = max(0.02, eye_openness * blink_factor)
+        effective_openness = self._effective_eye_openness()
 
         sparkle = 0.4 + self._sparkle * 0.6
 
-        for eye_center, direction in ((left_eye_center, -1), (right_eye_center, 1)):
-            self._draw_eye(
-                painter,
-                eye_center,
-                eye_width,
-                eye_height,
-                effective_openness,
-                eye_curve * direction,
-                iris_size,
-                yaw_offset,
-                pitch_offset,
-                accent_color,
-                sparkle,
-            )
+        if self._repaint.needs_paint("eyes", region):
+            for eye_center, direction in ((left_eye_center, -1), (right_eye_center, 1)):
+                self._draw_eye(
+                    painter,
+                    eye_center,
+                    eye_width,
+                    eye_height,
+                    effective_openness,
+                    eye_curve * direction,
+                    iris_size,
+                    yaw_offset,
+                    pitch_offset,
+                    accent_color,
+                    sparkle,
+                )
 
-        self._draw_brows(painter, left_eye_center, right_eye_center, eye_width, brow_raise, brow_tilt, accent_color)
-        self._draw_mouth(painter, center, face_rect, accent_color)
-        self._draw_emotion_icon(painter, face_rect, accent_color)
+        if self._repaint.needs_paint("brows", region):
+            self._draw_brows(painter, left_eye_center, right_eye_center, eye_width, brow_raise, brow_tilt, accent_color)
+        if self._repaint.needs_paint("mouth", region):
+            self._draw_mouth(painter, center, face_rect, accent_color)
+        if self._repaint.needs_paint("icon", region):
+            self._draw_emotion_icon(painter, face_rect, accent_color)
 
         painter.restore()
 
+    def _face_layout(self) -> Tuple[QRectF, QPointF]:
+        rect = self.rect()
+        face_margin = min(rect.width(), rect.height()) * 0.035
+        face_rect = QRectF(
+            rect.left() + face_margin,
+            rect.top() + face_margin,
+            rect.width() - face_margin * 2,
+            rect.height() - face_margin * 2,
+        )
+
+        center = face_rect.center()
+        head_size = min(face_rect.width(), face_rect.height()) * 1.2
+        face_rect = QRectF(
+            center.x() - head_size * 0.5,
+            center.y() - head_size * 0.5,
+            head_size,
+            head_size,
+        )
+        return face_rect, face_rect.center()
+
+    def _icon_visible(self) -> bool:
+        return self._current_emotion != "neutral" and self._emotion_hold_time >= 2.0
+
+    # ------------------------------------------------------------------
+    # Static layers (rendered once per size, see StaticLayerCache)
+    # ------------------------------------------------------------------
+    def _render_background(self, painter: QPainter, rect: QRectF) -> None:
+        bg_gradient = QLinearGradient(0, 0, 0, rect.height())
+        bg_gradient.setColorAt(0.0, QColor(10, 12, 28))
+        bg_gradient.setColorAt(1.0, QColor(2, 4, 12))
+        painter.fillRect(rect, bg_gradient)
+
+    def _head_style(self, face_rect: QRectF) -> Tuple[QBrush, QPen]:
+        head_gradient = QLinearGradient(face_rect.topLeft(), face_rect.bottomLeft())
+        head_gradient.setColorAt(0.0, QColor(40, 48, 82))
+        head_gradient.setColorAt(0.4, QColor(26, 32, 58))
+        head_gradient.setColorAt(1.0, QColor(10, 14, 28))
+        return QBrush(head_gradient), QPen(QColor(110, 140, 220, 140), face_rect.width() * 0.012)
+
     # ------------------------------------------------------------------
     # Feature drawing helpers
     # ------------------------------------------------------------------
@@ -249,7 +314,7 @@ class RoboticFaceWidget(QWidget):
         accent: QColor,
         sparkle: float,
     ) -> None:
-        vertical_scale = openness
+        vertical_scale = quantize(openness, _SHAPE_STEP)
         scaled_height = height * vertical_scale
         eye_rect = QRectF(
             center.x() - width * 0.5,
@@ -258,22 +323,27 @@ class RoboticFaceWidget(QWidget):
             scaled_height,
         )
 
+        outer_path = self._paths.get(
+            ("eye", width, scaled_height),
+            lambda: _rounded_rect_path(width, scaled_height, width * 0.45, scaled_height * 0.45),
+        )
+
         painter.save()
         painter.translate(eye_rect.center())
         painter.rotate(curve * 12.0)
         painter.translate(-eye_rect.center())
 
-        outer_path = QPainterPath()
-        outer_path.addRoundedRect(eye_rect, width * 0.45, scaled_height * 0.45)
-
-        eye_gradient = QLinearGradient(eye_rect.topLeft(), eye_rect.bottomLeft())
+        # The outline is drawn around the eye center, so its gradient is too.
+        eye_gradient = QLinearGradient(0.0, -scaled_height * 0.5, 0.0, scaled_height * 0.5)
         eye_gradient.setColorAt(0.0, QColor(235, 240, 255, 235))
         eye_gradient.setColorAt(0.4, QColor(195, 205, 255, 230))
         eye_gradient.setColorAt(1.0, QColor(120, 140, 220, 215))
 
         painter.setBrush(eye_gradient)
         painter.setPen(QPen(QColor(70, 90, 160), max(2.0, width * 0.035)))
+        painter.translate(eye_rect.center())
         painter.drawPath(outer_path)
+        painter.translate(-eye_rect.center())
 
         iris_radius = min(width, scaled_height) * 0.32 * iris_scale
         iris_offset_x = yaw_offset * width * 0.45
@@ -334,6 +404,10 @@ class RoboticFaceWidget(QWidget):
         brow_width = eye_width * 1.1
         brow_height = eye_width * 0.25
         offset_y = -eye_width * (0.55 + raise_amount * 0.4)
+        path = self._paths.get(
+            ("brow", brow_width, brow_height),
+            lambda: _rounded_rect_path(brow_width, brow_height, brow_height * 0.8, brow_height * 0.8),
+        )
 
         for center, direction in ((left_center, -1), (right_center, 1)):
             brow_rect = QRectF(
@@ -347,14 +421,12 @@ class RoboticFaceWidget(QWidget):
             painter.save()
             painter.translate(brow_rect.center())
             painter.rotate(rotation)
-            painter.translate(-brow_rect.center())
 
-            gradient = QLinearGradient(brow_rect.topLeft(), brow_rect.bottomRight())
+            # Gradient endpoints relative to the brow center, where the path is built.
+            gradient = QLinearGradient(-brow_width * 0.5, -brow_height * 0.5, brow_width * 0.5, brow_height * 0.5)
             gradient.setColorAt(0.0, QColor(10, 12, 20))
             gradient.setColorAt(1.0, QColor(accent.red(), accent.green(), accent.blue()))
 
-            path = QPainterPath()
-            path.addRoundedRect(brow_rect, brow_height * 0.8, brow_height * 0.8)
             painter.setBrush(gradient)
             painter.setPen(Qt.PenStyle.NoPen)
             painter.drawPath(path)
@@ -368,9 +440,9 @@ class RoboticFaceWidget(QWidget):
         )
 
     def _draw_emotion_icon(self, painter: QPainter, face_rect: QRectF, accent: QColor) -> None:
-        emotion = self._current_emotion
-        if emotion == "neutral" or self._emotion_hold_time < 2.0:
+        if not self._icon_visible():
             return
+        emotion = self._current_emotion
 
         painter.save()
 
@@ -472,15 +544,8 @@ class RoboticFaceWidget(QWidget):
             )
         elif emotion == "disgusted":
             painter.setPen(QPen(QColor(140, 220, 110, 220), stroke * 1.05, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap))
-            wave_height = base_size * 0.35
-            x_start = top_right.x() - base_size * 0.4
-            for i in range(3):
-                path = QPainterPath(QPointF(x_start + i * base_size * 0.25, top_right.y() + wave_height * 0.6))
-                path.cubicTo(
-                    QPointF(x_start + i * base_size * 0.25 + base_size * 0.08, top_right.y() + wave_height * 0.1),
-                    QPointF(x_start + i * base_size * 0.25 + base_size * 0.18, top_right.y() + wave_height * 1.1),
-                    QPointF(x_start + i * base_size * 0.25 + base_size * 0.32, top_right.y() + wave_height * 0.6),
-                )
+            painter.translate(top_right)
+            for path in self._paths.get(("waves", base_size), lambda: _stink_wave_paths(base_size)):
                 painter.drawPath(path)
         elif emotion == "smirk":
             sparkle_color = QColor(accent.red(), accent.green(), accent.blue(), 215)
@@ -492,24 +557,16 @@ class RoboticFaceWidget(QWidget):
                 160 * 16,
             )
         elif emotion == "proud":
-            crown_width = base_size * 1.6
             crown_height = base_size * 0.9
             crown_top = QPointF(top_center.x(), top_center.y() + base_size * 0.05)
-            path = QPainterPath(QPointF(crown_top.x() - crown_width * 0.5, crown_top.y() + crown_height * 0.55))
-            path.lineTo(QPointF(crown_top.x() - crown_width * 0.25, crown_top.y()))
-            path.lineTo(QPointF(crown_top.x(), crown_top.y() + crown_height * 0.55))
-            path.lineTo(QPointF(crown_top.x() + crown_width * 0.25, crown_top.y()))
-            path.lineTo(QPointF(crown_top.x() + crown_width * 0.5, crown_top.y() + crown_height * 0.55))
-            path.lineTo(QPointF(crown_top.x() + crown_width * 0.5, crown_top.y() + crown_height))
-            path.lineTo(QPointF(crown_top.x() - crown_width * 0.5, crown_top.y() + crown_height))
-            path.closeSubpath()
+            painter.translate(crown_top)
             painter.setBrush(QColor(255, 205, 120, 230))
             painter.setPen(QPen(QColor(140, 90, 50, 220), stroke * 1.05))
-            painter.drawPath(path)
+            painter.drawPath(self._paths.get(("crown", base_size), lambda: _crown_path(base_size * 1.6, crown_height)))
             jewel_radius = base_size * 0.12
             painter.setBrush(accent)
             painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawEllipse(QPointF(crown_top.x(), crown_top.y() + crown_height * 0.62), jewel_radius, jewel_radius)
+            painter.drawEllipse(QPointF(0.0, crown_height * 0.62), jewel_radius, jewel_radius)
         else:
             painter.restore()
             return
@@ -520,50 +577,35 @@ class RoboticFaceWidget(QWidget):
         painter.save()
         painter.translate(center)
         painter.rotate(rotation)
-
-        path = QPainterPath(QPointF(0, -radius))
-        for i in range(1, 10):
-            angle = -math.pi / 2 + i * math.pi / 5
-            r = radius if i % 2 == 0 else radius * 0.45
-            path.lineTo(QPointF(math.cos(angle) * r, math.sin(angle) * r))
-        path.closeSubpath()
-
+        painter.scale(radius, radius)
         painter.setBrush(color)
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawPath(path)
+        painter.drawPath(self._paths.get(("star",), _unit_star_path))
         painter.restore()
 
     def _draw_heart(self, painter: QPainter, center: QPointF, size: float, color: QColor) -> None:
         painter.save()
-        path = QPainterPath()
-        top = QPointF(center.x(), center.y() - size * 0.1)
-        left = QPointF(center.x() - size * 0.5, center.y() - size * 0.35)
-        right = QPointF(center.x() + size * 0.5, center.y() - size * 0.35)
-        bottom = QPointF(center.x(), center.y() + size * 0.55)
-        path.moveTo(top)
-        path.cubicTo(QPointF(center.x() - size * 0.45, center.y() - size * 0.55), QPointF(center.x() - size * 0.7, center.y() + size * 0.05), bottom)
-        path.cubicTo(QPointF(center.x() + size * 0.7, center.y() + size * 0.05), QPointF(center.x() + size * 0.45, center.y() - size * 0.55), top)
-        path.closeSubpath()
+        painter.translate(center)
+        painter.scale(size, size)
         painter.setBrush(color)
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawPath(path)
+        painter.drawPath(self._paths.get(("heart",), _unit_heart_path))
         painter.restore()
 
     def _draw_teardrop(self, painter: QPainter, center: QPointF, size: float, color: QColor) -> None:
         painter.save()
-        path = QPainterPath(QPointF(center.x(), center.y() - size * 0.55))
-        path.quadTo(QPointF(center.x() + size * 0.45, center.y() - size * 0.25), QPointF(center.x() + size * 0.15, center.y() + size * 0.6))
-        path.quadTo(QPointF(center.x() - size * 0.55, center.y() + size * 0.25), QPointF(center.x(), center.y() - size * 0.55))
+        painter.translate(center)
+        painter.scale(size, size)
         painter.setBrush(color)
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawPath(path)
+        painter.drawPath(self._paths.get(("teardrop",), _unit_teardrop_path))
         painter.restore()
 
     def _draw_mouth(self, painter: QPainter, center: QPointF, face_rect: QRectF, accent: QColor) -> None:
-        width_factor = 0.42 * self._state["mouth_width"]
-        height_factor = 0.08 * self._state["mouth_height"]
-        openness_factor = 0.06 * self._state["mouth_open"]
-        smile_factor = self._state["mouth_curve"]
+        width_factor = 0.42 * quantize(self._state[MOUTH_WIDTH], _SHAPE_STEP)
+        height_factor = 0.08 * quantize(self._state[MOUTH_HEIGHT], _SHAPE_STEP)
+        openness_factor = 0.06 * quantize(self._state[MOUTH_OPEN], _SHAPE_STEP)
+        smile_factor = quantize(self._state[MOUTH_CURVE], _SHAPE_STEP)
 
         yaw_offset = self._orientation["yaw"] / 45.0
         mouth_center_offset = yaw_offset * face_rect.width() * 0.05
@@ -607,38 +649,17 @@ class RoboticFaceWidget(QWidget):
         min_center_y = center.y() + face_rect.height() * 0.05
         mouth_center.setY(max(min_center_y, min(max_center_y, mouth_center.y())))
 
-        half_width = mouth_width * 0.5
-        control_offset = mouth_height * 1.45
-        open_amount = face_rect.height() * openness_factor
-
-        corner_lift = control_offset * 0.35 * smile_factor
-        left_corner = QPointF(mouth_center.x() - half_width, mouth_center.y() - corner_lift)
-        right_corner = QPointF(mouth_center.x() + half_width, mouth_center.y() - corner_lift)
-
-        top_control = QPointF(mouth_center.x(), mouth_center.y() - control_offset * smile_factor)
-
-        lower_corner_bias = control_offset * 0.18 * smile_factor
-        lower_left = QPointF(left_corner.x(), mouth_center.y() + open_amount + lower_corner_bias)
-        lower_right = QPointF(right_corner.x(), mouth_center.y() + open_amount + lower_corner_bias)
-
-        bottom_control = QPointF(
-            mouth_center.x(),
-            mouth_center.y() + open_amount + control_offset * (0.28 + max(0.0, -smile_factor) * 0.45),
+        side_threshold = face_rect.height() * 0.003
+        is_open = face_rect.height() * openness_factor > side_threshold
+        top_path, fill_path, lower_path, side_paths = self._paths.get(
+            ("mouth", face_rect.width(), face_rect.height(), mouth_width, mouth_height, openness_factor, smile_factor),
+            lambda: _open_mouth_paths(face_rect, mouth_width, mouth_height, openness_factor, smile_factor, is_open),
         )
 
-        top_path = QPainterPath(left_corner)
-        top_path.quadTo(top_control, right_corner)
-
         painter.save()
+        painter.translate(mouth_center)
 
-        side_threshold = face_rect.height() * 0.003
-        if open_amount > side_threshold:
-            fill_path = QPainterPath(left_corner)
-            fill_path.quadTo(top_control, right_corner)
-            fill_path.lineTo(lower_right)
-            fill_path.quadTo(bottom_control, lower_left)
-            fill_path.closeSubpath()
-
+        if is_open:
             fill_color = QColor(
                 int(accent.red() * 0.6 + 50),
                 int(accent.green() * 0.55 + 45),
@@ -653,35 +674,15 @@ class RoboticFaceWidget(QWidget):
         painter.setPen(QPen(pen_color, stroke_width, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap))
         painter.drawPath(top_path)
 
-        if open_amount > side_threshold:
-            lower_path = QPainterPath(lower_left)
-            lower_path.quadTo(bottom_control, lower_right)
+        if is_open:
             subtle_pen = QPen(pen_color.lighter(120), stroke_width * 0.85, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap)
             painter.setPen(subtle_pen)
             painter.drawPath(lower_path)
 
             side_pen = QPen(pen_color, stroke_width, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap)
             painter.setPen(side_pen)
-
-            left_side = QPainterPath(left_corner)
-            left_side.quadTo(
-                QPointF(
-                    left_corner.x() - face_rect.width() * 0.01,
-                    (left_corner.y() + lower_left.y()) * 0.5 + face_rect.height() * 0.01,
-                ),
-                lower_left,
-            )
-            painter.drawPath(left_side)
-
-            right_side = QPainterPath(right_corner)
-            right_side.quadTo(
-                QPointF(
-                    right_corner.x() + face_rect.width() * 0.01,
-                    (right_corner.y() + lower_right.y()) * 0.5 + face_rect.height() * 0.01,
-                ),
-                lower_right,
-            )
-            painter.drawPath(right_side)
+            for side_path in side_paths:
+                painter.drawPath(side_path)
 
         painter.restore()
 
@@ -696,7 +697,7 @@ class RoboticFaceWidget(QWidget):
         painter.save()
 
         adjusted_center = QPointF(mouth_center)
-        rect_width = face_rect.width() * 0.46 * self._state["mouth_width"]
+        rect_width = face_rect.width() * 0.46 * self._state[MOUTH_WIDTH]
         rect_height = max(12.0, min(18.0, face_rect.height() * 0.03))
 
         horizontal_margin = face_rect.width() * 0.08
@@ -741,7 +742,7 @@ class RoboticFaceWidget(QWidget):
         painter.save()
 
         adjusted_center = QPointF(mouth_center)
-        mouth_width = face_rect.width() * 0.46 * self._state["mouth_width"]
+        mouth_width = face_rect.width() * 0.46 * quantize(self._state[MOUTH_WIDTH], _SHAPE_STEP)
         smile_height = face_rect.height() * 0.11
         thickness = max(10.0, face_rect.height() * 0.035)
 
@@ -756,19 +757,10 @@ class RoboticFaceWidget(QWidget):
         min_center_y = face_center_y + face_rect.height() * 0.04
         adjusted_center.setY(max(min_center_y, min(max_center_y, adjusted_center.y())))
 
-        outer_left = QPointF(adjusted_center.x() - mouth_width * 0.5, adjusted_center.y() - thickness * 0.35)
-        outer_right = QPointF(adjusted_center.x() + mouth_width * 0.5, adjusted_center.y() - thickness * 0.35)
-        outer_control = QPointF(adjusted_center.x(), adjusted_center.y() + smile_height)
-
-        inner_right = QPointF(adjusted_center.x() + mouth_width * 0.38, adjusted_center.y() + thickness * 0.65)
-        inner_left = QPointF(adjusted_center.x() - mouth_width * 0.38, adjusted_center.y() + thickness * 0.65)
-        inner_control = QPointF(adjusted_center.x(), adjusted_center.y() + smile_height * 1.08)
-
-        path = QPainterPath(outer_left)
-        path.quadTo(outer_control, outer_right)
-        path.lineTo(inner_right)
-        path.quadTo(inner_control, inner_left)
-        path.closeSubpath()
+        path = self._paths.get(
+            ("smile", mouth_width, smile_height, thickness),
+            lambda: _smile_path(mouth_width, smile_height, thickness),
+        )
 
         fill_color = QColor(
             int(accent.red() * 0.6 + 65),
@@ -779,6 +771,7 @@ class RoboticFaceWidget(QWidget):
 
         painter.setBrush(fill_color)
         painter.setPen(QPen(pen_color, stroke_width, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap))
+        painter.translate(adjusted_center)
         painter.drawPath(path)
         painter.restore()
 
@@ -794,9 +787,9 @@ class RoboticFaceWidget(QWidget):
         painter.save()
 
         adjusted_center = QPointF(mouth_center)
-        base_size = face_rect.width() * 0.22 * self._state["mouth_width"]
+        base_size = face_rect.width() * 0.22 * quantize(self._state[MOUTH_WIDTH], _SHAPE_STEP)
         width = max(38.0, base_size)
-        height = max(32.0, width * 1.05 * self._state["mouth_height"])
+        height = max(32.0, width * 1.05 * quantize(self._state[MOUTH_HEIGHT], _SHAPE_STEP))
 
         horizontal_margin = face_rect.width() * 0.08
         vertical_margin = face_rect.height() * 0.1
@@ -809,13 +802,6 @@ class RoboticFaceWidget(QWidget):
         min_center_y = face_center_y + face_rect.height() * 0.02
         adjusted_center.setY(max(min_center_y, min(max_center_y, adjusted_center.y())))
 
-        rect = QRectF(
-            adjusted_center.x() - width * 0.5,
-            adjusted_center.y() - height * 0.5,
-            width,
-            height,
-        )
-
         fill_color = QColor(
             int(accent.red() * 0.6 + 40),
             int(accent.green() * 0.6 + 40),
@@ -826,15 +812,16 @@ class RoboticFaceWidget(QWidget):
         painter.setBrush(fill_color)
         painter.setPen(QPen(pen_color, stroke_width, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap))
 
-        path = QPainterPath()
-        path.addEllipse(rect)
+        path = self._paths.get(("oval", width, height), lambda: _ellipse_path(width, height))
+        painter.translate(adjusted_center)
         painter.drawPath(path)
         painter.restore()
 
     # ------------------------------------------------------------------
     # Utilities
     # ------------------------------------------------------------------
-    def _build_presets(self) -> Dict[str, EmotionPreset]:
+    @staticmethod
+    def _build_presets() -> Dict[str, EmotionPreset]:
         return {
             "neutral": EmotionPreset(
                 name="neutral",
@@ -994,30 +981,137 @@ class RoboticFaceWidget(QWidget):
             ),
         }
 
-    def _preset_to_state(self, preset: EmotionPreset) -> Dict[str, object]:
-        return {
-            "eye_openness": preset.eye_openness,
-            "eye_curve": preset.eye_curve,
-            "brow_raise": preset.brow_raise,
-            "brow_tilt": preset.brow_tilt,
-            "mouth_curve": preset.mouth_curve,
-            "mouth_open": preset.mouth_open,
-            "mouth_width": preset.mouth_width,
-            "mouth_height": preset.mouth_height,
-            "iris_size": preset.iris_size,
-            "accent_color": QColor(*preset.accent_color),
-        }
 
-    def _enforce_low_battery_face(self) -> None:
-        """Force fearful face when battery is critically low."""
-        if self._battery_voltage is None:
-            return
-        low_battery = self._battery_voltage < 10.0
-        if low_battery and not self._low_battery_forced:
-            self._low_battery_forced = True
-            if self._current_emotion != "fearful":
-                self.set_emotion("fearful")
-        elif not low_battery and self._low_battery_forced:
-            self._low_battery_forced = False
-            if self._current_emotion == "fearful":
-                self.set_emotion(self._default_emotion)
+# ----------------------------------------------------------------------
+# Path builders for PathCache: local coordinates, see the drawing helpers.
+# ----------------------------------------------------------------------
+def _rounded_rect_path(width: float, height: float, x_radius: float, y_radius: float) -> QPainterPath:
+    path = QPainterPath()
+    path.addRoundedRect(QRectF(-width * 0.5, -height * 0.5, width, height), x_radius, y_radius)
+    return path
+
+
+def _ellipse_path(width: float, height: float) -> QPainterPath:
+    path = QPainterPath()
+    path.addEllipse(QRectF(-width * 0.5, -height * 0.5, width, height))
+    return path
+
+
+def _unit_star_path() -> QPainterPath:
+    path = QPainterPath(QPointF(0.0, -1.0))
+    for i in range(1, 10):
+        angle = -math.pi / 2 + i * math.pi / 5
+        r = 1.0 if i % 2 == 0 else 0.45
+        path.lineTo(QPointF(math.cos(angle) * r, math.sin(angle) * r))
+    path.closeSubpath()
+    return path
+
+
+def _unit_heart_path() -> QPainterPath:
+    top = QPointF(0.0, -0.1)
+    bottom = QPointF(0.0, 0.55)
+    path = QPainterPath(top)
+    path.cubicTo(QPointF(-0.45, -0.55), QPointF(-0.7, 0.05), bottom)
+    path.cubicTo(QPointF(0.7, 0.05), QPointF(0.45, -0.55), top)
+    path.closeSubpath()
+    return path
+
+
+def _unit_teardrop_path() -> QPainterPath:
+    path = QPainterPath(QPointF(0.0, -0.55))
+    path.quadTo(QPointF(0.45, -0.25), QPointF(0.15, 0.6))
+    path.quadTo(QPointF(-0.55, 0.25), QPointF(0.0, -0.55))
+    return path
+
+
+def _stink_wave_paths(base_size: float) -> Tuple[QPainterPath, ...]:
+    wave_height = base_size * 0.35
+    paths = []
+    for i in range(3):
+        x = -base_size * 0.4 + i * base_size * 0.25
+        path = QPainterPath(QPointF(x, wave_height * 0.6))
+        path.cubicTo(
+            QPointF(x + base_size * 0.08, wave_height * 0.1),
+            QPointF(x + base_size * 0.18, wave_height * 1.1),
+            QPointF(x + base_size * 0.32, wave_height * 0.6),
+        )
+        paths.append(path)
+    return tuple(paths)
+
+
+def _crown_path(width: float, height: float) -> QPainterPath:
+    path = QPainterPath(QPointF(-width * 0.5, height * 0.55))
+    path.lineTo(QPointF(-width * 0.25, 0.0))
+    path.lineTo(QPointF(0.0, height * 0.55))
+    path.lineTo(QPointF(width * 0.25, 0.0))
+    path.lineTo(QPointF(width * 0.5, height * 0.55))
+    path.lineTo(QPointF(width * 0.5, height))
+    path.lineTo(QPointF(-width * 0.5, height))
+    path.closeSubpath()
+    return path
+
+
+def _smile_path(width: float, smile_height: float, thickness: float) -> QPainterPath:
+    path = QPainterPath(QPointF(-width * 0.5, -thickness * 0.35))
+    path.quadTo(QPointF(0.0, smile_height), QPointF(width * 0.5, -thickness * 0.35))
+    path.lineTo(QPointF(width * 0.38, thickness * 0.65))
+    path.quadTo(QPointF(0.0, smile_height * 1.08), QPointF(-width * 0.38, thickness * 0.65))
+    path.closeSubpath()
+    return path
+
+
+def _open_mouth_paths(
+    face_rect: QRectF,
+    mouth_width: float,
+    mouth_height: float,
+    openness_factor: float,
+    smile_factor: float,
+    is_open: bool,
+) -> Tuple[QPainterPath, QPainterPath | None, QPainterPath | None, Tuple[QPainterPath, ...]]:
+    """Upper lip, fill, lower lip and corner paths around the mouth center."""
+
+    half_width = mouth_width * 0.5
+    control_offset = mouth_height * 1.45
+    open_amount = face_rect.height() * openness_factor
+
+    corner_lift = control_offset * 0.35 * smile_factor
+    left_corner = QPointF(-half_width, -corner_lift)
+    right_corner = QPointF(half_width, -corner_lift)
+    top_control = QPointF(0.0, -control_offset * smile_factor)
+
+    top_path = QPainterPath(left_corner)
+    top_path.quadTo(top_control, right_corner)
+    if not is_open:
+        return top_path, None, None, ()
+
+    lower_corner_bias = control_offset * 0.18 * smile_factor
+    lower_left = QPointF(left_corner.x(), open_amount + lower_corner_bias)
+    lower_right = QPointF(right_corner.x(), open_amount + lower_corner_bias)
+    bottom_control = QPointF(0.0, open_amount + control_offset * (0.28 + max(0.0, -smile_factor) * 0.45))
+
+    fill_path = QPainterPath(left_corner)
+    fill_path.quadTo(top_control, right_corner)
+    fill_path.lineTo(lower_right)
+    fill_path.quadTo(bottom_control, lower_left)
+    fill_path.closeSubpath()
+
+    lower_path = QPainterPath(lower_left)
+    lower_path.quadTo(bottom_control, lower_right)
+
+    left_side = QPainterPath(left_corner)
+    left_side.quadTo(
+        QPointF(
+            left_corner.x() - face_rect.width() * 0.01,
+            (left_corner.y() + lower_left.y()) * 0.5 + face_rect.height() * 0.01,
+        ),
+        lower_left,
+    )
+    right_side = QPainterPath(right_corner)
+    right_side.quadTo(
+        QPointF(
+            right_corner.x() + face_rect.width() * 0.01,
+            (right_corner.y() + lower_right.y()) * 0.5 + face_rect.height() * 0.01,
+        ),
+        lower_right,
+    )
+    return top_path, fill_path, lower_path, (left_side, right_side)
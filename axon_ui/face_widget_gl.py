@@ -0,0 +1,445 @@
+"""GPU-rendered variant of the robotic face."""
+
+from __future__ import annotations
+
+import logging
+import math
+import struct
+from typing import Tuple
+
+from PySide6.QtCore import QObject, QPointF, QRectF
+from PySide6.QtGui import QColor, QOpenGLContext, QOpenGLFunctions, QVector2D, QVector3D, QVector4D
+from PySide6.QtOpenGL import QOpenGLBuffer, QOpenGLShader, QOpenGLShaderProgram
+from PySide6.QtOpenGLWidgets import QOpenGLWidget
+from PySide6.QtWidgets import QSizePolicy, QWidget
+
+from axon_ui.emotion_preset import (
+    BROW_RAISE,
+    BROW_TILT,
+    EYE_CURVE,
+    IRIS_SIZE,
+    MOUTH_CURVE,
+    MOUTH_HEIGHT,
+    MOUTH_OPEN,
+    MOUTH_WIDTH,
+)
+from axon_ui.face_animation import FaceAnimationMixin
+from axon_ui.face_widget import RoboticFaceWidget
+from axon_ui.render_cache import quantize
+
+LOGGER = logging.getLogger(__name__)
+
+_GL_COLOR_BUFFER_BIT = 0x4000
+_GL_TRIANGLE_STRIP = 0x0005
+_GL_FLOAT = 0x1406
+
+# The software face tests mouth openness after snapping it to its PathCache
+# step; the shader does the same so both agree on near-closed presets.
+_SHAPE_STEP = 1.0 / 1024.0
+
+# Two triangles covering the viewport; the fragment shader does all the work.
+_QUAD = struct.pack("8f", -1.0, -1.0, 1.0, -1.0, -1.0, 1.0, 1.0, 1.0)
+
+_GLES_HEADER = """#version 100
+#ifdef GL_FRAGMENT_PRECISION_HIGH
+precision highp float;
+#else
+precision mediump float;
+#endif
+"""
+_DESKTOP_HEADER = "#version 120\n"
+
+_VERTEX_SHADER = """
+attribute vec2 a_position;
+
+void main() {
+    gl_Position = vec4(a_position, 0.0, 1.0);
+}
+"""
+
+# Every feature is a signed distance field evaluated in widget coordinates
+# (logical pixels, y down), mirroring the QPainter geometry of face_widget.py.
+_FRAGMENT_SHADER = """
+uniform vec2 u_resolution;
+uniform float u_scale;
+uniform vec2 u_face_center;
+uniform float u_roll;
+uniform vec3 u_accent;
+
+uniform vec2 u_eye_left;
+uniform vec2 u_eye_right;
+uniform vec2 u_eye_size;
+uniform float u_eye_tilt;
+uniform float u_eye_stroke;
+uniform vec2 u_iris_offset;
+uniform float u_iris_radius;
+uniform float u_sparkle;
+
+uniform vec2 u_brow_left;
+uniform vec2 u_brow_right;
+uniform vec2 u_brow_size;
+uniform float u_brow_tilt;
+
+uniform vec2 u_mouth_center;
+uniform vec2 u_mouth_size;
+uniform vec4 u_mouth_curves;
+uniform float u_mouth_kind;
+uniform float u_mouth_filled;
+uniform vec4 u_mouth_fill;
+uniform vec3 u_mouth_pen;
+uniform float u_mouth_stroke;
+
+vec2 rotate(vec2 v, float angle) {
+    float c = cos(angle);
+    float s = sin(angle);
+    return vec2(c * v.x - s * v.y, s * v.x + c * v.y);
+}
+
+float coverage(float distance) {
+    return clamp(0.5 - distance * u_scale, 0.0, 1.0);
+}
+
+void blend(inout vec3 color, vec3 layer, float alpha) {
+    color = mix(color, layer, clamp(alpha, 0.0, 1.0));
+}
+
+float rounded_box(vec2 p, vec2 half_size, float radius) {
+    vec2 q = abs(p) - half_size + vec2(radius);
+    return length(max(q, 0.0)) + min(max(q.x, q.y), 0.0) - radius;
+}
+
+float ellipse(vec2 p, vec2 radii) {
+    return (length(p / radii) - 1.0) * min(radii.x, radii.y);
+}
+
+float segment(vec2 p, vec2 a, vec2 b) {
+    vec2 ab = b - a;
+    float t = clamp(dot(p - a, ab) / max(dot(ab, ab), 1e-4), 0.0, 1.0);
+    return length(p - a - ab * t);
+}
+
+// Quadratic Bezier from (-w, end) over (0, control) to (w, end), u = x / w.
+float curve_y(float u, vec2 curve) {
+    return curve.x * (1.0 + u * u) * 0.5 + curve.y * (1.0 - u * u) * 0.5;
+}
+
+float curve_distance(vec2 p, float half_width, vec2 curve) {
+    float u = clamp(p.x / half_width, -1.0, 1.0);
+    float y = curve_y(u, curve);
+    if (abs(p.x) > half_width) {
+        return length(p - vec2(u * half_width, y));
+    }
+    float slope = (curve.x - curve.y) * u / half_width;
+    return abs(p.y - y) / sqrt(1.0 + slope * slope);
+}
+
+void draw_eye(inout vec3 color, vec2 p, vec2 center, float tilt) {
+    vec2 half_size = u_eye_size * 0.5;
+    vec2 local = rotate(p - center, -tilt);
+    float d = rounded_box(local, half_size, min(half_size.x, half_size.y) * 0.9);
+
+    blend(color, u_accent, exp(-max(d, 0.0) / (u_eye_size.x * 0.12)) * step(0.0, d) * 0.35);
+
+    float t = clamp(local.y / u_eye_size.y + 0.5, 0.0, 1.0);
+    vec3 top = vec3(235.0, 240.0, 255.0) / 255.0;
+    vec3 middle = vec3(195.0, 205.0, 255.0) / 255.0;
+    vec3 bottom = vec3(120.0, 140.0, 220.0) / 255.0;
+    vec3 sclera = t < 0.4 ? mix(top, middle, t / 0.4) : mix(middle, bottom, (t - 0.4) / 0.6);
+    blend(color, sclera, coverage(d) * 0.9);
+    blend(color, vec3(70.0, 90.0, 160.0) / 255.0, coverage(abs(d) - u_eye_stroke * 0.5));
+
+    vec2 iris = local - u_iris_offset;
+    float s = clamp(iris.y / (2.0 * u_iris_radius) + 0.5, 0.0, 1.0);
+    vec3 iris_mid = vec3(40.0, 60.0, 100.0) / 255.0;
+    vec3 iris_color = s < 0.6 ? mix(u_accent, iris_mid, s / 0.6) : mix(iris_mid, vec3(10.0, 20.0, 40.0) / 255.0, (s - 0.6) / 0.4);
+    blend(color, iris_color, coverage(length(iris) - u_iris_radius) * 0.93);
+
+    float pupil = u_iris_radius * 0.48;
+    blend(color, vec3(8.0, 10.0, 18.0) / 255.0, coverage(length(iris) - pupil));
+    float highlight = u_iris_radius * (0.24 + u_sparkle * 0.12);
+    blend(color, vec3(1.0), coverage(length(iris - vec2(-0.45, -0.55) * pupil) - highlight) * 0.86);
+    blend(color, vec3(1.0), coverage(length(iris - vec2(0.3, 0.4) * pupil) - highlight * 0.4) * 0.35 * u_sparkle);
+
+    vec2 shine = local - vec2(0.0, -0.275 * u_eye_size.y);
+    float ds = rounded_box(shine, vec2(0.4 * u_eye_size.x, 0.175 * u_eye_size.y), 0.15 * u_eye_size.y);
+    blend(color, vec3(1.0), coverage(ds) * mix(80.0, 35.0, clamp(abs(local.x) / half_size.x, 0.0, 1.0)) / 255.0);
+}
+
+void draw_brow(inout vec3 color, vec2 p, vec2 center, float tilt) {
+    vec2 half_size = u_brow_size * 0.5;
+    vec2 local = rotate(p - center, -tilt);
+    float d = rounded_box(local, half_size, min(half_size.x, half_size.y));
+    float t = clamp(dot(local + half_size, u_brow_size) / dot(u_brow_size, u_brow_size), 0.0, 1.0);
+    blend(color, mix(vec3(10.0, 12.0, 20.0) / 255.0, u_accent, t), coverage(d));
+}
+
+void draw_mouth(inout vec3 color, vec2 p) {
+    vec2 m = p - u_mouth_center;
+    float pen = u_mouth_stroke * 0.5;
+    float glow_distance;
+    if (u_mouth_kind < 0.5) {
+        float half_width = u_mouth_size.x;
+        vec2 top = u_mouth_curves.xy;
+        vec2 bottom = u_mouth_curves.zw;
+        float top_distance = curve_distance(m, half_width, top);
+        glow_distance = top_distance;
+        if (u_mouth_filled > 0.5) {
+            float u = clamp(m.x / half_width, -1.0, 1.0);
+            float inside = max(max(curve_y(u, top) - m.y, m.y - curve_y(u, bottom)), abs(m.x) - half_width);
+            blend(color, u_mouth_fill.rgb, coverage(inside) * u_mouth_fill.a);
+            blend(color, min(u_mouth_pen * 1.2, vec3(1.0)), coverage(curve_distance(m, half_width, bottom) - pen * 0.85));
+            float side = min(
+                segment(m, vec2(-half_width, top.x), vec2(-half_width, bottom.x)),
+                segment(m, vec2(half_width, top.x), vec2(half_width, bottom.x))
+            );
+            blend(color, u_mouth_pen, coverage(side - pen));
+            glow_distance = min(glow_distance, max(inside, 0.0));
+        }
+        blend(color, u_mouth_pen, coverage(top_distance - pen));
+    } else {
+        float d = u_mouth_kind < 1.5 ? rounded_box(m, u_mouth_size, 0.0) : ellipse(m, u_mouth_size);
+        blend(color, u_mouth_fill.rgb, coverage(d) * u_mouth_fill.a);
+        blend(color, u_mouth_pen, coverage(abs(d) - (u_mouth_kind < 1.5 ? pen * 0.85 : pen)));
+        glow_distance = max(d, 0.0);
+    }
+    blend(color, u_accent, exp(-glow_distance / (u_mouth_stroke * 6.0)) * step(pen, glow_distance) * 0.18);
+}
+
+void main() {
+    vec2 p = vec2(gl_FragCoord.x, u_resolution.y - gl_FragCoord.y) / u_scale;
+    float t = gl_FragCoord.y / u_resolution.y;
+    vec3 color = mix(vec3(2.0, 4.0, 12.0) / 255.0, vec3(10.0, 12.0, 28.0) / 255.0, t);
+
+    vec2 q = u_face_center + rotate(p - u_face_center, -u_roll);
+    draw_eye(color, q, u_eye_left, -u_eye_tilt);
+    draw_eye(color, q, u_eye_right, u_eye_tilt);
+    draw_brow(color, q, u_brow_left, -u_brow_tilt);
+    draw_brow(color, q, u_brow_right, u_brow_tilt);
+    draw_mouth(color, q);
+
+    gl_FragColor = vec4(color, 1.0);
+}
+"""
+
+
+class GLFaceWidget(FaceAnimationMixin, QOpenGLWidget):
+    """Robotic face drawn by a single fragment shader.
+
+    Exposes the same control API as :class:`RoboticFaceWidget` and shares its
+    emotion presets, blink and breathing behaviour (:class:`FaceAnimationMixin`).  Eyes, brows, mouth and
+    their glow are signed distance fields, so a frame costs one full-screen
+    quad regardless of resolution.  The emotion icons are software-only.
+    Use :func:`axon_ui.face_backend.create_face_widget` to pick a backend.
+    """
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setMinimumSize(480, 320)
+
+        self._init_animation(RoboticFaceWidget._build_presets())
+
+        self._program: QOpenGLShaderProgram | None = None
+        self._quad: QOpenGLBuffer | None = None
+
+    # ------------------------------------------------------------------
+    # OpenGL
+    # ------------------------------------------------------------------
+    def initializeGL(self) -> None:  # type: ignore[override]
+        context = self.context()
+        context.aboutToBeDestroyed.connect(self._release_gl)
+        try:
+            program = build_face_program(context, self)
+        except RuntimeError as exc:
+            LOGGER.error("%s; only the background is drawn", exc)
+            return
+
+        self._program = program
+        self._quad = _quad_buffer()
+
+    def paintGL(self) -> None:  # type: ignore[override]
+        functions = self.context().functions()
+        if self._program is None or self._quad is None:
+            functions.glClearColor(6 / 255.0, 8 / 255.0, 20 / 255.0, 1.0)
+            functions.glClear(_GL_COLOR_BUFFER_BIT)
+            return
+        self._draw(functions, self._program, self._quad)
+
+    def _draw(self, functions: QOpenGLFunctions, program: QOpenGLShaderProgram, quad: QOpenGLBuffer) -> None:
+        program.bind()
+        self._upload_uniforms(program)
+        quad.bind()
+        location = program.attributeLocation("a_position")
+        program.enableAttributeArray(location)
+        program.setAttributeBuffer(location, _GL_FLOAT, 0, 2)
+        functions.glDrawArrays(_GL_TRIANGLE_STRIP, 0, 4)
+        program.disableAttributeArray(location)
+        quad.release()
+        program.release()
+
+    def _release_gl(self) -> None:
+        self.makeCurrent()
+        if self._quad is not None:
+            self._quad.destroy()
+            self._quad = None
+        self._program = None
+        self.doneCurrent()
+
+    # ------------------------------------------------------------------
+    # Uniforms (geometry follows RoboticFaceWidget.paintEvent)
+    # ------------------------------------------------------------------
+    def _upload_uniforms(self, program: QOpenGLShaderProgram) -> None:
+        scale = self.devicePixelRatioF()
+        face_rect, center = self._face_layout()
+        accent = self._accent_color()
+        yaw_offset = self._orientation["yaw"] / 45.0
+        pitch_offset = self._orientation["pitch"] / 45.0
+
+        program.setUniformValue("u_resolution", QVector2D(self.width() * scale, self.height() * scale))
+        program.setUniformValue1f("u_scale", scale)
+        program.setUniformValue("u_face_center", QVector2D(center.x(), center.y()))
+        program.setUniformValue1f("u_roll", math.radians(self._orientation["roll"] * 0.8))
+        program.setUniformValue("u_accent", _vector3(accent))
+
+        eye_width = face_rect.width() * 0.26
+        eye_height = face_rect.height() * 0.24 * self._effective_eye_openness()
+        left_eye, right_eye = self._eye_centers(face_rect, center)
+        breathe = self._breathe_offset * 0.1
+        iris_radius = min(eye_width, eye_height) * 0.32 * self._state[IRIS_SIZE]
+        program.setUniformValue("u_eye_left", QVector2D(left_eye.x(), left_eye.y() + breathe))
+        program.setUniformValue("u_eye_right", QVector2D(right_eye.x(), right_eye.y() + breathe))
+        program.setUniformValue("u_eye_size", QVector2D(eye_width, eye_height))
+        program.setUniformValue1f("u_eye_tilt", math.radians(self._state[EYE_CURVE] * 12.0))
+        program.setUniformValue1f("u_eye_stroke", max(2.0, eye_width * 0.035))
+        program.setUniformValue(
+            "u_iris_offset",
+            QVector2D(yaw_offset * eye_width * 0.45, pitch_offset * eye_height * 0.35 - breathe),
+        )
+        program.setUniformValue1f("u_iris_radius", iris_radius)
+        program.setUniformValue1f("u_sparkle", 0.4 + self._sparkle * 0.6)
+
+        brow_width = eye_width * 1.1
+        brow_height = eye_width * 0.25
+        brow_offset = -eye_width * (0.55 + self._state[BROW_RAISE] * 0.4) + brow_height * 0.5
+        program.setUniformValue("u_brow_left", QVector2D(left_eye.x(), left_eye.y() + brow_offset))
+        program.setUniformValue("u_brow_right", QVector2D(right_eye.x(), right_eye.y() + brow_offset))
+        program.setUniformValue("u_brow_size", QVector2D(brow_width, brow_height))
+        program.setUniformValue1f("u_brow_tilt", math.radians(self._state[BROW_TILT] * 18.0))
+
+        kind, mouth_center, size, curves, filled, fill = self._mouth_shape(face_rect, center)
+        pen = QColor(
+            int(accent.red() * 0.75 + 35),
+            int(accent.green() * 0.75 + 35),
+            min(255, int(accent.blue() * 0.75 + 45)),
+        )
+        program.setUniformValue("u_mouth_center", QVector2D(mouth_center.x(), mouth_center.y()))
+        program.setUniformValue("u_mouth_size", QVector2D(*size))
+        program.setUniformValue("u_mouth_curves", QVector4D(*curves))
+        program.setUniformValue1f("u_mouth_kind", kind)
+        program.setUniformValue1f("u_mouth_filled", 1.0 if filled else 0.0)
+        program.setUniformValue("u_mouth_fill", QVector4D(fill.redF(), fill.greenF(), fill.blueF(), fill.alphaF()))
+        program.setUniformValue("u_mouth_pen", _vector3(pen))
+        program.setUniformValue1f("u_mouth_stroke", max(1.8, face_rect.width() * 0.0045))
+
+    def _face_layout(self) -> Tuple[QRectF, QPointF]:
+        face_margin = min(self.width(), self.height()) * 0.035
+        head_size = min(self.width() - face_margin * 2, self.height() - face_margin * 2) * 1.2
+        center = QPointF(self.width() * 0.5, self.height() * 0.5)
+        face_rect = QRectF(center.x() - head_size * 0.5, center.y() - head_size * 0.5, head_size, head_size)
+        return face_rect, center
+
+    def _mouth_shape(
+        self, face_rect: QRectF, center: QPointF
+    ) -> Tuple[float, QPointF, Tuple[float, float], Tuple[float, float, float, float], bool, QColor]:
+        """Return ``(kind, center, size, curves, filled, fill)`` for the mouth shader.
+
+        ``kind`` 0 is a band between two quadratic curves given as
+        ``(end, control)`` offsets, 1 the neutral bar and 2 the surprised
+        ellipse; ``size`` holds half extents.  Clamping matches the software face.
+        """
+        accent = self._accent_color()
+        smile = self._state[MOUTH_CURVE]
+        yaw_offset = self._orientation["yaw"] / 45.0
+        mouth_center = QPointF(
+            center.x() + yaw_offset * face_rect.width() * 0.05,
+            center.y() + face_rect.height() * 0.26 + self._breathe_offset * 0.12 - face_rect.height() * 0.035 * smile,
+        )
+
+        def clamp_center(width: float, bottom_reserve: float, top_factor: float) -> QPointF:
+            horizontal_margin = face_rect.width() * 0.08
+            x = max(
+                face_rect.left() + horizontal_margin + width * 0.5,
+                min(face_rect.right() - horizontal_margin - width * 0.5, mouth_center.x()),
+            )
+            y = max(
+                center.y() + face_rect.height() * top_factor,
+                min(face_rect.bottom() - face_rect.height() * 0.1 - bottom_reserve, mouth_center.y()),
+            )
+            return QPointF(x, y)
+
+        emotion = self._current_emotion
+        if emotion == "neutral":
+            width = face_rect.width() * 0.46 * self._state[MOUTH_WIDTH]
+            height = max(12.0, min(18.0, face_rect.height() * 0.03))
+            pen = (accent.red() * 0.75 + 35, accent.green() * 0.75 + 35, accent.blue() * 0.75 + 45)
+            fill = QColor(*(min(255, int(channel * 0.8 + 25)) for channel in pen), 150)
+            return 1.0, clamp_center(width, height * 0.5, 0.05), (width * 0.5, height * 0.5), (0.0,) * 4, True, fill
+
+        if emotion == "surprised":
+            width = max(38.0, face_rect.width() * 0.22 * self._state[MOUTH_WIDTH])
+            height = max(32.0, width * 1.05 * self._state[MOUTH_HEIGHT])
+            fill = QColor(int(accent.red() * 0.6 + 40), int(accent.green() * 0.6 + 40), int(accent.blue() * 0.6 + 60), 165)
+            return 2.0, clamp_center(width, height * 0.5, 0.02), (width * 0.5, height * 0.5), (0.0,) * 4, True, fill
+
+        if emotion == "happy":
+            width = face_rect.width() * 0.46 * self._state[MOUTH_WIDTH]
+            smile_height = face_rect.height() * 0.11
+            thickness = max(10.0, face_rect.height() * 0.035)
+            fill = QColor(int(accent.red() * 0.6 + 65), int(accent.green() * 0.6 + 55), int(accent.blue() * 0.6 + 70), 170)
+            curves = (-thickness * 0.35, smile_height, -thickness * 0.35, smile_height * 1.08 + thickness)
+            return 0.0, clamp_center(width, thickness, 0.04), (width * 0.5, 0.0), curves, True, fill
+
+        width = face_rect.width() * 0.42 * self._state[MOUTH_WIDTH]
+        height = face_rect.height() * 0.08 * self._state[MOUTH_HEIGHT]
+        control = height * 1.45
+        open_amount = face_rect.height() * 0.06 * self._state[MOUTH_OPEN]
+        curves = (
+            -control * 0.35 * smile,
+            -control * smile,
+            open_amount + control * 0.18 * smile,
+            open_amount + control * (0.28 + max(0.0, -smile) * 0.45),
+        )
+        fill = QColor(int(accent.red() * 0.6 + 50), int(accent.green() * 0.55 + 45), int(accent.blue() * 0.55 + 55), 140)
+        filled = face_rect.height() * (0.06 * quantize(self._state[MOUTH_OPEN], _SHAPE_STEP)) > face_rect.height() * 0.003
+        return 0.0, clamp_center(width, height, 0.05), (width * 0.5, 0.0), curves, filled, fill
+
+
+def build_face_program(context: QOpenGLContext, parent: QObject | None = None) -> QOpenGLShaderProgram:
+    """Compile and link the face shader for *context*, which must be current.
+
+    Raises :class:`RuntimeError` with the driver's log when either stage fails.
+    """
+
+    header = _GLES_HEADER if context.isOpenGLES() else _DESKTOP_HEADER
+    program = QOpenGLShaderProgram(parent)
+    built = (
+        program.addShaderFromSourceCode(QOpenGLShader.ShaderTypeBit.Vertex, header + _VERTEX_SHADER)
+        and program.addShaderFromSourceCode(QOpenGLShader.ShaderTypeBit.Fragment, header + _FRAGMENT_SHADER)
+        and program.link()
+    )
+    if not built:
+        raise RuntimeError(f"Face shader failed to build: {program.log().strip()}")
+    return program
+
+
+def _quad_buffer() -> QOpenGLBuffer:
+    quad = QOpenGLBuffer(QOpenGLBuffer.Type.VertexBuffer)
+    quad.create()
+    quad.bind()
+    quad.allocate(_QUAD, len(_QUAD))
+    quad.release()
+    return quad
+
+
+def _vector3(color: QColor) -> QVector3D:
+    return QVector3D(color.redF(), color.greenF(), color.blueF())
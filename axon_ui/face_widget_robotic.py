@@ -2,16 +2,35 @@ from __future__ import annotations
 
 import math
 import random
-from typing import Dict, Tuple
+from typing import Dict, Hashable, Tuple
 
-from PySide6.QtCore import QEasingCurve, QPointF, QRectF, QTimer, QVariantAnimation, Qt
-from PySide6.QtGui import QColor, QFont, QLinearGradient, QPainter, QPainterPath, QPen, QRadialGradient
+from PySide6.QtCore import QPointF, QRectF, Qt
+from PySide6.QtGui import QColor, QFont, QLinearGradient, QPainter, QPainterPath, QPen, QRadialGradient, QRegion, QTransform
 from PySide6.QtWidgets import QSizePolicy, QWidget
 
-from axon_ui.emotion_preset import EmotionPreset
-
-
-class RoboticFaceWidget(QWidget):
+from axon_ui.dirty_regions import FeatureRepaintTracker, feature_region, rotation_about
+from axon_ui.emotion_preset import (
+    ACCENT_BLUE,
+    ACCENT_GREEN,
+    ACCENT_RED,
+    BROW_RAISE,
+    BROW_TILT,
+    EYE_CURVE,
+    EYE_OPENNESS,
+    IRIS_SIZE,
+    MOUTH_CURVE,
+    MOUTH_OPEN,
+    MOUTH_WIDTH,
+    EmotionPreset,
+)
+from axon_ui.face_animation import FaceAnimationMixin
+from axon_ui.render_cache import PathCache, StaticLayerCache, quantize
+
+# Animated shape parameters are snapped to this step before they key the PathCache.
+_SHAPE_STEP = 1.0 / 1024.0
+
+
+class RoboticFaceWidget(FaceAnimationMixin, QWidget):
     """Animated robotic face widget with emotion and orientation controls."""
 
     def __init__(self, parent: QWidget | None = None) -> None:
@@ -19,131 +38,202 @@ class RoboticFaceWidget(QWidget):
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.setMinimumSize(480, 320)
 
-        self._presets: Dict[str, EmotionPreset] = self._build_presets()
-        self._default_emotion = "neutral"
-        self._current_emotion = self._default_emotion
-        self._state = self._preset_to_state(self._presets[self._current_emotion])
-        self._start_state = self._state.copy()
-        self._target_state = self._state.copy()
-
-        self._orientation = {
-            "yaw": 0.0,
-            "pitch": 0.0,
-            "roll": 0.0,
-        }
-
-        self._animation = QVariantAnimation(self)
-        self._animation.setEasingCurve(QEasingCurve.OutCubic)
-        self._animation.valueChanged.connect(self._update_state_from_animation)
-        self._animation.finished.connect(self.update)
-
-        self._idle_timer = QTimer(self)
-        self._idle_timer.timeout.connect(self._update_idle)
-        self._idle_timer.start(16)
-
-        self._time = 0.0
-        self._breathe_offset = 0.0
-        self._sparkle = 0.0
-        self._blink_phase = 0.0
-        self._blinking = False
-        self._next_blink_at = random.uniform(2.0, 5.0)
-        self._time_since_blink = 0.0
-        self._emotion_hold_time = 0.0
-        self._battery_voltage: float | None = None
-        self._low_battery_forced = False
+        self._init_animation(self._build_presets())
+        self._static_layers = StaticLayerCache()
+        self._paths = PathCache()
+        self._repaint = FeatureRepaintTracker(self)
 
         self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
 
-    def available_emotions(self) -> Tuple[str, ...]:
-        return tuple(self._presets.keys())
-
-    def set_emotion(self, emotion: str) -> None:
-        """Animate to the requested emotion."""
-        if emotion not in self._presets:
-            raise ValueError(f"Unknown emotion '{emotion}'. Available: {self.available_emotions()}")
-
-        if emotion == self._current_emotion:
-            return
+    def set_static_layer_caching(self, enabled: bool) -> None:
+        """Toggle pre-rendering of the grid background and HUD frame (on by default)."""
+        self._static_layers.enabled = enabled
+        self.update()
 
-        self._current_emotion = emotion
-        self._emotion_hold_time = 0.0
-        target_state = self._preset_to_state(self._presets[emotion])
-        self._start_state = self._state.copy()
-
-        self._animation.stop()
-        self._animation.setStartValue(0.0)
-        self._animation.setEndValue(1.0)
-        self._animation.setDuration(550)
-        self._target_state = target_state
-        self._animation.start()
-
-    def set_orientation(self, yaw: float | None = None, pitch: float | None = None, roll: float | None = None) -> None:
-        """Update the head orientation in degrees."""
-        if yaw is not None:
-            self._orientation["yaw"] = float(max(-45.0, min(45.0, yaw)))
-        if pitch is not None:
-            self._orientation["pitch"] = float(max(-30.0, min(30.0, pitch)))
-        if roll is not None:
-            self._orientation["roll"] = float(max(-30.0, min(30.0, roll)))
+    def set_path_caching(self, enabled: bool) -> None:
+        """Toggle reuse of the quiet mouth line and icon geometry across frames (on by default)."""
+        self._paths.enabled = enabled
         self.update()
 
-    def set_battery_voltage(self, voltage: float) -> None:
-        """Update battery voltage and enforce default fear when critically low."""
-        self._battery_voltage = float(voltage)
-        self._enforce_low_battery_face()
+    def set_repaint_mode(self, mode: str) -> None:
+        """Choose ``regions`` (default), ``changed`` or ``full`` repaints, see FeatureRepaintTracker."""
+        self._repaint.mode = mode
+
+    @property
+    def repaint_requests(self) -> int:
+        """Repaints scheduled so far; lets callers tell whether an update changed anything."""
+        return self._repaint.requests
 
     # ------------------------------------------------------------------
-    # Animation helpers
+    # Repaint tracking
     # ------------------------------------------------------------------
-    def _update_state_from_animation(self, progress: float) -> None:
-        for key, start_value in self._start_state.items():
-            end_value = self._target_state[key]
-            if isinstance(start_value, QColor) and isinstance(end_value, QColor):
-                interpolated = QColor(
-                    start_value.red() + (end_value.red() - start_value.red()) * progress,
-                    start_value.green() + (end_value.green() - start_value.green()) * progress,
-                    start_value.blue() + (end_value.blue() - start_value.blue()) * progress,
-                )
-                self._state[key] = interpolated
-            else:
-                self._state[key] = start_value + (end_value - start_value) * progress
-        self.update()
-
-    def _update_idle(self) -> None:
-        dt = 0.016
-        self._time += dt
-        self._time_since_blink += dt
-        self._emotion_hold_time += dt
-        self._enforce_low_battery_face()
-
-        self._breathe_offset = math.sin(self._time * 0.7) * 6.0
-        self._sparkle = (math.sin(self._time * 3.0) + 1.0) * 0.5
+    def _schedule_repaint(self) -> None:
+        self._repaint.invalidate(self._repaint_signatures(), self._feature_bounds)
+
+    def _repaint_signatures(self) -> Dict[str, Hashable]:
+        state = self._state
+        pose = (self.width(), self.height(), self._orientation["yaw"], self._orientation["pitch"], self._orientation["roll"])
+        accent = (int(state[ACCENT_RED]), int(state[ACCENT_GREEN]), int(state[ACCENT_BLUE]))
+        # The waveform and the icon glitch are randomised per paint, so while
+        # they are active the clock is part of their signature.
+        mouth_noise = self._time if state[MOUTH_OPEN] > 0.1 else None
+        return {
+            "scan": (self.width(), self.height(), self._scan_y()),
+            "frame": (pose, self._current_emotion, f"{self._battery_voltage or 12.4:.1f}"),
+            "eyes": (pose, self._effective_eye_openness(), state[EYE_CURVE], state[IRIS_SIZE], accent),
+            "brows": (pose, state[BROW_RAISE], state[BROW_TILT], accent),
+            "mouth": (pose, state[MOUTH_WIDTH], state[MOUTH_OPEN], state[MOUTH_CURVE], mouth_noise, accent),
+            "icon": (pose, self._current_emotion, self._time, accent) if self._icon_visible() else None,
+        }
 
-        if self._blinking:
-            self._blink_phase += dt / 0.18
-            if self._blink_phase >= 1.0:
-                self._blinking = False
-                self._blink_phase = 0.0
-        elif self._time_since_blink > self._next_blink_at:
-            self._blinking = True
-            self._blink_phase = 0.0
-            self._time_since_blink = 0.0
-            self._next_blink_at = random.uniform(2.0, 5.0)
+    def _feature_bounds(self) -> Dict[str, QRegion]:
+        """Conservative device-space bounds of each feature for the current state."""
+        rect = self.rect()
+        face_rect, center = self._face_layout()
+        roll = rotation_about(center, self._orientation["roll"])
+        bounds = {
+            "scan": feature_region(QRectF(rect.left(), self._scan_y(), rect.width(), 50), margin=1.0),
+            # The status text is anchored 60 px inside the right edge and overflows it.
+            "frame": feature_region(face_rect.adjusted(0.0, -16.0, 140.0, 0.0), roll, 4.0),
+        }
 
-        self.update()
+        eye_width = face_rect.width() * 0.24
+        eye_height = face_rect.height() * 0.22
+        scaled_height = eye_height * self._effective_eye_openness()
+        closed = scaled_height < 2.0
+        left_eye_center, right_eye_center = self._eye_centers(face_rect, center)
+        eyes = QRegion()
+        brows = QRegion()
+        brow_width = eye_width * 1.2
+        brow_offset_y = -eye_width * (0.6 + self._state[BROW_RAISE] * 0.4)
+        for eye_center, direction in ((left_eye_center, -1), (right_eye_center, 1)):
+            if closed:
+                # A closed eye is drawn as an untilted line, see _draw_digital_eye.
+                line_rect = QRectF(eye_center.x() - eye_width * 0.5, eye_center.y() - 1.0, eye_width, 2.0)
+                eyes = eyes.united(feature_region(line_rect, roll, 3.0))
+            else:
+                eye_rect = QRectF(
+                    eye_center.x() - eye_width * 0.5,
+                    eye_center.y() - scaled_height * 0.5,
+                    eye_width,
+                    scaled_height,
+                )
+                tilt = rotation_about(eye_center, self._state[EYE_CURVE] * direction * 15.0)
+                eyes = eyes.united(feature_region(eye_rect, tilt * roll, 3.0))
+
+            brow = QTransform()
+            brow.translate(eye_center.x(), eye_center.y() + brow_offset_y)
+            brow.rotate(self._state[BROW_TILT] * 25.0 * direction)
+            brow_rect = QRectF(-brow_width * 0.5, -7.0, brow_width, 9.0)
+            brows = brows.united(feature_region(brow_rect, brow * roll, 3.0))
+        bounds["eyes"] = eyes
+        bounds["brows"] = brows
+
+        width = face_rect.width() * 0.4 * self._state[MOUTH_WIDTH]
+        amplitude = max(2.0, face_rect.height() * 0.15 * self._state[MOUTH_OPEN] * 0.5)
+        bend = -20.0 * self._state[MOUTH_CURVE]
+        mouth_x = center.x() + self._orientation["yaw"] / 45.0 * face_rect.width() * 0.05
+        mouth_y = center.y() + face_rect.height() * 0.25
+        mouth_rect = QRectF(
+            mouth_x - width * 0.5,
+            mouth_y + min(0.0, bend) - amplitude,
+            width,
+            abs(bend) + amplitude * 2.0,
+        )
+        bounds["mouth"] = feature_region(mouth_rect, roll, 4.0)
+
+        if self._icon_visible():
+            anchor = self._icon_anchor(face_rect)
+            size = face_rect.width() * 0.15
+            left = max(size * 0.5, 20.0) + 4.0
+            top = max(size * 0.6, 20.0) + 4.0
+            icon_rect = QRectF(
+                anchor.x() - left,
+                anchor.y() - top,
+                left + max(size * 0.5, 64.0) + 16.0,
+                top + size * 0.8 + 12.0,
+            )
+            bounds["icon"] = feature_region(icon_rect, roll)
+        return bounds
 
     # ------------------------------------------------------------------
     # Drawing (Cyberpunk / HUD Style)
     # ------------------------------------------------------------------
+    def resizeEvent(self, event) -> None:  # type: ignore[override]
+        self._static_layers.invalidate()
+        self._repaint.reset()
+        super().resizeEvent(event)
+
     def paintEvent(self, event) -> None:  # type: ignore[override]
         painter = QPainter(self)
         painter.setRenderHints(QPainter.RenderHint.Antialiasing | QPainter.RenderHint.SmoothPixmapTransform)
 
         rect = self.rect()
+        region = event.region()
         
         # 1. Background: Deep digital void with grid
         self._draw_grid_background(painter, rect)
 
+        face_rect, center = self._face_layout()
+
+        painter.save()
+        painter.translate(center)
+        painter.rotate(self._orientation["roll"])
+        painter.translate(-center)
+
+        # 2. Head Outline: Glowing HUD frame
+        if self._repaint.needs_paint("frame", region):
+            self._draw_hud_head_frame(painter, face_rect)
+
+        accent_color = self._accent_color()
+        
+        # Calculate positions
+        eye_height = face_rect.height() * 0.22
+        eye_width = face_rect.width() * 0.24
+        left_eye_center, right_eye_center = self._eye_centers(face_rect, center)
+
+        # Blink logic
+        effective_openness = self._effective_eye_openness()
+
+        # 3. Eyes: Digital Apertures
+        if self._repaint.needs_paint("eyes", region):
+            for eye_center, direction in ((left_eye_center, -1), (right_eye_center, 1)):
+                self._draw_digital_eye(
+                    painter,
+                    eye_center,
+                    eye_width,
+                    eye_height,
+                    effective_openness,
+                    self._state[EYE_CURVE] * direction,
+                    self._state[IRIS_SIZE],
+                    accent_color,
+                    direction
+                )
+
+        # 4. Brows: Floating Neon Bars
+        if self._repaint.needs_paint("brows", region):
+            self._draw_hud_brows(
+                painter, 
+                left_eye_center, 
+                right_eye_center, 
+                eye_width, 
+                self._state[BROW_RAISE], 
+                self._state[BROW_TILT], 
+                accent_color
+            )
+
+        # 5. Mouth: Oscilloscope / Waveform
+        if self._repaint.needs_paint("mouth", region):
+            self._draw_oscilloscope_mouth(painter, center, face_rect, accent_color)
+
+        # 6. Emotion Icons: Holographic projections
+        if self._repaint.needs_paint("icon", region):
+            self._draw_holographic_icon(painter, face_rect, accent_color)
+
+        painter.restore()
+
+    def _face_layout(self) -> Tuple[QRectF, QPointF]:
+        rect = self.rect()
         face_margin = min(rect.width(), rect.height()) * 0.05
         face_rect = QRectF(
             rect.left() + face_margin,
@@ -162,81 +252,55 @@ class RoboticFaceWidget(QWidget):
             head_size,
             head_size,
         )
-        center = face_rect.center()
-
-        painter.save()
-        painter.translate(center)
-        painter.rotate(self._orientation["roll"])
-        painter.translate(-center)
-
-        # 2. Head Outline: Glowing HUD frame
-        self._draw_hud_head_frame(painter, face_rect)
+        return face_rect, face_rect.center()
 
-        accent_color: QColor = self._state["accent_color"]
-        
-        # Calculate positions
-        eye_height = face_rect.height() * 0.22
-        eye_width = face_rect.width() * 0.24
+    def _eye_centers(self, face_rect: QRectF, center: QPointF) -> Tuple[QPointF, QPointF]:
         eye_spacing = face_rect.width() * 0.20
-
         yaw_offset = self._orientation["yaw"] / 45.0
         pitch_offset = self._orientation["pitch"] / 45.0
         eye_center_offset_x = yaw_offset * face_rect.width() * 0.08
-
-        left_eye_center = QPointF(
-            center.x() - eye_spacing + eye_center_offset_x,
-            center.y() - face_rect.height() * 0.1 + pitch_offset * 20.0,
-        )
-        right_eye_center = QPointF(
-            center.x() + eye_spacing + eye_center_offset_x,
-            center.y() - face_rect.height() * 0.1 + pitch_offset * 20.0,
+        eye_y = center.y() - face_rect.height() * 0.1 + pitch_offset * 20.0
+        return (
+            QPointF(center.x() - eye_spacing + eye_center_offset_x, eye_y),
+            QPointF(center.x() + eye_spacing + eye_center_offset_x, eye_y),
         )
 
-        # Blink logic
-        eye_openness = max(0.05, min(1.3, self._state["eye_openness"]))
+    def _effective_eye_openness(self) -> float:
+        eye_openness = max(0.05, min(1.3, self._state[EYE_OPENNESS]))
         blink_factor = 1.0
         if self._blinking:
             blink_factor -= math.sin(min(1.0, self._blink_phase) * math.pi)
             blink_factor = max(0.0, blink_factor)
-        effective_openness = max(0.0, eye_openness * blink_factor)
+        return max(0.0, eye_openness * blink_factor)
 
-        # 3. Eyes: Digital Apertures
-        for eye_center, direction in ((left_eye_center, -1), (right_eye_center, 1)):
-            self._draw_digital_eye(
-                painter,
-                eye_center,
-                eye_width,
-                eye_height,
-                effective_openness,
-                self._state["eye_curve"] * direction,
-                self._state["iris_size"],
-                accent_color,
-                direction
-            )
-
-        # 4. Brows: Floating Neon Bars
-        self._draw_hud_brows(
-            painter, 
-            left_eye_center, 
-            right_eye_center, 
-            eye_width, 
-            self._state["brow_raise"], 
-            self._state["brow_tilt"], 
-            accent_color
-        )
+    def _icon_visible(self) -> bool:
+        return self._current_emotion != "neutral" and self._emotion_hold_time >= 0.5
 
-        # 5. Mouth: Oscilloscope / Waveform
-        self._draw_oscilloscope_mouth(painter, center, face_rect, accent_color)
+    def _icon_anchor(self, face_rect: QRectF) -> QPointF:
+        bobble = math.sin(self._time * 4.0) * 5.0
+        return QPointF(face_rect.right() - face_rect.width() * 0.2, face_rect.top() + face_rect.height() * 0.2 + bobble)
 
-        # 6. Emotion Icons: Holographic projections
-        self._draw_holographic_icon(painter, face_rect, accent_color)
-
-        painter.restore()
+    def _scan_y(self) -> float:
+        return (self._time * 100) % (self.height() + 100) - 50
 
     # ------------------------------------------------------------------
     # Cyberpunk Drawing Helpers
     # ------------------------------------------------------------------
     def _draw_grid_background(self, painter: QPainter, rect: QRectF) -> None:
+        # Void and grid only change with the widget size, so they come from a
+        # cached pixmap; the scanning line is animated and drawn every frame.
+        self._static_layers.paint(painter, "grid", rect, self._render_grid_layer, opaque=True)
+
+        painter.save()
+        scan_y = self._scan_y()
+        scan_grad = QLinearGradient(0, scan_y, 0, scan_y + 50)
+        scan_grad.setColorAt(0.0, QColor(0, 255, 255, 0))
+        scan_grad.setColorAt(0.5, QColor(0, 255, 255, 30))
+        scan_grad.setColorAt(1.0, QColor(0, 255, 255, 0))
+        painter.fillRect(QRectF(rect.left(), scan_y, rect.width(), 50), scan_grad)
+        painter.restore()
+
+    def _render_grid_layer(self, painter: QPainter, rect: QRectF) -> None:
         # Deep void background
         bg_gradient = QLinearGradient(0, 0, 0, rect.height())
         bg_gradient.setColorAt(0.0, QColor(5, 5, 10))
@@ -261,15 +325,7 @@ class RoboticFaceWidget(QWidget):
         while y < rect.bottom():
             painter.drawLine(QPointF(rect.left(), y), QPointF(rect.right(), y))
             y += step
-            
-        # Scanning line
-        scan_y = (self._time * 100) % (rect.height() + 100) - 50
-        scan_grad = QLinearGradient(0, scan_y, 0, scan_y + 50)
-        scan_grad.setColorAt(0.0, QColor(0, 255, 255, 0))
-        scan_grad.setColorAt(0.5, QColor(0, 255, 255, 30))
-        scan_grad.setColorAt(1.0, QColor(0, 255, 255, 0))
-        painter.fillRect(rect, scan_grad)
-        
+
         painter.restore()
 
     def _draw_hud_head_frame(self, painter: QPainter, rect: QRectF) -> None:
@@ -280,11 +336,24 @@ class RoboticFaceWidget(QWidget):
         pen.setWidthF(2.0)
         painter.setPen(pen)
         painter.setBrush(Qt.BrushStyle.NoBrush)
+        path = self._static_layers.resource(
+            "head_frame", (rect.x(), rect.y(), rect.width(), rect.height()), lambda: self._build_head_frame_path(rect)
+        )
+        painter.drawPath(path)
         
+        # Decorative data bits
+        painter.setPen(QPen(QColor(0, 255, 255, 180), 1.0))
+        painter.setFont(QFont("Consolas", 8))
+        painter.drawText(QPointF(rect.right() - 60, rect.top() + 20), f"SYS.VOLT: {self._battery_voltage or 12.4:.1f}V")
+        painter.drawText(QPointF(rect.left() + 10, rect.bottom() - 10), f"EMO: {self._current_emotion.upper()}")
+        
+        painter.restore()
+
+    def _build_head_frame_path(self, rect: QRectF) -> QPainterPath:
         # Main circle/hex approximation
         path = QPainterPath()
         w, h = rect.width(), rect.height()
-        
+
         # Top bracket
         path.moveTo(rect.left() + w*0.3, rect.top())
         path.lineTo(rect.right() - w*0.3, rect.top())
@@ -301,16 +370,7 @@ class RoboticFaceWidget(QWidget):
         
         path.moveTo(rect.right(), rect.top() + h*0.3)
         path.lineTo(rect.right(), rect.top() + h*0.7)
-        
-        painter.drawPath(path)
-        
-        # Decorative data bits
-        painter.setPen(QPen(QColor(0, 255, 255, 180), 1.0))
-        painter.setFont(QFont("Consolas", 8))
-        painter.drawText(QPointF(rect.right() - 60, rect.top() + 20), f"SYS.VOLT: {self._battery_voltage or 12.4:.1f}V")
-        painter.drawText(QPointF(rect.left() + 10, rect.bottom() - 10), f"EMO: {self._current_emotion.upper()}")
-        
-        painter.restore()
+        return path
 
     def _draw_digital_eye(
         self,
@@ -436,44 +496,23 @@ class RoboticFaceWidget(QWidget):
         painter.save()
         
         # Mouth parameters
-        width = face_rect.width() * 0.4 * self._state["mouth_width"]
-        height = face_rect.height() * 0.15 * self._state["mouth_open"]
-        curve = self._state["mouth_curve"]
+        width = face_rect.width() * 0.4 * quantize(self._state[MOUTH_WIDTH], _SHAPE_STEP)
+        height = face_rect.height() * 0.15 * self._state[MOUTH_OPEN]
+        curve = quantize(self._state[MOUTH_CURVE], _SHAPE_STEP)
         
         yaw_offset = self._orientation["yaw"] / 45.0
         mouth_center_x = center.x() + yaw_offset * face_rect.width() * 0.05
         mouth_center_y = center.y() + face_rect.height() * 0.25
         
         # Draw the "Voice Line"
-        path = QPainterPath()
-        steps = 20
-        step_x = width / steps
-        start_x = mouth_center_x - width * 0.5
-        
-        path.moveTo(start_x, mouth_center_y)
-        
-        # Generate waveform based on emotion/state
         # If speaking (mouth open), add noise. If smiling, curve up.
-        
-        amplitude = height * 0.5
-        if amplitude < 2.0: amplitude = 2.0 # Minimum line thickness visual
-        
-        for i in range(steps + 1):
-            x = start_x + i * step_x
-            # Normalized x from -1 to 1
-            nx = (i / steps) * 2.0 - 1.0
-            
-            # Base curve (smile/frown)
-            # Parabola: y = x^2
-            curve_y = nx * nx * curve * -20.0 
-            
-            # Noise/Voice modulation
-            noise = 0.0
-            if self._state["mouth_open"] > 0.1:
-                noise = random.uniform(-1.0, 1.0) * amplitude * (1.0 - abs(nx)) # Taper noise at ends
-            
-            path.lineTo(x, mouth_center_y + curve_y + noise)
-            
+        if self._state[MOUTH_OPEN] > 0.1:
+            path = _voice_line_path(width, height, curve, noisy=True)
+        else:
+            # A quiet line only depends on its shape, so it is built once.
+            path = self._paths.get(("voice", width, curve), lambda: _voice_line_path(width, height, curve, noisy=False))
+        painter.translate(mouth_center_x, mouth_center_y)
+
         # Glow effect
         painter.setPen(QPen(QColor(accent.red(), accent.green(), accent.blue(), 100), 4.0))
         painter.drawPath(path)
@@ -484,20 +523,16 @@ class RoboticFaceWidget(QWidget):
         painter.restore()
 
     def _draw_holographic_icon(self, painter: QPainter, face_rect: QRectF, accent: QColor) -> None:
-        emotion = self._current_emotion
-        if emotion == "neutral" or self._emotion_hold_time < 0.5:
+        if not self._icon_visible():
             return
+        emotion = self._current_emotion
 
         painter.save()
         
-        # Position icon near cheek or forehead
-        icon_pos = QPointF(face_rect.right() - face_rect.width()*0.2, face_rect.top() + face_rect.height()*0.2)
+        # Position icon near cheek or forehead, bobbing up and down
+        icon_pos = self._icon_anchor(face_rect)
         size = face_rect.width() * 0.15
         
-        # Bobbing animation
-        bobble = math.sin(self._time * 4.0) * 5.0
-        icon_pos.setY(icon_pos.y() + bobble)
-        
         painter.translate(icon_pos)
         
         # Glitch effect occasionally
@@ -511,13 +546,7 @@ class RoboticFaceWidget(QWidget):
         
         if emotion == "happy":
             # Digital Heart
-            path = QPainterPath()
-            path.moveTo(0, size*0.3)
-            path.lineTo(size*0.5, -size*0.5)
-            path.lineTo(0, -size*0.2)
-            path.lineTo(-size*0.5, -size*0.5)
-            path.closeSubpath()
-            painter.drawPath(path)
+            painter.drawPath(self._paths.get(("heart", size), lambda: _digital_heart_path(size)))
             painter.drawText(QPointF(-10, size*0.6), "^_^")
             
         elif emotion == "sad":
@@ -713,30 +742,44 @@ class RoboticFaceWidget(QWidget):
             ),
         }
 
-    def _preset_to_state(self, preset: EmotionPreset) -> Dict[str, object]:
-        return {
-            "eye_openness": preset.eye_openness,
-            "eye_curve": preset.eye_curve,
-            "brow_raise": preset.brow_raise,
-            "brow_tilt": preset.brow_tilt,
-            "mouth_curve": preset.mouth_curve,
-            "mouth_open": preset.mouth_open,
-            "mouth_width": preset.mouth_width,
-            "mouth_height": preset.mouth_height,
-            "iris_size": preset.iris_size,
-            "accent_color": QColor(*preset.accent_color),
-        }
 
-    def _enforce_low_battery_face(self) -> None:
-        """Force fearful face when battery is critically low."""
-        if self._battery_voltage is None:
-            return
-        low_battery = self._battery_voltage < 10.0
-        if low_battery and not self._low_battery_forced:
-            self._low_battery_forced = True
-            if self._current_emotion != "fearful":
-                self.set_emotion("fearful")
-        elif not low_battery and self._low_battery_forced:
-            self._low_battery_forced = False
-            if self._current_emotion == "fearful":
-                self.set_emotion(self._default_emotion)
+# ----------------------------------------------------------------------
+# Path builders (local coordinates around the feature's anchor)
+# ----------------------------------------------------------------------
+def _voice_line_path(width: float, height: float, curve: float, noisy: bool) -> QPainterPath:
+    path = QPainterPath()
+    steps = 20
+    step_x = width / steps
+    start_x = -width * 0.5
+
+    path.moveTo(start_x, 0.0)
+
+    amplitude = height * 0.5
+    if amplitude < 2.0: amplitude = 2.0 # Minimum line thickness visual
+
+    for i in range(steps + 1):
+        x = start_x + i * step_x
+        # Normalized x from -1 to 1
+        nx = (i / steps) * 2.0 - 1.0
+
+        # Base curve (smile/frown)
+        # Parabola: y = x^2
+        curve_y = nx * nx * curve * -20.0
+
+        # Noise/Voice modulation
+        noise = 0.0
+        if noisy:
+            noise = random.uniform(-1.0, 1.0) * amplitude * (1.0 - abs(nx)) # Taper noise at ends
+
+        path.lineTo(x, curve_y + noise)
+    return path
+
+
+def _digital_heart_path(size: float) -> QPainterPath:
+    path = QPainterPath()
+    path.moveTo(0, size*0.3)
+    path.lineTo(size*0.5, -size*0.5)
+    path.lineTo(0, -size*0.2)
+    path.lineTo(-size*0.5, -size*0.5)
+    path.closeSubpath()
+    return path
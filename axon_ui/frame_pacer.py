@@ -0,0 +1,167 @@
+"""Adaptive frame scheduling for the face animations."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+from time import monotonic
+from typing import Callable, Optional
+
+from PySide6.QtCore import QObject, Qt, QTimer
+
+# Longest step handed to the animation after a stall (suspend, debugger, ...),
+# so a late frame never makes blinks or breathing jump.
+_MAX_STEP_SECONDS = 0.25
+
+
+class PowerProfile(Enum):
+    """Named trade-offs between animation smoothness and CPU use."""
+
+    PERFORMANCE = "performance"
+    BALANCED = "balanced"
+    POWER_SAVER = "power-saver"
+
+    @classmethod
+    def parse(cls, value: str) -> "PowerProfile":
+        try:
+            return cls(value.strip().lower())
+        except ValueError:
+            options = ", ".join(profile.value for profile in cls)
+            raise ValueError(f"Unknown power profile '{value}'. Available: {options}") from None
+
+
+@dataclass(frozen=True, slots=True)
+class PacingConfig:
+    """Frame rates used while animating and while the face is at rest.
+
+    ``idle_after`` is how long the pacer keeps the full rate after the last
+    blink, transition or wake-up before dropping to ``idle_fps``.
+    """
+
+    fps_cap: float = 60.0
+    idle_fps: float = 20.0
+    idle_after: float = 1.0
+
+    def __post_init__(self) -> None:
+        if self.fps_cap <= 0 or self.idle_fps <= 0:
+            raise ValueError("frame rates must be positive")
+        if self.idle_after < 0:
+            raise ValueError("idle_after must not be negative")
+        if self.idle_fps > self.fps_cap:
+            object.__setattr__(self, "idle_fps", self.fps_cap)
+
+    @classmethod
+    def for_profile(cls, profile: PowerProfile, fps_cap: Optional[float] = None) -> "PacingConfig":
+        """Return the profile's defaults, optionally with a lower or higher FPS cap."""
+
+        if profile is PowerProfile.PERFORMANCE:
+            config = cls(fps_cap=60.0, idle_fps=60.0, idle_after=1.0)
+        elif profile is PowerProfile.POWER_SAVER:
+            config = cls(fps_cap=30.0, idle_fps=8.0, idle_after=0.5)
+        else:
+            config = cls()
+        if fps_cap is None:
+            return config
+        idle_fps = fps_cap if profile is PowerProfile.PERFORMANCE else config.idle_fps
+        return cls(fps_cap=fps_cap, idle_fps=idle_fps, idle_after=config.idle_after)
+
+    @property
+    def frame_interval(self) -> float:
+        return 1.0 / self.fps_cap
+
+    @property
+    def idle_interval(self) -> float:
+        return 1.0 / self.idle_fps
+
+
+class FramePacer(QObject):
+    """Call ``tick(dt)`` with the real elapsed time at an adaptive rate.
+
+    ``tick`` returns ``True`` while something needs smooth motion (a blink or
+    an emotion transition); the pacer then runs at ``fps_cap``.  Once nothing
+    has been busy for ``idle_after`` seconds it drops to ``idle_fps``.
+    :meth:`wake` ramps straight back up for external events such as a new
+    orientation.  Ticks are scheduled against the previous tick's start time,
+    so slow ticks shorten the next wait instead of accumulating drift.
+    """
+
+    def __init__(
+        self,
+        tick: Callable[[float], bool],
+        config: Optional[PacingConfig] = None,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self._tick = tick
+        self._config = config or PacingConfig()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._on_timeout)
+        self._running = False
+        self._last_tick = 0.0
+        self._busy_until = 0.0
+
+    # ------------------------------------------------------------------
+    # Control
+    # ------------------------------------------------------------------
+    @property
+    def config(self) -> PacingConfig:
+        return self._config
+
+    def set_config(self, config: PacingConfig) -> None:
+        self._config = config
+        if self._running:
+            self._schedule(self._interval(monotonic()), monotonic())
+
+    def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        now = monotonic()
+        self._last_tick = now
+        self._busy_until = now + self._config.idle_after
+        self._schedule(self._config.frame_interval, now)
+
+    def stop(self) -> None:
+        self._running = False
+        self._timer.stop()
+
+    def wake(self) -> None:
+        """Return to the full frame rate, e.g. after an external state change."""
+
+        now = monotonic()
+        was_idle = now >= self._busy_until
+        self._busy_until = now + self._config.idle_after
+        if self._running and was_idle:
+            self._schedule(self._config.frame_interval, now)
+
+    @property
+    def is_idle(self) -> bool:
+        return monotonic() >= self._busy_until
+
+    @property
+    def interval(self) -> float:
+        """Current target seconds between ticks."""
+
+        return self._interval(monotonic())
+
+    # ------------------------------------------------------------------
+    # Timer
+    # ------------------------------------------------------------------
+    def _on_timeout(self) -> None:
+        if not self._running:
+            return
+        now = monotonic()
+        dt = min(now - self._last_tick, _MAX_STEP_SECONDS)
+        self._last_tick = now
+        if self._tick(dt):
+            self._busy_until = now + self._config.idle_after
+        self._schedule(self._interval(now), monotonic())
+
+    def _interval(self, now: float) -> float:
+        return self._config.frame_interval if now < self._busy_until else self._config.idle_interval
+
+    def _schedule(self, interval: float, now: float) -> None:
+        delay = self._last_tick + interval - now
+        self._timer.start(max(0, int(delay * 1000.0 + 0.5)))
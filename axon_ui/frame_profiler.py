@@ -0,0 +1,159 @@
+"""Opt-in per-section paint timers for the face widgets."""
+
+from __future__ import annotations
+
+import time
+from typing import Callable, Dict, List, Tuple
+
+from PySide6.QtOpenGLWidgets import QOpenGLWidget
+from PySide6.QtWidgets import QWidget
+
+from axon_ui.frame_stats import PercentileSummary, RollingPercentiles
+
+# Helper name prefixes that are timed as sections by default.
+DEFAULT_SECTION_PREFIXES: Tuple[str, ...] = ("_draw_", "_render_", "_upload_")
+
+
+class FrameProfiler:
+    """Time a face widget's paint entry point and each of its drawing helpers.
+
+    :meth:`attach` shadows the widget's ``paintEvent`` (``paintGL`` for the
+    OpenGL face) and every helper whose name starts with one of *prefixes*
+    with timing wrappers stored on the instance; :meth:`detach` deletes them
+    again.  A widget without a profiler attached runs its own methods with no
+    extra branch or call, so instrumentation costs nothing when disabled.
+
+    Per frame, time spent in a helper is summed (both eyes count as one
+    ``draw_eye`` value) and nested helpers report inclusive time.  Besides
+    the helper sections, ``frame`` is the whole paint call and ``interval``
+    the time between the starts of consecutive paints, which includes idle
+    gaps while the frame pacer is throttled.  The OpenGL face only reports
+    the CPU side of ``paintGL``.
+    """
+
+    FRAME = "frame"
+    INTERVAL = "interval"
+
+    def __init__(self, capacity: int = 600, prefixes: Tuple[str, ...] = DEFAULT_SECTION_PREFIXES) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be a positive integer")
+        self._capacity = capacity
+        self._prefixes = prefixes
+        self._stats: Dict[str, RollingPercentiles] = {}
+        self._pending: Dict[str, float] = {}
+        self._widget: QWidget | None = None
+        self._wrapped: List[str] = []
+        self._last_frame_start: float | None = None
+
+    # ------------------------------------------------------------------
+    # Attachment
+    # ------------------------------------------------------------------
+    @property
+    def widget(self) -> QWidget | None:
+        return self._widget
+
+    def attach(self, widget: QWidget) -> None:
+        """Start timing *widget*; a profiler serves one widget at a time."""
+
+        if self._widget is not None:
+            raise RuntimeError("FrameProfiler is already attached to a widget")
+        entry = "paintGL" if isinstance(widget, QOpenGLWidget) else "paintEvent"
+        helpers = sorted(
+            name
+            for name in dir(type(widget))
+            if name.startswith(self._prefixes) and callable(getattr(type(widget), name))
+        )
+        setattr(widget, entry, self._timed_frame(getattr(widget, entry)))
+        for name in helpers:
+            setattr(widget, name, self._timed_section(name.lstrip("_"), getattr(widget, name)))
+        self._widget = widget
+        self._wrapped = [entry, *helpers]
+        self._last_frame_start = None
+
+    def detach(self) -> None:
+        """Restore the widget's own methods; collected statistics are kept."""
+
+        if self._widget is None:
+            return
+        for name in self._wrapped:
+            delattr(self._widget, name)
+        self._widget = None
+        self._wrapped = []
+        self._pending.clear()
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+    def summary(self, section: str = FRAME) -> PercentileSummary:
+        """Percentiles of *section* over the recent frames, in seconds."""
+
+        stats = self._stats.get(section)
+        if stats is None:
+            return PercentileSummary(0, 0.0, 0.0, 0.0, 0.0)
+        return stats.summary()
+
+    def summaries(self) -> Dict[str, PercentileSummary]:
+        """Every recorded section in seconds: ``frame``, ``interval``, then helpers by p95, slowest first."""
+
+        computed = {name: stats.summary() for name, stats in self._stats.items()}
+        ordered: Dict[str, PercentileSummary] = {}
+        for name in (self.FRAME, self.INTERVAL):
+            if name in computed:
+                ordered[name] = computed.pop(name)
+        for name in sorted(computed, key=lambda key: computed[key].p95, reverse=True):
+            ordered[name] = computed[name]
+        return ordered
+
+    def describe(self) -> str:
+        """One line per section in milliseconds, for logs."""
+
+        width = max((len(name) for name in self._stats), default=0)
+        return "\n".join(
+            f"{name:<{width}}  {summary.scaled(1000.0).describe('ms')}" for name, summary in self.summaries().items()
+        )
+
+    def reset(self) -> None:
+        self._stats.clear()
+        self._pending.clear()
+        self._last_frame_start = None
+
+    # ------------------------------------------------------------------
+    # Wrappers
+    # ------------------------------------------------------------------
+    def _record(self, section: str, elapsed: float) -> None:
+        stats = self._stats.get(section)
+        if stats is None:
+            stats = self._stats[section] = RollingPercentiles(self._capacity)
+        stats.add(elapsed)
+
+    def _timed_frame(self, method: Callable[..., None]) -> Callable[..., None]:
+        clock = time.perf_counter
+        pending = self._pending
+
+        def timed(*args):
+            start = clock()
+            if self._last_frame_start is not None:
+                self._record(self.INTERVAL, start - self._last_frame_start)
+            self._last_frame_start = start
+            try:
+                return method(*args)
+            finally:
+                self._record(self.FRAME, clock() - start)
+                for section, elapsed in pending.items():
+                    self._record(section, elapsed)
+                pending.clear()
+
+        return timed
+
+    def _timed_section(self, section: str, method: Callable[..., object]) -> Callable[..., object]:
+        clock = time.perf_counter
+        pending = self._pending
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                pending[section] = pending.get(section, 0.0) + clock() - start
+
+        return timed
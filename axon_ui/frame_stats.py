@@ -0,0 +1,75 @@
+"""Rolling percentile tracking for latency and frame-time diagnostics."""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Sequence
+
+
+@dataclass(slots=True)
+class PercentileSummary:
+    """Percentiles of the most recent observations, in the recorded unit."""
+
+    count: int
+    p50: float
+    p95: float
+    p99: float
+    maximum: float
+
+    def scaled(self, factor: float) -> "PercentileSummary":
+        """Return a copy with every statistic multiplied by *factor* (e.g. ``1000`` for ms)."""
+
+        return PercentileSummary(
+            self.count,
+            self.p50 * factor,
+            self.p95 * factor,
+            self.p99 * factor,
+            self.maximum * factor,
+        )
+
+    def describe(self, unit: str = "") -> str:
+        return (
+            f"n={self.count} p50={self.p50:.2f}{unit} p95={self.p95:.2f}{unit} "
+            f"p99={self.p99:.2f}{unit} max={self.maximum:.2f}{unit}"
+        )
+
+
+class RollingPercentiles:
+    """Keep the last *capacity* observations and report percentiles on demand.
+
+    Recording is a single deque append so it is safe to call from paint and
+    sample hot paths; sorting only happens when :meth:`summary` is requested.
+    """
+
+    def __init__(self, capacity: int = 512) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be a positive integer")
+        self._values: Deque[float] = deque(maxlen=capacity)
+
+    def add(self, value: float) -> None:
+        self._values.append(value)
+
+    def clear(self) -> None:
+        self._values.clear()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def summary(self) -> PercentileSummary:
+        ordered = sorted(self._values)
+        if not ordered:
+            return PercentileSummary(0, 0.0, 0.0, 0.0, 0.0)
+        return PercentileSummary(
+            count=len(ordered),
+            p50=_nearest_rank(ordered, 50.0),
+            p95=_nearest_rank(ordered, 95.0),
+            p99=_nearest_rank(ordered, 99.0),
+            maximum=ordered[-1],
+        )
+
+
+def _nearest_rank(ordered: Sequence[float], percentile: float) -> float:
+    index = math.ceil(percentile / 100.0 * len(ordered)) - 1
+    return ordered[max(0, min(len(ordered) - 1, index))]
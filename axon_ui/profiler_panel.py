@@ -0,0 +1,171 @@
+"""Overlay panel that shows the face widget's frame-time percentiles."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from PySide6.QtCore import QPointF, QSize, Qt, QTimer
+from PySide6.QtGui import QColor, QIcon, QPainter, QPen, QPixmap
+from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel, QPushButton, QSizePolicy, QWidget
+
+from axon_ui.collapsible_panel import CollapsiblePanel
+from axon_ui.frame_profiler import FrameProfiler
+
+
+class FrameProfilerPanel(CollapsiblePanel):
+    """Show p50/p95/p99 paint times and the slowest drawing sections.
+
+    The labels refresh once a second while the panel is expanded; a collapsed
+    panel does no work.
+    """
+
+    _SECTION_COUNT = 2
+
+    def __init__(self, profiler: FrameProfiler, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.setObjectName("profilerPanel")
+        self._profiler = profiler
+        self._frame_label: Optional[QLabel] = None
+        self._rate_label: Optional[QLabel] = None
+        self._section_labels: list[QLabel] = []
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(1000)
+        self._refresh_timer.timeout.connect(self.refresh)
+        self.setSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Fixed)
+        self._build_ui()
+        self._apply_collapsed_state(True)
+
+    def _build_ui(self) -> None:
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        self.setStyleSheet(
+            "#profilerPanel {"
+            "background-color: rgba(4, 9, 20, 0.65);"
+            "border-radius: 16px;"
+            "border: none;"
+            "}"
+            "#profilerPanel QLabel {"
+            "color: #e8f1ff;"
+            "font-size: 14px;"
+            "font-weight: 500;"
+            "}"
+        )
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(12, 6, 10, 6)
+        layout.setSpacing(6)
+
+        content = QFrame()
+        content.setObjectName("profilerContent")
+        content.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        content_layout = QHBoxLayout(content)
+        content_layout.setContentsMargins(0, 0, 0, 0)
+        content_layout.setSpacing(8)
+        layout.addWidget(content, 1)
+        self._content_frame = content
+
+        self._frame_label = QLabel("paint --")
+        self._rate_label = QLabel("-- fps")
+        self._section_labels = [QLabel("") for _ in range(self._SECTION_COUNT)]
+        labels = [self._frame_label, self._rate_label, *self._section_labels]
+        for index, label in enumerate(labels):
+            label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
+            if index:
+                content_layout.addWidget(self._build_separator())
+            content_layout.addWidget(label)
+
+        self._toggle_button = QPushButton()
+        self._toggle_button.setObjectName("profilerToggle")
+        self._toggle_button.setCursor(Qt.CursorShape.PointingHandCursor)
+        self._toggle_button.setMinimumSize(26, 26)
+        self._toggle_button.setIconSize(QSize(20, 20))
+        self._toggle_button.setToolTip("Show face frame times")
+        self._toggle_button.clicked.connect(self.toggle)
+        self._toggle_button.setText("")
+        layout.addWidget(self._toggle_button, 0, Qt.AlignmentFlag.AlignRight)
+
+        self._shadow = None
+
+    def refresh(self) -> None:
+        summaries = self._profiler.summaries()
+        frame = summaries.pop(FrameProfiler.FRAME, None)
+        interval = summaries.pop(FrameProfiler.INTERVAL, None)
+        if self._frame_label is not None:
+            if frame is None:
+                self._frame_label.setText("paint --")
+            else:
+                ms = frame.scaled(1000.0)
+                self._frame_label.setText(f"paint {ms.p50:.1f}/{ms.p95:.1f}/{ms.p99:.1f} ms")
+        if self._rate_label is not None:
+            if interval is None or interval.p50 <= 0:
+                self._rate_label.setText("-- fps")
+            else:
+                self._rate_label.setText(f"{1.0 / interval.p50:.0f} fps")
+        sections = list(summaries.items())
+        for index, label in enumerate(self._section_labels):
+            if index < len(sections):
+                name, summary = sections[index]
+                label.setText(f"{name.removeprefix('draw_')} {summary.p95 * 1000.0:.1f} ms")
+            else:
+                label.setText("")
+
+    def _on_collapse_state_changed(self) -> None:
+        super()._on_collapse_state_changed()
+        if self._collapsed:
+            self._refresh_timer.stop()
+        else:
+            self.refresh()
+            self._refresh_timer.start()
+
+    def _build_separator(self) -> QFrame:
+        separator = QFrame()
+        separator.setObjectName("profilerSeparator")
+        separator.setFixedSize(1, 18)
+        separator.setStyleSheet(
+            "QFrame#profilerSeparator {"
+            "background-color: rgba(232, 241, 255, 0.12);"
+            "border: none;"
+            "}"
+        )
+        return separator
+
+    def _apply_toggle_palette(self) -> None:  # pragma: no cover - Qt painting
+        if self._toggle_button is None:
+            return
+        self._toggle_button.setStyleSheet(
+            "#profilerToggle {"
+            "background-color: transparent;"
+            "border: none;"
+            "padding: 0px;"
+            "}"
+            "#profilerToggle:hover {"
+            "background-color: transparent;"
+            "}"
+        )
+
+    def _update_toggle_icon(self) -> None:  # pragma: no cover - Qt painting
+        if self._toggle_button is None:
+            return
+        self._toggle_button.setIcon(QIcon(self._build_stopwatch_icon(QColor("#4CC9F0"))))
+
+    def _build_stopwatch_icon(self, color: QColor) -> QPixmap:
+        size = 20
+        pixmap = QPixmap(size, size)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+
+        pen = QPen(color)
+        pen.setWidthF(2.0)
+        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+        painter.setPen(pen)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+
+        center = QPointF(size / 2.0, size * 0.56)
+        radius = size * 0.34
+        painter.drawEllipse(center, radius, radius)
+        painter.drawLine(QPointF(center.x(), center.y() - radius), QPointF(center.x(), size * 0.08))
+        painter.drawLine(center, QPointF(center.x() + radius * 0.55, center.y() - radius * 0.45))
+
+        painter.end()
+        return pixmap
@@ -0,0 +1,149 @@
+"""Per-widget caches for paint content that is expensive to rebuild every frame."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Tuple, TypeVar
+
+from PySide6.QtCore import QRect, QRectF, Qt
+from PySide6.QtGui import QPainter, QPixmap
+
+T = TypeVar("T")
+
+LayerRenderer = Callable[[QPainter, QRectF], None]
+
+
+class StaticLayerCache:
+    """Pre-rendered ``QPixmap`` layers and memoized size-dependent resources.
+
+    Layers are keyed by their logical size and the paint device's pixel ratio,
+    so a HiDPI screen gets a full-resolution pixmap and moving the window to a
+    different screen re-renders automatically.  Widgets call :meth:`invalidate`
+    from ``resizeEvent``.  With ``enabled`` set to ``False`` every layer is
+    painted directly, which keeps the uncached path available for comparison.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self._enabled = enabled
+        self._layers: Dict[str, Tuple[Tuple[int, int, float], QPixmap]] = {}
+        self._resources: Dict[str, Tuple[Hashable, object]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = bool(value)
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        self._layers.clear()
+        self._resources.clear()
+
+    def paint(self, painter: QPainter, name: str, rect: QRect, render: LayerRenderer, *, opaque: bool = False) -> None:
+        """Composite layer *name* into *rect*, rendering it first if the key changed.
+
+        Set *opaque* for layers that cover every pixel (backgrounds): the pixmap
+        then has no alpha channel and is copied instead of blended.
+        """
+
+        if not self._enabled:
+            render(painter, QRectF(rect))
+            return
+
+        ratio = painter.device().devicePixelRatioF()
+        key = (rect.width(), rect.height(), ratio)
+        cached = self._layers.get(name)
+        if cached is None or cached[0] != key:
+            pixmap = QPixmap(max(1, round(rect.width() * ratio)), max(1, round(rect.height() * ratio)))
+            pixmap.setDevicePixelRatio(ratio)
+            if not opaque:
+                pixmap.fill(Qt.GlobalColor.transparent)
+            layer_painter = QPainter(pixmap)
+            layer_painter.setRenderHints(painter.renderHints())
+            render(layer_painter, QRectF(0.0, 0.0, rect.width(), rect.height()))
+            layer_painter.end()
+            cached = (key, pixmap)
+            self._layers[name] = cached
+        if opaque:
+            mode = painter.compositionMode()
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+            painter.drawPixmap(rect.topLeft(), cached[1])
+            painter.setCompositionMode(mode)
+        else:
+            painter.drawPixmap(rect.topLeft(), cached[1])
+
+    def resource(self, name: str, key: Hashable, factory: Callable[[], T]) -> T:
+        """Return the value built by *factory*, reusing it while *key* is unchanged."""
+
+        if not self._enabled:
+            return factory()
+        cached = self._resources.get(name)
+        if cached is None or cached[0] != key:
+            cached = (key, factory())
+            self._resources[name] = cached
+        return cached[1]  # type: ignore[return-value]
+
+
+def quantize(value: float, step: float) -> float:
+    """Snap *value* to a multiple of *step* so nearby values share a cache key."""
+
+    return round(value / step) * step
+
+
+class PathCache:
+    """Least-recently-used cache of ``QPainterPath`` geometry.
+
+    Keys are tuples of a shape name and the parameters the shape is built
+    from, with animated scalars passed through :func:`quantize` first; the
+    shape must then be built from the quantized values so a cache hit and a
+    rebuild draw exactly the same pixels.  Paths are built in local
+    coordinates (around the origin or at unit size) and positioned with the
+    painter transform, so moving a feature does not change its key.  With
+    ``enabled`` set to ``False`` every call rebuilds, for comparison.
+    """
+
+    def __init__(self, capacity: int = 128, enabled: bool = True) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be a positive integer")
+        self._capacity = capacity
+        self._enabled = enabled
+        self._entries: "OrderedDict[Hashable, object]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = bool(value)
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, build: Callable[[], T]) -> T:
+        """Return the geometry for *key*, calling *build* on a miss."""
+
+        if not self._enabled:
+            return build()
+        entries = self._entries
+        cached = entries.get(key)
+        if cached is not None:
+            entries.move_to_end(key)
+            self.hits += 1
+            return cached  # type: ignore[return-value]
+        self.misses += 1
+        value = build()
+        entries[key] = value
+        if len(entries) > self._capacity:
+            entries.popitem(last=False)
+        return value
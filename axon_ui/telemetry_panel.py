@@ -12,6 +12,7 @@ from axon_ui.collapsible_panel import CollapsiblePanel
 
 if TYPE_CHECKING:
     from robot_control.sensor_data import SensorSample
+    from robot_control.telemetry_store import TelemetryStore
 
 Formatter = Callable[[float], str]
 
@@ -39,6 +40,8 @@ class TelemetryPanel(CollapsiblePanel):
         self._blink_timer.setInterval(450)
         self._blink_timer.timeout.connect(self._handle_blink)
         self._streaming = False
+        self._history: Optional["TelemetryStore"] = None
+        self._smoothing_seconds = 0.0
         self.setObjectName("telemetryPanel")
         self.setSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Fixed)
         self._build_ui()
@@ -216,8 +219,25 @@ class TelemetryPanel(CollapsiblePanel):
         painter.end()
         return pixmap
 
+    def set_history(self, history: Optional["TelemetryStore"], smoothing_seconds: float = 5.0) -> None:
+        """Show temperature and voltage as means over *smoothing_seconds* of *history*.
+
+        Both readings are noisy and the voltage sags under motor load, so a short
+        window average is easier to read than the instantaneous value.
+        """
+
+        self._history = history
+        self._smoothing_seconds = smoothing_seconds
+
     def update_sample(self, sample: "SensorSample") -> None:
         values = sample.as_dict()
+        if self._history is not None and len(self._history):
+            temperature, voltage = self._history.mean(
+                self._smoothing_seconds,
+                ("temperature_c", "voltage_v"),
+            )
+            values["temperature_c"] = float(temperature)
+            values["voltage_v"] = float(voltage)
         for field, label in self._value_labels.items():
             value = values.get(field)
             formatter = self._formatters.get(field, lambda v: str(v))
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Load-test ``SerialBridgeServer`` with many simultaneous observers.
+
+The script starts the bridge on an ephemeral local port with a stub reader,
+connects ``--clients`` sockets (optionally negotiating the binary framing), and
+publishes telemetry plus a raw serial line at ``--rate`` Hz.  It reports the
+delivered frames per client, drops, lag, and the server process CPU time.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import selectors
+import socket
+import sys
+import threading
+import time
+from typing import Callable, Dict, List
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from robot_control.bridge_protocol import WireFormat, format_ack, format_command, iter_frames
+from robot_control.sensor_data import SensorSample
+from robot_control.serial_bridge_config import SerialBridgeConfig
+from robot_control.serial_bridge_server import SerialBridgeServer
+
+
+class _StubReader:
+    """Minimal stand-in for :class:`SerialReadWriter` used by the bridge."""
+
+    def __init__(self) -> None:
+        self.commands: List[str] = []
+
+    def add_line_consumer(self, consumer: Callable[[str], None]) -> None:
+        pass
+
+    def send_command(self, command: str) -> None:
+        self.commands.append(command)
+
+
+class _ObserverPool:
+    """Drain many client sockets from a single thread and count what arrives."""
+
+    def __init__(self, address, count: int, wire_format: WireFormat, slow: int) -> None:
+        self._selector = selectors.DefaultSelector()
+        self._stop = threading.Event()
+        self.received: Dict[int, int] = {}
+        self._slow = set(range(slow))
+        self._sockets: List[socket.socket] = []
+        for index in range(count):
+            sock = socket.create_connection(address)
+            # Consume the welcome line (and the format ack) so only published
+            # frames are counted.
+            marker = b"\n"
+            if wire_format is not WireFormat.JSON:
+                sock.sendall((format_command(wire_format) + "\n").encode())
+                marker = (format_ack(wire_format) + "\n").encode()
+            buffer = bytearray()
+            while marker not in buffer:
+                buffer += sock.recv(4096)
+            del buffer[: buffer.index(marker) + len(marker)]
+            sock.setblocking(False)
+            self._sockets.append(sock)
+            self.received[index] = 0
+            if index not in self._slow:
+                self._selector.register(sock, selectors.EVENT_READ, (index, buffer))
+        self._binary = wire_format is WireFormat.BINARY
+        self._thread = threading.Thread(target=self._run, name="BridgeLoadObservers", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join(timeout=2.0)
+        self._selector.close()
+        for sock in self._sockets:
+            sock.close()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            for key, _ in self._selector.select(timeout=0.1):
+                index, buffer = key.data
+                try:
+                    chunk = key.fileobj.recv(65536)
+                except BlockingIOError:
+                    continue
+                if not chunk:
+                    self._selector.unregister(key.fileobj)
+                    continue
+                buffer += chunk
+                if self._binary:
+                    self.received[index] += sum(1 for _ in iter_frames(buffer))
+                else:
+                    self.received[index] += buffer.count(b"\n")
+                    del buffer[: buffer.rfind(b"\n") + 1]
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=32, help="Number of observers to connect")
+    parser.add_argument("--slow", type=int, default=2, help="Observers that never read (stalled links)")
+    parser.add_argument("--rate", type=float, default=200.0, help="Samples published per second")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds to publish for")
+    parser.add_argument(
+        "--wire-format",
+        choices=[fmt.value for fmt in WireFormat],
+        default=WireFormat.JSON.value,
+        help="Framing negotiated by every observer",
+    )
+    args = parser.parse_args(argv)
+
+    server = SerialBridgeServer(_StubReader(), config=SerialBridgeConfig(host="127.0.0.1", port=0))
+    server.start()
+    deadline = time.monotonic() + 2.0
+    while server.server_address is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    address = server.server_address
+    if address is None:
+        print("Bridge failed to start", file=sys.stderr)
+        return 1
+
+    pool = _ObserverPool(address, args.clients, WireFormat.parse(args.wire_format), args.slow)
+    pool.start()
+    time.sleep(0.2)
+
+    sample = SensorSample(1001, 120.0, -80.0, 1.5, -2.25, 45.0, 42.0, 11.8)
+    line = '{"T":1001,"L":120,"R":-80,"r":1.50,"p":-2.25,"y":45.00,"temp":42.0,"v":11.80}'
+    period = 1.0 / args.rate
+    published = 0
+    publish_time = 0.0
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    next_tick = start
+    while time.perf_counter() - start < args.duration:
+        tick = time.perf_counter()
+        server.publish_serial_line(line)
+        server.publish_sample(sample)
+        publish_time += time.perf_counter() - tick
+        published += 1
+        next_tick += period
+        delay = next_tick - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - cpu_start
+    time.sleep(0.5)
+
+    stats = server.client_stats()
+    pool.stop()
+    server.stop()
+
+    expected = published * 2
+    healthy = [count for index, count in pool.received.items() if index >= args.slow]
+    print(f"clients={args.clients} slow={args.slow} format={args.wire_format}")
+    print(f"published {published} samples in {elapsed:.2f}s ({published / elapsed:.0f} Hz)")
+    print(f"publish call cost: {publish_time / max(1, published) * 1e6:.1f} us per sample")
+    print(f"process CPU: {cpu:.2f}s ({100.0 * cpu / elapsed:.0f}% of one core, observers included)")
+    if healthy:
+        print(
+            f"healthy observers received {min(healthy)}..{max(healthy)} of {expected} frames"
+        )
+    dropped = sum(stat.dropped_frames for stat in stats)
+    worst_lag = max((stat.lag_seconds for stat in stats), default=0.0)
+    print(f"server dropped {dropped} frames, worst lag {worst_lag * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
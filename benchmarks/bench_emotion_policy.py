@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Compare scalar and vectorized ``EmotionPolicy`` evaluation on long logs.
+
+The scalar path calls ``EmotionPolicy.choose`` once per ``SensorSample``,
+chaining ``current`` and ``previous`` like the face controller; the batch
+path hands the roll/pitch/yaw columns to ``EmotionPolicy.choose_batch`` in
+one call.  Every emotion must match exactly, both from the default start and
+from a custom ``current`` emotion that is held until the first alert or tilt.
+
+Columns come from a recorded telemetry log or, by default, from a synthetic
+feed of ``--samples`` IMU readings (random-walk motion with occasional
+shakes, float32-rounded like recorded data)::
+
+    python benchmarks/bench_emotion_policy.py --samples 1000000
+    python benchmarks/bench_emotion_policy.py --log logs/run-01.axlog
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List
+
+import numpy as np
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from robot_control.emotion_policy import EmotionPolicy
+from robot_control.sensor_data import SensorSample, get_calibration_offsets
+from robot_control.telemetry_replay import TelemetryLog
+
+
+def _synthetic_columns(count: int, seed: int) -> Dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    offsets = get_calibration_offsets()
+    columns: Dict[str, np.ndarray] = {}
+    for axis, scale in (("roll", 0.8), ("pitch", 0.6), ("yaw", 1.5)):
+        walk = np.cumsum(rng.normal(0.0, scale, count))
+        # Pull the walk back towards rest so every emotion band is visited.
+        walk -= np.convolve(walk, np.ones(400) / 400.0, mode="same")
+        shakes = rng.random(count) < 0.002
+        walk[shakes] += rng.normal(0.0, 25.0, int(shakes.sum()))
+        columns[axis] = (offsets[axis] + walk).astype(np.float32).astype(np.float64)
+    return columns
+
+
+def _scalar(policy: EmotionPolicy, samples: List[SensorSample], current: str | None) -> List[str]:
+    choose = policy.choose
+    previous = None
+    results = []
+    append = results.append
+    for sample in samples:
+        current = choose(sample, current=current, previous=previous)
+        append(current)
+        previous = sample
+    return results
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=1_000_000, help="Synthetic samples to evaluate")
+    parser.add_argument("--log", metavar="PATH", help="Evaluate the columns of a recorded telemetry log instead")
+    parser.add_argument("--repeat", type=int, default=5, help="Batch runs to time (best is reported)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the synthetic feed")
+    args = parser.parse_args(argv)
+
+    if args.log:
+        with TelemetryLog(args.log) as log:
+            columns = log.columns()
+    else:
+        columns = _synthetic_columns(args.samples, args.seed)
+    roll, pitch, yaw = columns["roll"], columns["pitch"], columns["yaw"]
+    count = len(roll)
+    if not count:
+        print("No samples to evaluate", file=sys.stderr)
+        return 1
+    samples = [
+        SensorSample(1001, 0.0, 0.0, r, p, y, 0.0, 0.0)
+        for r, p, y in zip(roll.tolist(), pitch.tolist(), yaw.tolist())
+    ]
+
+    policy = EmotionPolicy()
+    print(f"samples: {count}")
+    for current in (None, "sleepy"):
+        start = time.perf_counter()
+        expected = _scalar(policy, samples, current)
+        scalar_time = time.perf_counter() - start
+
+        batch_time = float("inf")
+        for _ in range(max(1, args.repeat)):
+            start = time.perf_counter()
+            codes = policy.choose_batch(roll, pitch, yaw, current=current)
+            batch_time = min(batch_time, time.perf_counter() - start)
+        labels = np.array(policy.labels(current))
+        mismatches = int(np.count_nonzero(labels[codes] != np.array(expected)))
+
+        distribution = ", ".join(
+            f"{name}={np.count_nonzero(codes == code) / count:.1%}"
+            for code, name in enumerate(policy.labels(current))
+            if np.count_nonzero(codes == code)
+        )
+        print(f"start={current or 'none'}: {distribution}")
+        print(f"  scalar {scalar_time * 1e3:9.1f} ms ({scalar_time * 1e9 / count:6.1f} ns/sample)")
+        print(f"  batch  {batch_time * 1e3:9.1f} ms ({batch_time * 1e9 / count:6.1f} ns/sample)  {scalar_time / batch_time:5.1f}x")
+        print(f"  mismatches: {mismatches}")
+        if mismatches:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Compare face paint times with and without the cached static layers.
+
+Both face styles are rendered offscreen into a ``QImage`` at the requested
+resolution (the robot's fullscreen display by default).  Each frame advances
+the idle animation once so blinks, breathing and the HUD scan line move as
+they do on the robot.  Run with ``QT_QPA_PLATFORM=offscreen`` on a headless box.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from typing import List, Tuple
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from PySide6.QtGui import QImage
+from PySide6.QtWidgets import QApplication
+
+from axon_ui.face_widget import RoboticFaceWidget
+from axon_ui.face_widget_robotic import RoboticFaceWidget as HudFaceWidget
+from axon_ui.frame_stats import PercentileSummary, RollingPercentiles
+
+WIDGETS = {
+    "classic": RoboticFaceWidget,
+    "hud": HudFaceWidget,
+}
+
+
+def _parse_size(text: str) -> Tuple[int, int]:
+    width, _, height = text.lower().partition("x")
+    return int(width), int(height)
+
+
+def _measure(widget, image: QImage, frames: int, cached: bool) -> PercentileSummary:
+    widget.set_static_layer_caching(cached)
+    stats = RollingPercentiles(capacity=frames)
+    widget.render(image)  # warm-up, builds the cached layers
+    for _ in range(frames):
+        widget._update_idle()
+        start = time.perf_counter()
+        widget.render(image)
+        stats.add(time.perf_counter() - start)
+    return stats.summary().scaled(1000.0)
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=_parse_size, default=(800, 480), help="Widget size as WIDTHxHEIGHT")
+    parser.add_argument("--dpr", type=float, default=1.0, help="Device pixel ratio of the target image")
+    parser.add_argument("--frames", type=int, default=300, help="Frames rendered per configuration")
+    parser.add_argument("--widget", choices=sorted(WIDGETS), nargs="+", default=sorted(WIDGETS))
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    width, height = args.size
+    image = QImage(round(width * args.dpr), round(height * args.dpr), QImage.Format.Format_RGB32)
+    image.setDevicePixelRatio(args.dpr)
+
+    print(f"{width}x{height} @ {args.dpr:g}x, {args.frames} frames")
+    print(f"{'widget':>8} {'uncached p50':>13} {'cached p50':>11} {'uncached p95':>13} {'cached p95':>11} {'saved':>7}")
+    for name in args.widget:
+        widget = WIDGETS[name]()
+        widget.resize(width, height)
+        uncached = _measure(widget, image, args.frames, cached=False)
+        cached = _measure(widget, image, args.frames, cached=True)
+        saved = (1.0 - cached.p50 / uncached.p50) * 100.0 if uncached.p50 else 0.0
+        print(
+            f"{name:>8} {uncached.p50:>10.3f} ms {cached.p50:>8.3f} ms "
+            f"{uncached.p95:>10.3f} ms {cached.p95:>8.3f} ms {saved:>6.1f}%"
+        )
+        widget.deleteLater()
+    app.processEvents()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""Benchmark full face renders per style, resolution, emotion and animation state.
+
+Every combination of face style (classic, HUD), resolution (the robot's
+800x480 display, 1080p and 4K by default) and emotion preset is rendered
+offscreen in three scenarios:
+
+``steady``
+    the emotion fully blended in, blinks suppressed;
+``transition``
+    the face alternates between ``neutral`` and the emotion every half
+    second, so every measured frame is mid-blend;
+``blink``
+    the emotion held while a new blink starts as soon as the previous one
+    ends.
+
+Each result reports frames per second and p50/p95/p99 render times from a
+timed pass, and Python heap allocations from a separate ``tracemalloc`` pass:
+``alloc_peak_bytes`` is the mean high-water mark allocated during one render
+and ``retained_blocks`` the mean change in live allocated blocks per frame
+(non-zero means the draw path keeps objects alive).  Qt's own C++ allocations
+are not visible to either.
+
+``--json results.json`` writes everything in machine-readable form; pass an
+earlier file as ``--baseline`` to print the fps change per configuration::
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_face_render.py --json before.json
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_face_render.py --baseline before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Tuple
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import PySide6
+from PySide6.QtCore import qVersion
+from PySide6.QtGui import QImage
+from PySide6.QtWidgets import QApplication
+
+from axon_ui.face_widget import RoboticFaceWidget
+from axon_ui.face_widget_robotic import RoboticFaceWidget as HudFaceWidget
+from axon_ui.frame_stats import RollingPercentiles
+
+STYLES = {
+    "classic": RoboticFaceWidget,
+    "hud": HudFaceWidget,
+}
+SIZES = {
+    "robot": (800, 480),
+    "1080p": (1920, 1080),
+    "4k": (3840, 2160),
+}
+SCENARIOS = ("steady", "transition", "blink")
+
+FRAME_DT = 1.0 / 60.0
+TRANSITION_PERIOD = 0.5
+
+
+@dataclass(slots=True)
+class RenderResult:
+    style: str
+    size: str
+    width: int
+    height: int
+    emotion: str
+    scenario: str
+    frames: int
+    fps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    alloc_peak_bytes: float
+    retained_blocks: float
+
+    @property
+    def key(self) -> Tuple[str, str, str, str]:
+        return self.style, self.size, self.emotion, self.scenario
+
+
+def _parse_size(text: str) -> Tuple[str, Tuple[int, int]]:
+    if text.lower() in SIZES:
+        return text.lower(), SIZES[text.lower()]
+    width, _, height = text.lower().partition("x")
+    return text, (int(width), int(height))
+
+
+# ----------------------------------------------------------------------
+# Scenarios
+# ----------------------------------------------------------------------
+def _prepare(widget, emotion: str, scenario: str) -> Callable[[], None]:
+    """Put *widget* into *scenario* for *emotion* and return its per-frame step."""
+
+    widget.set_emotion(emotion)
+    widget.advance(2.0)  # settle the blend and any running blink
+    widget._blinking = False
+
+    if scenario == "steady":
+        widget._next_blink_at = math.inf
+
+        def step() -> None:
+            widget.advance(FRAME_DT)
+
+        return step
+
+    if scenario == "transition":
+        widget._next_blink_at = math.inf
+        targets = ("neutral", emotion) if emotion != "neutral" else ("happy", emotion)
+        clock = [0.0]
+        widget.set_emotion(targets[0])
+
+        def step() -> None:
+            clock[0] += FRAME_DT
+            widget.set_emotion(targets[int(clock[0] / TRANSITION_PERIOD) % 2])
+            widget.advance(FRAME_DT)
+
+        return step
+
+    def step() -> None:
+        if not widget._blinking:
+            widget._time_since_blink = widget._next_blink_at + FRAME_DT
+        widget.advance(FRAME_DT)
+
+    return step
+
+
+def _run(widget, image: QImage, step: Callable[[], None], frames: int, alloc_frames: int) -> Tuple[float, ...]:
+    stats = RollingPercentiles(capacity=frames)
+    started = time.perf_counter()
+    for _ in range(frames):
+        step()
+        start = time.perf_counter()
+        widget.render(image)
+        stats.add(time.perf_counter() - start)
+    elapsed = time.perf_counter() - started
+    summary = stats.summary().scaled(1000.0)
+
+    peak_total = 0
+    retained_total = 0
+    tracemalloc.start()
+    try:
+        for _ in range(alloc_frames):
+            step()
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            blocks = sys.getallocatedblocks()
+            widget.render(image)
+            retained_total += sys.getallocatedblocks() - blocks
+            peak_total += tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+    per_alloc_frame = max(alloc_frames, 1)
+    return (
+        frames / elapsed if elapsed else 0.0,
+        summary.p50,
+        summary.p95,
+        summary.p99,
+        peak_total / per_alloc_frame,
+        retained_total / per_alloc_frame,
+    )
+
+
+# ----------------------------------------------------------------------
+# Reporting
+# ----------------------------------------------------------------------
+def _metadata(args: argparse.Namespace) -> Dict[str, object]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "pyside6": PySide6.__version__,
+        "qt": qVersion(),
+        "platform": platform.platform(),
+        "qpa": QApplication.platformName(),
+        "frames": args.frames,
+        "alloc_frames": args.alloc_frames,
+        "seed": args.seed,
+        "path_cache": not args.no_path_cache,
+    }
+
+
+def _load_baseline(path: str) -> Dict[Tuple[str, str, str, str], float]:
+    with open(path, "r", encoding="utf-8") as handle:
+        data = json.load(handle)
+    return {
+        (entry["style"], entry["size"], entry["emotion"], entry["scenario"]): entry["fps"]
+        for entry in data["results"]
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--style", choices=sorted(STYLES), nargs="+", default=sorted(STYLES))
+    parser.add_argument(
+        "--size",
+        type=_parse_size,
+        nargs="+",
+        default=list(SIZES.items()),
+        help="Resolutions: robot, 1080p, 4k or WIDTHxHEIGHT",
+    )
+    parser.add_argument("--scenario", choices=SCENARIOS, nargs="+", default=list(SCENARIOS))
+    parser.add_argument("--emotion", nargs="+", default=None, help="Emotion presets to render (default: all)")
+    parser.add_argument("--frames", type=int, default=60, help="Timed frames per configuration")
+    parser.add_argument("--alloc-frames", type=int, default=10, help="Frames traced for allocations per configuration")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for blinks and HUD noise")
+    parser.add_argument("--no-path-cache", action="store_true", help="Rebuild every QPainterPath each frame")
+    parser.add_argument("--json", metavar="PATH", help="Write results as JSON to PATH ('-' for stdout)")
+    parser.add_argument("--baseline", metavar="PATH", help="Earlier --json output to compare fps against")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    baseline = _load_baseline(args.baseline) if args.baseline else {}
+    table = sys.stderr if args.json == "-" else sys.stdout
+
+    header = f"{'style':>7} {'size':>9} {'emotion':>10} {'scenario':>10} {'fps':>8} {'p95 ms':>8} {'alloc KiB':>9} {'retained':>8}"
+    if baseline:
+        header += f" {'vs base':>8}"
+    print(header, file=table)
+
+    results: List[RenderResult] = []
+    for style in args.style:
+        for size_name, (width, height) in args.size:
+            random.seed(args.seed)
+            widget = STYLES[style]()
+            widget.set_manual_clock(True)
+            widget.set_path_caching(not args.no_path_cache)
+            widget.resize(width, height)
+            image = QImage(width, height, QImage.Format.Format_RGB32)
+            widget.render(image)  # warm-up, builds the cached static layers
+            emotions = args.emotion or list(widget.available_emotions())
+            for emotion in emotions:
+                for scenario in args.scenario:
+                    step = _prepare(widget, emotion, scenario)
+                    measured = _run(widget, image, step, args.frames, args.alloc_frames)
+                    result = RenderResult(style, size_name, width, height, emotion, scenario, args.frames, *measured)
+                    results.append(result)
+                    line = (
+                        f"{style:>7} {size_name:>9} {emotion:>10} {scenario:>10} {result.fps:>8.1f} "
+                        f"{result.p95_ms:>8.2f} {result.alloc_peak_bytes / 1024.0:>9.1f} {result.retained_blocks:>8.1f}"
+                    )
+                    previous = baseline.get(result.key)
+                    if previous:
+                        line += f" {(result.fps / previous - 1.0) * 100.0:>+7.1f}%"
+                    print(line, file=table, flush=True)
+            widget.deleteLater()
+            app.processEvents()
+
+    if args.json:
+        document = {"meta": _metadata(args), "results": [asdict(result) for result in results]}
+        if args.json == "-":
+            json.dump(document, sys.stdout, indent=2)
+            sys.stdout.write("\n")
+        else:
+            with open(args.json, "w", encoding="utf-8") as handle:
+                json.dump(document, handle, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
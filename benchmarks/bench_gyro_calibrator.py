@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Measure ``GyroCalibrator.observe`` cost as the calibration window grows.
+
+The incremental calibrator is compared against the previous list-rebuilding
+implementation (kept here as a reference) on the same synthetic 100 Hz feed.
+Both must return identical results; per-sample cost of the incremental version
+should stay flat while the reference grows with ``window_seconds``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from collections import deque
+from statistics import mean
+from typing import List, Sequence, Tuple
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from robot_control.gyro_calibrator import GyroCalibrator
+from robot_control.sensor_data import SensorSample, get_calibration_offsets, set_calibration_offsets
+
+
+class _ReferenceCalibrator(GyroCalibrator):
+    """The original O(window) statistics, used to validate and compare."""
+
+    def __init__(self, window_seconds: float) -> None:
+        super().__init__(window_seconds)
+        self._plain: deque = deque()
+
+    def observe(self, sample: SensorSample, timestamp: float | None = None) -> bool:
+        if timestamp is None:
+            timestamp = sample.timestamp()
+        self._plain.append((timestamp, sample.roll, sample.pitch, sample.yaw))
+        while self._plain and (timestamp - self._plain[0][0]) > self._window:
+            self._plain.popleft()
+        if (timestamp - self._plain[0][0]) < self._window * 0.95:
+            return False
+        rolls = [s[1] for s in self._plain]
+        pitches = [s[2] for s in self._plain]
+        yaws = [s[3] for s in self._plain]
+        if not (
+            (max(rolls) - min(rolls) <= self._roll_threshold)
+            and (max(pitches) - min(pitches) <= self._pitch_threshold)
+            and (max(yaws) - min(yaws) <= self._yaw_threshold)
+        ):
+            return False
+        # The original rebuilt the lists a second time for the mean.
+        rolls = [s[1] for s in self._plain]
+        pitches = [s[2] for s in self._plain]
+        yaws = [s[3] for s in self._plain]
+        offsets = (mean(rolls), mean(pitches), mean(yaws))
+        if self._current_offsets and self._offsets_close(offsets, self._current_offsets):
+            return False
+        self._current_offsets = offsets
+        set_calibration_offsets(roll=offsets[0], pitch=offsets[1], yaw=offsets[2])
+        return True
+
+
+def _make_feed(count: int, rate_hz: float, seed: int) -> List[Tuple[SensorSample, float]]:
+    """Mostly still robot with occasional bumps and slow drift."""
+
+    rng = random.Random(seed)
+    feed = []
+    drift = 0.0
+    for index in range(count):
+        drift += rng.uniform(-0.002, 0.002)
+        bump = rng.uniform(-5.0, 5.0) if rng.random() < 0.002 else 0.0
+        sample = SensorSample(
+            1001,
+            0.0,
+            0.0,
+            5.4 + drift + bump + rng.uniform(-0.2, 0.2),
+            -12.2 + drift + rng.uniform(-0.2, 0.2),
+            166.4 + drift + rng.uniform(-0.4, 0.4),
+            40.0,
+            12.0,
+        )
+        feed.append((sample, index / rate_hz))
+    return feed
+
+
+def _run(calibrator: GyroCalibrator, feed: Sequence[Tuple[SensorSample, float]]) -> Tuple[float, List[bool]]:
+    results = []
+    observe = calibrator.observe
+    start = time.perf_counter()
+    for sample, timestamp in feed:
+        results.append(observe(sample, timestamp))
+    return time.perf_counter() - start, results
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=30_000, help="Samples fed per window size")
+    parser.add_argument("--rate", type=float, default=100.0, help="Synthetic sample rate in Hz")
+    parser.add_argument(
+        "--windows",
+        type=float,
+        nargs="+",
+        default=[1.0, 3.0, 10.0, 30.0],
+        help="window_seconds values to test",
+    )
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for the synthetic feed")
+    args = parser.parse_args(argv)
+
+    feed = _make_feed(args.samples, args.rate, args.seed)
+    saved_offsets = get_calibration_offsets()
+    print(f"{'window':>8} {'samples/win':>12} {'reference':>14} {'incremental':>14} {'speed-up':>9}")
+    try:
+        for window in args.windows:
+            ref_time, ref_results = _run(_ReferenceCalibrator(window), feed)
+            ref_offsets = get_calibration_offsets()
+            inc_calibrator = GyroCalibrator(window)
+            inc_time, inc_results = _run(inc_calibrator, feed)
+            inc_offsets = get_calibration_offsets()
+            if ref_results != inc_results:
+                print(f"Mismatch in observe() results for window={window}", file=sys.stderr)
+                return 1
+            if any(abs(ref_offsets[key] - inc_offsets[key]) > 1e-9 for key in ref_offsets):
+                print(f"Offsets diverged for window={window}", file=sys.stderr)
+                return 1
+            ref_us = ref_time / len(feed) * 1e6
+            inc_us = inc_time / len(feed) * 1e6
+            print(
+                f"{window:>7.1f}s {int(window * args.rate):>12} {ref_us:>11.2f} us "
+                f"{inc_us:>11.2f} us {ref_us / inc_us:>8.1f}x"
+            )
+    finally:
+        set_calibration_offsets(**saved_offsets)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
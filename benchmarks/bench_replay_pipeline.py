@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""Replay a telemetry log at maximum speed through ingest, policy and bridge.
+
+``ReplayReader`` releases the log's records as fast as the pipeline accepts
+them.  Two passes are timed:
+
+``ingest``
+    the replay thread alone: decode, ring buffer, history and the raw line
+    mirror, with nothing draining the buffer;
+``pipeline``
+    the same replay while the main thread drains batches like
+    ``RobotRuntime``, runs every sample through ``GyroCalibrator`` and
+    ``FaceController`` (``EmotionPolicy`` plus rest detection) and publishes
+    the newest sample of each batch to a ``SerialBridgeServer`` with
+    ``--clients`` local observers, which also receive every raw line.
+
+Without a log path a synthetic one is recorded first (``--seconds`` at
+``--rate`` Hz of mixed rest, tilt and shake motion)::
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_replay_pipeline.py
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_replay_pipeline.py logs/run-01.axlog --clients 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import random
+import selectors
+import socket
+import sys
+import tempfile
+import threading
+import time
+from typing import List
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from PySide6.QtWidgets import QApplication
+
+from axon_ui.face_widget import RoboticFaceWidget
+from robot_control import EmotionPolicy, FaceController, GyroCalibrator, TelemetryStore
+from robot_control.sensor_data import SensorSample
+from robot_control.serial_bridge_config import SerialBridgeConfig
+from robot_control.serial_bridge_server import SerialBridgeServer
+from robot_control.telemetry_recorder import LogCompression, TelemetryRecorder
+from robot_control.telemetry_replay import MAX_SPEED, ReplayReader
+
+
+def _synthesize(path: str, seconds: float, rate: float, compression: LogCompression, seed: int) -> None:
+    """Record a log that alternates rest, slow tilts and shakes."""
+
+    rng = random.Random(seed)
+    gauss = rng.gauss
+    recorder = TelemetryRecorder(path, compression=compression)
+    recorder.start()
+    try:
+        for index in range(int(seconds * rate)):
+            t = index / rate
+            phase = int(t // 4.0) % 3
+            if phase == 0:
+                roll, pitch, yaw, speed = gauss(0.0, 0.2), gauss(0.0, 0.2), gauss(0.0, 0.3), 0.0
+            elif phase == 1:
+                roll, pitch, yaw, speed = 15.0 * math.sin(t), 8.0 * math.sin(0.5 * t), gauss(0.0, 1.0), 40.0
+            else:
+                roll, pitch, yaw = gauss(0.0, 12.0), gauss(0.0, 10.0), gauss(0.0, 20.0)
+                speed = rng.uniform(-120.0, 120.0)
+            recorder.record(
+                SensorSample(
+                    1001,
+                    speed,
+                    speed,
+                    5.42 + roll,
+                    -12.25 + pitch,
+                    166.39 + yaw,
+                    42.0 + gauss(0.0, 0.1),
+                    11.8 + gauss(0.0, 0.02),
+                    received_at=t,
+                )
+            )
+    finally:
+        recorder.stop()
+
+
+class _Observers:
+    """Drain local bridge clients from one thread and count the bytes received."""
+
+    def __init__(self, address, count: int) -> None:
+        self._selector = selectors.DefaultSelector()
+        self._stop = threading.Event()
+        self.received_bytes = 0
+        self._sockets: List[socket.socket] = []
+        for _ in range(count):
+            sock = socket.create_connection(address)
+            sock.setblocking(False)
+            self._sockets.append(sock)
+            self._selector.register(sock, selectors.EVENT_READ)
+        self._thread = threading.Thread(target=self._run, name="ReplayObservers", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            for key, _ in self._selector.select(timeout=0.05):
+                try:
+                    chunk = key.fileobj.recv(65536)
+                except BlockingIOError:
+                    continue
+                if not chunk:
+                    self._selector.unregister(key.fileobj)
+                    continue
+                self.received_bytes += len(chunk)
+
+    def close(self) -> None:
+        self._stop.set()
+        self._thread.join(timeout=2.0)
+        self._selector.close()
+        for sock in self._sockets:
+            sock.close()
+
+
+def _ingest(path: str, buffer_size: int) -> tuple[int, float]:
+    reader = ReplayReader(path, speed=MAX_SPEED, buffer_size=buffer_size, history=TelemetryStore())
+    reader.add_line_consumer(lambda _line: None)
+    start = time.perf_counter()
+    reader.start()
+    reader.wait_finished()
+    elapsed = time.perf_counter() - start
+    count = reader.received_count
+    reader.stop()
+    return count, elapsed
+
+
+def _pipeline(path: str, buffer_size: int, clients: int) -> dict:
+    reader = ReplayReader(path, speed=MAX_SPEED, buffer_size=buffer_size, history=TelemetryStore())
+    bridge = SerialBridgeServer(reader, config=SerialBridgeConfig(host="127.0.0.1", port=0))
+    bridge.start()
+    deadline = time.monotonic() + 2.0
+    while bridge.server_address is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    if bridge.server_address is None:
+        raise RuntimeError("Bridge failed to start")
+    observers = _Observers(bridge.server_address, clients)
+    time.sleep(0.2)
+
+    face = RoboticFaceWidget()
+    face.set_manual_clock(True)
+    controller = FaceController(face, EmotionPolicy())
+    calibrator = GyroCalibrator()
+    wake = threading.Event()
+    reader.add_sample_consumer(lambda _sample: wake.set())
+
+    processed = 0
+    batches = 0
+    emotions = set()
+    start = time.perf_counter()
+    reader.start()
+    while True:
+        finished = reader.finished
+        samples = reader.pop_batch()
+        if samples:
+            batches += 1
+            processed += len(samples)
+            for sample in samples:
+                calibrator.observe(sample)
+            controller.apply_samples(samples)
+            emotions.add(controller.current_emotion)
+            bridge.publish_sample(samples[-1])
+        elif finished:
+            break
+        else:
+            wake.wait(0.01)
+            wake.clear()
+    elapsed = time.perf_counter() - start
+    time.sleep(0.3)
+
+    stats = bridge.client_stats()
+    result = {
+        "replayed": reader.received_count,
+        "processed": processed,
+        "overflow": reader.overflow_count,
+        "batches": batches,
+        "elapsed": elapsed,
+        "emotions": sorted(emotion for emotion in emotions if emotion),
+        "bridge_dropped": sum(stat.dropped_frames for stat in stats),
+        "observer_bytes": observers.received_bytes,
+    }
+    observers.close()
+    bridge.stop()
+    reader.stop()
+    face.deleteLater()
+    return result
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("log", nargs="?", help="Telemetry log to replay (default: synthesize one)")
+    parser.add_argument("--seconds", type=float, default=60.0, help="Length of the synthetic log")
+    parser.add_argument("--rate", type=float, default=200.0, help="Sample rate of the synthetic log in Hz")
+    parser.add_argument(
+        "--compression",
+        choices=[compression.value for compression in LogCompression],
+        default=LogCompression.NONE.value,
+        help="Chunk compression of the synthetic log",
+    )
+    parser.add_argument("--clients", type=int, default=4, help="Bridge observers to connect")
+    parser.add_argument("--buffer-size", type=int, default=4096, help="Replay ring buffer capacity")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the synthetic log")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    with tempfile.TemporaryDirectory() as scratch:
+        path = args.log
+        if path is None:
+            path = os.path.join(scratch, "synthetic.axlog")
+            _synthesize(path, args.seconds, args.rate, LogCompression.parse(args.compression), args.seed)
+
+        count, elapsed = _ingest(path, args.buffer_size)
+        print(f"log: {path if args.log else 'synthetic'} ({count} samples)")
+        print(f"ingest:   {count / elapsed:>10.0f} samples/s ({elapsed * 1e6 / max(count, 1):.1f} us per sample)")
+
+        result = _pipeline(path, args.buffer_size, args.clients)
+        app.processEvents()
+        rate = result["processed"] / result["elapsed"] if result["elapsed"] else 0.0
+        print(
+            f"pipeline: {rate:>10.0f} samples/s ({result['elapsed'] * 1e6 / max(result['processed'], 1):.1f} us per sample), "
+            f"{result['batches']} batches of {result['processed'] / max(result['batches'], 1):.1f}"
+        )
+        print(f"          {result['overflow']} samples overwritten before draining, emotions seen: {', '.join(result['emotions'])}")
+        print(
+            f"bridge:   {args.clients} observers received {result['observer_bytes'] / 1024.0:.0f} KiB, "
+            f"{result['bridge_dropped']} frames dropped"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Compare the 1001-frame fast path of ``SensorSample.from_json`` with the JSON path."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Callable, Sequence
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from robot_control.sensor_data import SensorSample
+
+
+def _make_lines(count: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(count):
+        lines.append(
+            '{"T":1001,"L":%d,"R":%d,"r":%.2f,"p":%.2f,"y":%.2f,"temp":%.1f,"v":%.2f}'
+            % (
+                rng.randint(-255, 255),
+                rng.randint(-255, 255),
+                rng.uniform(-40.0, 40.0),
+                rng.uniform(-40.0, 40.0),
+                rng.uniform(-180.0, 180.0),
+                rng.uniform(30.0, 60.0),
+                rng.uniform(10.5, 12.6),
+            )
+        )
+    return lines
+
+
+def _lines_per_second(parse: Callable[[str], SensorSample], lines: Sequence[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for line in lines:
+            parse(line)
+        best = min(best, time.perf_counter() - start)
+    return len(lines) / best
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=100_000, help="Number of frames per run")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per parser; the best is reported")
+    parser.add_argument("--seed", type=int, default=1001)
+    args = parser.parse_args(argv)
+
+    lines = _make_lines(args.lines, args.seed)
+    for line in lines[:1000]:
+        if SensorSample.from_json(line) != SensorSample._from_json_generic(line):
+            print(f"Mismatch between parsers for {line}", file=sys.stderr)
+            return 1
+
+    generic = _lines_per_second(SensorSample._from_json_generic, lines, args.repeat)
+    fast = _lines_per_second(SensorSample.from_json, lines, args.repeat)
+    print(f"json.loads path : {generic:12,.0f} lines/s")
+    print(f"1001 fast path  : {fast:12,.0f} lines/s")
+    print(f"speed-up        : {fast / generic:12.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Stress-test ``SerialReadWriter`` against the pty firmware simulator.
+
+For each ``--rates`` value a :class:`FirmwareSimulator` runs in a child
+process (so it does not share the reader's GIL) and streams ``T:1001``
+frames into a pty.  The parent opens the pty with ``SerialReadWriter``,
+drains it every ``--drain-ms`` like ``RobotRuntime`` and, with
+``--clients``, mirrors lines and samples through a ``SerialBridgeServer``
+to local observers.  Each row reports the frames the simulator sent or
+dropped because the pty was full, the frames the reader decoded, ring-buffer
+overwrites, and the reader process's CPU time::
+
+    python benchmarks/bench_serial_reader.py --rates 100 1000 2000 5000 --clients 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import selectors
+import socket
+import sys
+import threading
+import time
+from typing import List
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from robot_control.firmware_simulator import FirmwareSimulator, NoiseProfile
+from robot_control.serial_bridge_config import SerialBridgeConfig
+from robot_control.serial_bridge_server import SerialBridgeServer
+from robot_control.serial_reader import SerialReadWriter
+
+
+def _simulate(conn, rate: float, profile: str, seed: int) -> None:
+    with FirmwareSimulator(rate=rate, profile=NoiseProfile.parse(profile), seed=seed, feedback=False) as simulator:
+        conn.send(simulator.port)
+        conn.recv()  # reader is open: start streaming
+        simulator.set_feedback(True)
+        conn.recv()  # measurement over
+        conn.send(simulator.stats)
+        conn.recv()  # reader closed: safe to hang up the pty
+
+
+class _Observers:
+    """Drain local bridge clients from one thread and count the bytes received."""
+
+    def __init__(self, address, count: int) -> None:
+        self._selector = selectors.DefaultSelector()
+        self._stop = threading.Event()
+        self.received_bytes = 0
+        self._sockets: List[socket.socket] = []
+        for _ in range(count):
+            sock = socket.create_connection(address)
+            sock.setblocking(False)
+            self._sockets.append(sock)
+            self._selector.register(sock, selectors.EVENT_READ)
+        self._thread = threading.Thread(target=self._run, name="ReaderObservers", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            for key, _ in self._selector.select(timeout=0.05):
+                try:
+                    chunk = key.fileobj.recv(65536)
+                except BlockingIOError:
+                    continue
+                if not chunk:
+                    self._selector.unregister(key.fileobj)
+                    continue
+                self.received_bytes += len(chunk)
+
+    def close(self) -> None:
+        self._stop.set()
+        self._thread.join(timeout=2.0)
+        self._selector.close()
+        for sock in self._sockets:
+            sock.close()
+
+
+def _measure(rate: float, args: argparse.Namespace) -> str:
+    parent, child = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=_simulate, args=(child, rate, args.profile, args.seed), daemon=True)
+    process.start()
+    port = parent.recv()
+
+    reader = SerialReadWriter(port, buffer_size=args.buffer_size)
+    bridge = observers = None
+    if args.clients:
+        bridge = SerialBridgeServer(reader, config=SerialBridgeConfig(host="127.0.0.1", port=0))
+        bridge.start()
+        while bridge.server_address is None:
+            time.sleep(0.01)
+        observers = _Observers(bridge.server_address, args.clients)
+    reader.start()
+    time.sleep(0.1)
+
+    drained = 0
+    cpu_start = time.process_time()
+    start = time.perf_counter()
+    parent.send("go")
+    while time.perf_counter() - start < args.duration:
+        time.sleep(args.drain_ms / 1000.0)
+        samples = reader.pop_batch()
+        drained += len(samples)
+        if bridge is not None and samples:
+            bridge.publish_sample(samples[-1])
+    parent.send("stop")
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - cpu_start
+    stats = parent.recv()
+    received = reader.received_count
+    overflow = reader.overflow_count
+    reader.stop()
+    parent.send("close")
+    process.join(timeout=2.0)
+    observed = ""
+    if bridge is not None and observers is not None:
+        dropped = sum(stat.dropped_frames for stat in bridge.client_stats())
+        observed = f" {observers.received_bytes / elapsed / 1024.0:>9.0f} {dropped:>8}"
+        observers.close()
+        bridge.stop()
+    return (
+        f"{rate:>8.0f} {stats.frames_sent / elapsed:>9.0f} {stats.frames_dropped / elapsed:>9.0f} "
+        f"{received / elapsed:>9.0f} {drained / elapsed:>9.0f} {overflow:>8} {100.0 * cpu / elapsed:>6.0f}%{observed}"
+    )
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rates", type=float, nargs="+", default=[100.0, 500.0, 1000.0, 2000.0, 5000.0])
+    parser.add_argument("--duration", type=float, default=3.0, help="Seconds to measure per rate")
+    parser.add_argument(
+        "--profile",
+        choices=[profile.value for profile in NoiseProfile],
+        default=NoiseProfile.DRIVING.value,
+        help="IMU noise profile of the simulated firmware",
+    )
+    parser.add_argument("--clients", type=int, default=0, help="Bridge observers to connect (0 disables the bridge)")
+    parser.add_argument("--drain-ms", type=float, default=16.0, help="Interval between buffer drains")
+    parser.add_argument("--buffer-size", type=int, default=512, help="Reader ring buffer capacity")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the simulated noise")
+    args = parser.parse_args(argv)
+
+    header = f"{'rate Hz':>8} {'sent/s':>9} {'pty drop':>9} {'read/s':>9} {'drain/s':>9} {'overflow':>8} {'cpu':>7}"
+    if args.clients:
+        header += f" {'KiB/s out':>9} {'dropped':>8}"
+    print(header)
+    for rate in args.rates:
+        print(_measure(rate, args), flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""Compile the OpenGL face shader on this machine's driver and optionally render it.
+
+Builds the shader ``GLFaceWidget`` uses on an offscreen OpenGL context,
+checks that every uniform the widget uploads is active, and with
+``--render`` draws each emotion into a framebuffer, failing when a frame
+shows nothing but the background::
+
+    python misc/check_face_shader.py
+    python misc/check_face_shader.py --render out/ --size 800x480
+
+Needs a platform with OpenGL (xcb, wayland, eglfs); ``offscreen`` and
+``minimal`` have none.  Exits with 0 on success, 1 when the shader fails to
+build or render and 2 when no OpenGL context can be created.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import re
+import sys
+from typing import List, Tuple
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from PySide6.QtGui import QColor, QImage, QOffscreenSurface, QOpenGLContext
+from PySide6.QtOpenGL import QOpenGLFramebufferObject, QOpenGLShaderProgram
+from PySide6.QtWidgets import QApplication
+
+from axon_ui import face_widget_gl
+from axon_ui.face_widget_gl import GLFaceWidget, build_face_program
+
+_GL_VENDOR = 0x1F00
+_GL_RENDERER = 0x1F01
+_GL_VERSION = 0x1F02
+
+# Frames with fewer pixels brighter than the background gradient than this are blank.
+_MIN_LIT_SHARE = 0.01
+_LIT_VALUE = 60
+
+
+def _parse_size(text: str) -> Tuple[int, int]:
+    width, _, height = text.lower().partition("x")
+    return int(width), int(height)
+
+
+def _uniform_names() -> List[str]:
+    return re.findall(r"uniform\s+\w+\s+(\w+)\s*;", face_widget_gl._VERTEX_SHADER + face_widget_gl._FRAGMENT_SHADER)
+
+
+def _lit_share(image: QImage, step: int = 4) -> float:
+    lit = total = 0
+    for y in range(0, image.height(), step):
+        for x in range(0, image.width(), step):
+            total += 1
+            lit += QColor(image.pixel(x, y)).value() > _LIT_VALUE
+    return lit / total if total else 0.0
+
+
+def _render(context: QOpenGLContext, program: QOpenGLShaderProgram, size: Tuple[int, int], directory: str) -> bool:
+    os.makedirs(directory, exist_ok=True)
+    face = GLFaceWidget()
+    face.set_manual_clock(True)
+    face.resize(*size)
+    face._next_blink_at = math.inf
+    scale = face.devicePixelRatioF()
+    target = QOpenGLFramebufferObject(round(size[0] * scale), round(size[1] * scale))
+    quad = face_widget_gl._quad_buffer()
+    functions = context.functions()
+    ok = True
+    try:
+        target.bind()
+        functions.glViewport(0, 0, target.width(), target.height())
+        for emotion in face.available_emotions():
+            face.set_emotion(emotion)
+            # Settle the blend; blinks are off so every frame has open eyes.
+            for _ in range(120):
+                face.advance(1.0 / 60.0)
+            face._draw(functions, program, quad)
+            image = target.toImage()
+            share = _lit_share(image)
+            path = os.path.join(directory, f"{emotion}.png")
+            image.save(path)
+            status = "ok" if share >= _MIN_LIT_SHARE else "BLANK"
+            print(f"{emotion:<10} {share * 100.0:5.1f}% lit  {status}  {path}")
+            ok = ok and share >= _MIN_LIT_SHARE
+    finally:
+        target.release()
+        quad.destroy()
+    return ok
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--render", metavar="DIR", help="Also render every emotion to DIR/<emotion>.png")
+    parser.add_argument("--size", type=_parse_size, default=(800, 480), help="Render size as WIDTHxHEIGHT")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    context = QOpenGLContext()
+    surface = QOffscreenSurface()
+    surface.setFormat(context.format())
+    surface.create()
+    if not context.create() or not context.makeCurrent(surface):
+        print(f"No OpenGL context on the '{app.platformName()}' platform; shader not checked", file=sys.stderr)
+        return 2
+
+    functions = context.functions()
+    print(
+        f"{functions.glGetString(_GL_RENDERER)} ({functions.glGetString(_GL_VENDOR)}), "
+        f"{functions.glGetString(_GL_VERSION)}, {'GLES' if context.isOpenGLES() else 'desktop'} header"
+    )
+    try:
+        program = build_face_program(context)
+    except RuntimeError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+
+    inactive = [name for name in _uniform_names() if program.uniformLocation(name) < 0]
+    if inactive:
+        print(f"Uniforms optimised out of the shader: {', '.join(inactive)}", file=sys.stderr)
+        return 1
+    print(f"Shader built; {len(_uniform_names())} uniforms active")
+
+    ok = True
+    if args.render:
+        ok = _render(context, program, args.size, args.render)
+    context.doneCurrent()
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Run a simulated robot firmware on a pseudo-terminal until interrupted.
+
+The script prints the pty path to open as the serial port (and optionally
+symlinks it to a stable name), then streams telemetry and answers UI
+commands like the real micro-controller::
+
+    python misc/firmware_simulator.py --rate 200 --profile driving --link /tmp/ttyAXON
+    python robot_main.py --serial-port /tmp/ttyAXON
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import signal
+import sys
+import threading
+from typing import List
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from robot_control.firmware_simulator import FirmwareSimulator, NoiseProfile
+
+LOGGER = logging.getLogger(__name__)
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rate", type=float, default=50.0, help="Telemetry frames per second")
+    parser.add_argument(
+        "--profile",
+        choices=[profile.value for profile in NoiseProfile],
+        default=NoiseProfile.BENCH.value,
+        help="IMU noise profile",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for the noise")
+    parser.add_argument("--no-feedback", action="store_true", help="Start with the telemetry stream off (as after T:131 cmd 0)")
+    parser.add_argument("--link", metavar="PATH", help="Symlink PATH to the pty for a stable port name")
+    parser.add_argument("--stats-interval", type=float, default=5.0, help="Seconds between statistics log lines")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s", stream=sys.stderr)
+    simulator = FirmwareSimulator(
+        rate=args.rate,
+        profile=NoiseProfile.parse(args.profile),
+        seed=args.seed,
+        feedback=not args.no_feedback,
+    )
+    if args.link:
+        if os.path.lexists(args.link):
+            os.remove(args.link)
+        os.symlink(simulator.port, args.link)
+    print(args.link or simulator.port, flush=True)
+
+    done = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: done.set())
+    signal.signal(signal.SIGTERM, lambda *_: done.set())
+    simulator.start()
+    try:
+        while not done.wait(args.stats_interval):
+            LOGGER.info("%s", simulator.stats)
+    finally:
+        simulator.close()
+        if args.link and os.path.islink(args.link):
+            os.remove(args.link)
+    LOGGER.info("%s", simulator.stats)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
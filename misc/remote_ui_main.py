@@ -9,6 +9,7 @@ from PySide6.QtWidgets import QApplication
 from axon_ros.osi import OsiLayer, OsiStack, describe_stack
 from axon_ros.runtime import RobotMainWindow
 from axon_ui import InfoPanel, RoboticFaceWidget, TelemetryPanel, apply_dark_palette
+from robot_control.bridge_protocol import Subscription, WireFormat
 from robot_control.remote_bridge import RemoteBridgeController
 
 DEFAULT_HOST = "192.168.1.169"
@@ -21,6 +22,18 @@ def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Remote Axon UI client")
     parser.add_argument("--host", default=DEFAULT_HOST, help="Robot IP address")
     parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Serial bridge port")
+    parser.add_argument(
+        "--wire-format",
+        choices=[wire_format.value for wire_format in WireFormat],
+        default=WireFormat.BINARY.value,
+        help="Telemetry encoding to negotiate with the bridge",
+    )
+    parser.add_argument(
+        "--telemetry-rate",
+        type=float,
+        default=0.0,
+        help="Ask the bridge to cap telemetry at this many Hz (0 = every sample)",
+    )
     args = parser.parse_args(argv if argv is not None else None)
 
     app = QApplication(sys.argv)
@@ -34,7 +47,13 @@ def main(argv: list[str] | None = None) -> int:
     info_panel.set_manual_entries(ip=f"Robot: {args.host}", wifi="Serial bridge")
     window = RobotMainWindow(face, (info_panel, telemetry))
 
-    controller = RemoteBridgeController(face, telemetry)
+    subscription = Subscription(rate_hz=args.telemetry_rate) if args.telemetry_rate > 0 else None
+    controller = RemoteBridgeController(
+        face,
+        telemetry,
+        wire_format=WireFormat(args.wire_format),
+        subscription=subscription,
+    )
     controller.connect_to(args.host, args.port)
 
     stack = OsiStack("Remote UI")
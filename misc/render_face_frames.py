@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Render the face from a telemetry capture to PNG frames or raw RGB video.
+
+The capture holds one serial line per telemetry frame, optionally prefixed
+with its receive time in seconds.  Frames are rendered offscreen on a virtual
+clock, so no display is needed and the run is faster than real time::
+
+    python misc/render_face_frames.py capture.log --png out/
+    python misc/render_face_frames.py capture.log --raw - | \\
+        ffmpeg -f rawvideo -pix_fmt rgb24 -s 800x480 -r 30 -i - face.mp4
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import random
+import sys
+import time
+from typing import List, Tuple
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from axon_ros.runtime import HeadlessFaceRenderer, load_telemetry
+from axon_ui.face_widget import RoboticFaceWidget
+from axon_ui.face_widget_robotic import RoboticFaceWidget as HudFaceWidget
+from robot_control import EmotionPolicy, FaceController
+
+LOGGER = logging.getLogger(__name__)
+
+STYLES = {
+    "classic": RoboticFaceWidget,
+    "hud": HudFaceWidget,
+}
+
+
+def _parse_size(text: str) -> Tuple[int, int]:
+    width, _, height = text.lower().partition("x")
+    return int(width), int(height)
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("capture", help="Telemetry capture, one serial line per frame")
+    output = parser.add_mutually_exclusive_group(required=True)
+    output.add_argument("--png", metavar="DIR", help="Write a numbered PNG sequence into DIR")
+    output.add_argument("--raw", metavar="FILE", help="Write packed RGB24 frames to FILE ('-' for stdout)")
+    parser.add_argument("--style", choices=sorted(STYLES), default="classic", help="Face style to render")
+    parser.add_argument("--size", type=_parse_size, default=(800, 480), help="Frame size as WIDTHxHEIGHT")
+    parser.add_argument("--fps", type=float, default=30.0, help="Output frames per second of telemetry time")
+    parser.add_argument(
+        "--sample-rate",
+        type=float,
+        default=50.0,
+        help="Spacing in Hz for capture lines without a timestamp",
+    )
+    parser.add_argument("--tail", type=float, default=1.0, help="Seconds to keep rendering after the last sample")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for blinks and HUD noise")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s", stream=sys.stderr)
+    samples = load_telemetry(args.capture, sample_rate=args.sample_rate)
+    if not samples:
+        LOGGER.error("No telemetry frames in %s", args.capture)
+        return 1
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    random.seed(args.seed)
+    face = STYLES[args.style]()
+    renderer = HeadlessFaceRenderer(face, FaceController(face, EmotionPolicy()), size=args.size, fps=args.fps)
+
+    start = time.perf_counter()
+    if args.png:
+        frames = renderer.render_png_sequence(samples, args.png, tail=args.tail)
+    elif args.raw == "-":
+        frames = renderer.render_raw(samples, sys.stdout.buffer, tail=args.tail)
+        sys.stdout.buffer.flush()
+    else:
+        with open(args.raw, "wb") as stream:
+            frames = renderer.render_raw(samples, stream, tail=args.tail)
+    elapsed = time.perf_counter() - start
+
+    duration = frames / args.fps
+    LOGGER.info(
+        "Rendered %d frames (%.1f s of telemetry) in %.2f s, %.1fx real time",
+        frames,
+        duration,
+        elapsed,
+        duration / elapsed if elapsed else float("inf"),
+    )
+    face.deleteLater()
+    app.processEvents()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
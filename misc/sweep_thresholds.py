@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Sweep emotion policy and rest-detection thresholds over recorded telemetry.
+
+Every combination of the ``--grid`` values is replayed over the given
+telemetry logs on a process pool, with the decisions ``FaceController``
+makes on the robot, and scored on UI churn (emotion flips and short-lived
+blips per minute), time-to-sleep after the last major movement and the
+latency of the alert emotion.  The default configuration is always included
+as the baseline (marked ``*``)::
+
+    python misc/sweep_thresholds.py logs/*.axlog \\
+        --grid pitch_threshold=15,20,25 --grid rest_delay=10:40:10 \\
+        --grid steady_roll_delta=1.5,2.5 --sort blips_per_minute --json sweep.json
+
+Parameter names are the numeric ``EmotionPolicy`` fields, the
+``MotionThresholds`` fields (the ``STEADY_*``/``MAJOR_*`` limits of
+``sensor_data``) and ``rest_delay``.  Pass a winning set to the robot as
+``FaceController(face, policy, rest_delay=..., thresholds=MotionThresholds(...))``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from typing import List
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from robot_control.threshold_sweep import SWEEP_PARAMETERS, SweepConfig, SweepResult, parse_grid, run_sweep
+
+_SORT_KEYS = (
+    "flips_per_minute",
+    "blips_per_minute",
+    "alerts_per_minute",
+    "time_to_sleep",
+    "alert_latency",
+    "alert_latency_p95",
+    "alert_missed",
+)
+
+
+def _format(value: float, width: int, precision: int) -> str:
+    return f"{'-':>{width}}" if math.isnan(value) else f"{value:>{width}.{precision}f}"
+
+
+def _row(result: SweepResult, baseline: bool) -> str:
+    return (
+        f"{result.flips_per_minute:>8.2f} {result.blips_per_minute:>8.2f} {result.alerts_per_minute:>8.2f} "
+        f"{result.sleeps:>6} {_format(result.time_to_sleep, 7, 1)} {_format(result.asleep_share * 100.0, 5, 1)}% "
+        f"{_format(result.alert_latency * 1e3, 7, 0)} {_format(result.alert_latency_p95 * 1e3, 7, 0)} "
+        f"{result.alert_missed:>4}/{result.alert_events:<4} {'*' if baseline else ' '} {result.config.label()}"
+    )
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("logs", nargs="+", metavar="LOG", help="Recorded telemetry logs (.axlog)")
+    parser.add_argument(
+        "--grid",
+        action="append",
+        default=[],
+        metavar="NAME=VALUES",
+        help="Values to sweep as V1,V2,... or START:STOP:STEP; repeat per parameter "
+        f"({', '.join(SWEEP_PARAMETERS)})",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per CPU)")
+    parser.add_argument("--offset", type=float, default=0.0, help="Skip this many seconds at the start of each log")
+    parser.add_argument("--blip-seconds", type=float, default=0.5, help="Emotions replaced within this many seconds count as blips")
+    parser.add_argument("--alert-window", type=float, default=2.0, help="Seconds after an alert onset before it counts as missed")
+    parser.add_argument(
+        "--check",
+        type=int,
+        default=2000,
+        metavar="SAMPLES",
+        help="Cross-check this many samples per log against EmotionStateMachine (0 disables)",
+    )
+    parser.add_argument("--sort", choices=_SORT_KEYS, default="flips_per_minute", help="Metric to rank by (lowest first)")
+    parser.add_argument("--top", type=int, default=0, help="Only print the best N configurations")
+    parser.add_argument("--json", metavar="PATH", help="Write every result as JSON to PATH ('-' for stdout)")
+    args = parser.parse_args(argv)
+
+    try:
+        configs = parse_grid(args.grid)
+    except ValueError as exc:
+        parser.error(str(exc))
+    baseline = SweepConfig()
+    if baseline not in configs:
+        configs.insert(0, baseline)
+
+    start = time.perf_counter()
+    results = run_sweep(
+        args.logs,
+        configs,
+        workers=args.workers,
+        offset=args.offset,
+        blip_seconds=args.blip_seconds,
+        alert_window=args.alert_window,
+        check_samples=args.check,
+    )
+    elapsed = time.perf_counter() - start
+
+    def rank(result: SweepResult) -> float:
+        value = float(getattr(result, args.sort))
+        return math.inf if math.isnan(value) else value
+
+    ranked = sorted(results, key=rank)
+    shown = ranked[: args.top] if args.top > 0 else ranked
+    first = results[0]
+    print(
+        f"{len(results)} configurations over {len(args.logs)} log(s), {first.samples} samples, "
+        f"{first.duration / 60.0:.1f} min of telemetry in {elapsed:.1f}s"
+    )
+    print(
+        f"{'flips/m':>8} {'blips/m':>8} {'alerts/m':>8} {'sleeps':>6} {'sleep s':>7} {'asleep':>6} "
+        f"{'lat ms':>7} {'p95 ms':>7} {'missed':>9}   configuration"
+    )
+    for result in shown:
+        print(_row(result, result.config == baseline))
+
+    if args.json:
+        payload = json.dumps([result.as_dict() for result in ranked], indent=2)
+        if args.json == "-":
+            print(payload)
+        else:
+            with open(args.json, "w", encoding="utf-8") as handle:
+                handle.write(payload + "\n")
+
+    mismatched = [result for result in results if result.mismatches]
+    for result in mismatched:
+        print(
+            f"warning: {result.mismatches} samples differ from EmotionStateMachine for {result.config.label()}",
+            file=sys.stderr,
+        )
+    return 1 if mismatched else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
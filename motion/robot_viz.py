@@ -12,6 +12,7 @@ from OpenGL.GLU import *
 # Add parent directory to path to import from robot_control
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from robot_control.bridge_protocol import Subscription, WireFormat
 from robot_control.remote_bridge import RemoteBridgeController, DEFAULT_BRIDGE_HOST, DEFAULT_BRIDGE_PORT
 from robot_control.sensor_data import SensorSample
 
@@ -191,7 +192,13 @@ class RobotVizWindow(QMainWindow):
         # Setup RemoteBridgeController
         self.dummy_face = DummyFaceWidget()
         self.dummy_panel = DummyTelemetryPanel()
-        self.controller = RemoteBridgeController(self.dummy_face, self.dummy_panel)
+        # The 3D view only needs ~30 Hz pose updates and never shows the raw log.
+        self.controller = RemoteBridgeController(
+            self.dummy_face,
+            self.dummy_panel,
+            wire_format=WireFormat.BINARY,
+            subscription=Subscription(rate_hz=30.0, raw=False),
+        )
         
         # Connect signals
         self.controller.connectionStateChanged.connect(self.on_connection_state_changed)
@@ -1,20 +1,36 @@
 """Runtime utilities for connecting Axon's sensors to the robotic face."""
 
+from .sample_buffer import SampleRingBuffer
 from .sensor_data import SensorSample
-from .serial_reader import SerialReadWriter, SerialReader
+from .serial_reader import SampleSource, SerialReadWriter, SerialReader
 from .emotion_policy import EmotionPolicy
+from .emotion_state import EmotionStateMachine, MotionThresholds
 from .face_controller import FaceController
 from .gyro_calibrator import GyroCalibrator
 from .serial_bridge_config import SerialBridgeConfig
-from .serial_bridge_server import SerialBridgeServer
+from .serial_bridge_server import BridgeClientStats, SerialBridgeServer
+from .telemetry_recorder import LogCompression, RecorderStats, TelemetryRecorder
+from .telemetry_replay import ReplayReader, TelemetryLog
+from .telemetry_store import TelemetryStore
 
 __all__ = [
+    "SampleRingBuffer",
     "SensorSample",
+    "SampleSource",
     "SerialReadWriter",
     "SerialReader",
     "EmotionPolicy",
+    "EmotionStateMachine",
+    "MotionThresholds",
     "FaceController",
     "GyroCalibrator",
     "SerialBridgeConfig",
     "SerialBridgeServer",
+    "BridgeClientStats",
+    "LogCompression",
+    "RecorderStats",
+    "TelemetryRecorder",
+    "ReplayReader",
+    "TelemetryLog",
+    "TelemetryStore",
 ]
@@ -0,0 +1,257 @@
+"""Wire formats spoken by the TCP serial bridge.
+
+Every client starts in the legacy newline-delimited text format: raw serial
+lines are forwarded verbatim and structured telemetry is sent as
+``telemetry {json}``.  A client may send ``format binary`` to switch its
+server-to-client stream to length-prefixed frames::
+
+    <u16 payload length><u8 version><u8 kind><payload>
+
+``kind`` is either :data:`FRAME_TELEMETRY`, whose payload is a fixed
+little-endian struct of the :class:`SensorSample` fields, or
+:data:`FRAME_TEXT`, whose payload is a UTF-8 line without its newline.  The
+server acknowledges the switch with a final text line (``ok: format binary``)
+so clients know exactly where the framed stream begins.  Commands sent by
+clients are always newline-delimited text.
+
+Clients may also narrow what they receive with ``subscribe``, e.g.
+``subscribe telemetry rate=30 raw=off``: telemetry is decimated to at most
+``rate`` frames per second (the newest sample wins) and raw serial lines are
+suppressed.  The server confirms with ``ok: subscribe ...`` echoing the
+effective settings.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import struct
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, Iterator, Tuple
+
+from .sensor_data import SensorSample
+
+PROTOCOL_VERSION = 1
+
+FRAME_TELEMETRY = 1
+FRAME_TEXT = 2
+
+TELEMETRY_PREFIX = "telemetry "
+FORMAT_COMMAND = "format"
+SUBSCRIBE_COMMAND = "subscribe"
+
+FRAME_HEADER = struct.Struct("<HBB")
+TELEMETRY_STRUCT = struct.Struct("<h7f")
+_FLOAT32_MAX = 3.4028234663852886e38
+
+TELEMETRY_FIELDS: Tuple[str, ...] = (
+    "message_type",
+    "left_speed",
+    "right_speed",
+    "roll",
+    "pitch",
+    "yaw",
+    "temperature_c",
+    "voltage_v",
+)
+
+_MAX_PAYLOAD = 0xFFFF
+
+
+class WireFormat(Enum):
+    """Server-to-client encodings a bridge client can negotiate."""
+
+    JSON = "json"
+    BINARY = "binary"
+
+    @classmethod
+    def parse(cls, value: str) -> "WireFormat":
+        try:
+            return cls(value.strip().lower())
+        except ValueError:
+            choices = ", ".join(member.value for member in cls)
+            raise ValueError(f"Unknown wire format '{value}'. Available: {choices}") from None
+
+
+def format_command(wire_format: WireFormat) -> str:
+    """Return the command a client sends to request *wire_format*."""
+
+    return f"{FORMAT_COMMAND} {wire_format.value}"
+
+
+def format_ack(wire_format: WireFormat) -> str:
+    """Return the line the server sends once *wire_format* is active."""
+
+    return f"ok: {FORMAT_COMMAND} {wire_format.value}"
+
+
+_SWITCHES = {"on": True, "off": False, "1": True, "0": False, "true": True, "false": False}
+
+
+@dataclass(slots=True, frozen=True)
+class Subscription:
+    """What a bridge client wants to receive and how often.
+
+    ``rate_hz`` caps structured telemetry frames per second; ``0`` forwards every
+    sample.  ``raw`` controls whether verbatim serial lines are mirrored.
+    """
+
+    telemetry: bool = True
+    rate_hz: float = 0.0
+    raw: bool = True
+
+    @classmethod
+    def parse(cls, argument: str) -> "Subscription":
+        """Parse the arguments of a ``subscribe`` command.
+
+        Bare ``telemetry``/``raw`` tokens enable that stream and ``key=value``
+        pairs set ``telemetry``, ``raw`` (on/off) or ``rate`` (Hz).  Unspecified
+        options keep their defaults.
+        """
+
+        options = {"telemetry": True, "rate_hz": 0.0, "raw": True}
+        for token in argument.split():
+            key, sep, value = token.lower().partition("=")
+            if not sep:
+                if key not in ("telemetry", "raw"):
+                    raise ValueError(f"Unknown subscription option '{token}'")
+                options[key] = True
+            elif key == "rate":
+                try:
+                    rate = float(value)
+                except ValueError:
+                    raise ValueError(f"Invalid rate '{value}'") from None
+                if rate < 0 or rate != rate:
+                    raise ValueError(f"Invalid rate '{value}'")
+                options["rate_hz"] = rate
+            elif key in ("telemetry", "raw"):
+                if value not in _SWITCHES:
+                    raise ValueError(f"Invalid value '{value}' for {key}; use on/off")
+                options[key] = _SWITCHES[value]
+            else:
+                raise ValueError(f"Unknown subscription option '{token}'")
+        return cls(**options)
+
+    @property
+    def min_interval(self) -> float:
+        """Seconds between telemetry frames, or ``0`` when unthrottled."""
+
+        return 1.0 / self.rate_hz if self.rate_hz > 0 else 0.0
+
+    def describe(self) -> str:
+        rate = f"{self.rate_hz:g}"
+        return (
+            f"telemetry={'on' if self.telemetry else 'off'} "
+            f"rate={rate} raw={'on' if self.raw else 'off'}"
+        )
+
+
+def subscribe_command(subscription: Subscription) -> str:
+    """Return the command a client sends to apply *subscription*."""
+
+    return f"{SUBSCRIBE_COMMAND} {subscription.describe()}"
+
+
+def subscribe_ack(subscription: Subscription) -> str:
+    """Return the line the server sends once *subscription* is active."""
+
+    return f"ok: {SUBSCRIBE_COMMAND} {subscription.describe()}"
+
+
+# ----------------------------------------------------------------------
+# Encoding
+# ----------------------------------------------------------------------
+def encode_telemetry(sample: SensorSample, wire_format: WireFormat, encoding: str = "utf-8") -> bytes:
+    """Serialize *sample* for a client using *wire_format*.
+
+    Binary frames carry float32 readings; values beyond that range are sent
+    as infinities.  Raises :class:`ValueError` when the message type does not
+    fit the frame.
+    """
+
+    if wire_format is WireFormat.BINARY:
+        try:
+            payload = TELEMETRY_STRUCT.pack(
+                sample.message_type,
+                _float32(sample.left_speed),
+                _float32(sample.right_speed),
+                _float32(sample.roll),
+                _float32(sample.pitch),
+                _float32(sample.yaw),
+                _float32(sample.temperature_c),
+                _float32(sample.voltage_v),
+            )
+        except (struct.error, OverflowError) as exc:
+            raise ValueError(f"Cannot encode telemetry as binary: {exc}") from exc
+        return FRAME_HEADER.pack(len(payload), PROTOCOL_VERSION, FRAME_TELEMETRY) + payload
+    payload = json.dumps(sample.as_dict())
+    return f"{TELEMETRY_PREFIX}{payload}\n".encode(encoding)
+
+
+def _float32(value: float) -> float:
+    if abs(value) <= _FLOAT32_MAX or math.isnan(value):
+        return value
+    return math.copysign(math.inf, value)
+
+
+def encode_line(line: str, wire_format: WireFormat, encoding: str = "utf-8") -> bytes:
+    """Serialize a plain text *line* for a client using *wire_format*."""
+
+    if wire_format is WireFormat.BINARY:
+        payload = line.encode(encoding, errors="ignore")[:_MAX_PAYLOAD]
+        return FRAME_HEADER.pack(len(payload), PROTOCOL_VERSION, FRAME_TEXT) + payload
+    return f"{line}\n".encode(encoding, errors="ignore")
+
+
+# ----------------------------------------------------------------------
+# Decoding
+# ----------------------------------------------------------------------
+def decode_telemetry(payload: bytes | bytearray) -> Dict[str, Any]:
+    """Decode a binary telemetry payload into a :meth:`SensorSample.as_dict` mapping."""
+
+    values = TELEMETRY_STRUCT.unpack(payload)
+    return dict(zip(TELEMETRY_FIELDS, values))
+
+
+def iter_frames(buffer: bytearray) -> Iterator[Tuple[int, int, bytearray]]:
+    """Yield ``(version, kind, payload)`` for every complete frame in *buffer*.
+
+    Consumed bytes are removed from *buffer* once iteration finishes, leaving any
+    trailing partial frame in place for the next read.
+    """
+
+    offset = 0
+    total = len(buffer)
+    try:
+        while total - offset >= FRAME_HEADER.size:
+            length, version, kind = FRAME_HEADER.unpack_from(buffer, offset)
+            start = offset + FRAME_HEADER.size
+            end = start + length
+            if end > total:
+                break
+            offset = end
+            yield version, kind, buffer[start:end]
+    finally:
+        del buffer[:offset]
+
+
+def iter_lines(buffer: bytearray) -> Iterator[bytearray]:
+    """Yield every complete newline-terminated line in *buffer*, without the newline.
+
+    Like :func:`iter_frames`, consumed bytes are removed in a single deletion once
+    iteration finishes so partial lines stay buffered without re-copying the tail
+    after every line.
+    """
+
+    offset = 0
+    try:
+        while True:
+            end = buffer.find(b"\n", offset)
+            if end < 0:
+                break
+            start = offset
+            offset = end + 1
+            yield buffer[start:end]
+    finally:
+        del buffer[:offset]
@@ -1,8 +1,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Tuple
 
-from .sensor_data import SensorSample
+import numpy as np
+
+from .sensor_data import SensorSample, get_calibration_offsets
+
+# Codes returned by :meth:`EmotionPolicy.choose_batch`; :meth:`EmotionPolicy.labels`
+# maps them back to emotion names.
+CODE_DEFAULT = 0
+CODE_ALERT = 1
+CODE_TILT = 2
+CODE_CURRENT = 3
 
 
 @dataclass(slots=True)
@@ -52,3 +62,61 @@ class EmotionPolicy:
         if current in {self.alert_emotion, self.tilt_emotion}:
             return self.default_emotion
         return current or self.default_emotion
+
+    def choose_batch(
+        self,
+        roll: np.ndarray,
+        pitch: np.ndarray,
+        yaw: np.ndarray,
+        previous_roll: np.ndarray | None = None,
+        *,
+        current: str | None = None,
+    ) -> np.ndarray:
+        """Evaluate :meth:`choose` over raw telemetry columns in one call.
+
+        The result is an ``int8`` array of ``CODE_*`` values, identical to
+        calling :meth:`choose` on each sample in order with ``previous`` set
+        to the sample before it and ``current`` to the previous result
+        (*current* seeds the first one).  *previous_roll* defaults to *roll*
+        shifted by one sample; pass it explicitly to evaluate samples whose
+        predecessors are elsewhere, with NaN where there is none.  Inputs are
+        read as float64, so float32 columns give the same result as samples
+        built from them.
+        """
+
+        offsets = get_calibration_offsets()
+        calibrated_roll = np.asarray(roll, dtype=np.float64) - offsets["roll"]
+        if previous_roll is None:
+            roll_delta = np.zeros_like(calibrated_roll)
+            np.subtract(calibrated_roll[1:], calibrated_roll[:-1], out=roll_delta[1:])
+        else:
+            roll_delta = calibrated_roll - (np.asarray(previous_roll, dtype=np.float64) - offsets["roll"])
+            roll_delta[np.isnan(previous_roll)] = 0.0
+        np.abs(roll_delta, out=roll_delta)
+        roll_abs = np.abs(calibrated_roll)
+        pitch_abs = np.abs(np.asarray(pitch, dtype=np.float64) - offsets["pitch"])
+        # Same floored modulo as sensor_data._wrap_angle; its -180 -> 180 fix-up
+        # does not matter once the absolute value is taken.
+        yaw_abs = np.abs(np.remainder(np.asarray(yaw, dtype=np.float64) - offsets["yaw"] + 180.0, 360.0) - 180.0)
+
+        alert = pitch_abs > self.pitch_threshold
+        alert |= roll_abs > self.roll_alert_threshold
+        alert |= roll_delta > self.roll_alert_delta_threshold
+        tilt = roll_abs > self.roll_sad_threshold
+        tilt |= yaw_abs > self.yaw_threshold
+        tilt |= roll_delta > self.roll_sad_delta_threshold
+
+        codes = np.full(calibrated_roll.shape, CODE_DEFAULT, dtype=np.int8)
+        codes[tilt] = CODE_TILT
+        codes[alert] = CODE_ALERT
+        if current is not None and current not in {self.default_emotion, self.alert_emotion, self.tilt_emotion}:
+            # A custom current emotion is held until the first alert or tilt.
+            active = alert | tilt
+            first = int(np.argmax(active)) if active.any() else len(codes)
+            codes[:first] = CODE_CURRENT
+        return codes
+
+    def labels(self, current: str | None = None) -> Tuple[str, str, str, str]:
+        """Emotion names indexed by the ``CODE_*`` values of :meth:`choose_batch`."""
+
+        return (self.default_emotion, self.alert_emotion, self.tilt_emotion, current or self.default_emotion)
@@ -0,0 +1,162 @@
+"""Emotion state machine driven by telemetry, independent of any widget."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+from .emotion_policy import EmotionPolicy
+from .sensor_data import (
+    MAJOR_PITCH_DELTA_THRESHOLD,
+    MAJOR_ROLL_DELTA_THRESHOLD,
+    MAJOR_SPEED_DELTA_THRESHOLD,
+    MAJOR_YAW_DELTA_THRESHOLD,
+    STEADY_PITCH_DELTA_THRESHOLD,
+    STEADY_ROLL_DELTA_THRESHOLD,
+    STEADY_SPEED_THRESHOLD,
+    STEADY_YAW_DELTA_THRESHOLD,
+    SensorSample,
+)
+
+DEFAULT_REST_DELAY = 30.0
+DEFAULT_SLEEP_EMOTION = "sleepy"
+
+
+@dataclass(slots=True, frozen=True)
+class MotionThresholds:
+    """Limits for :meth:`SensorSample.is_steady` and :meth:`SensorSample.has_major_movement`."""
+
+    steady_roll_delta: float = STEADY_ROLL_DELTA_THRESHOLD
+    steady_pitch_delta: float = STEADY_PITCH_DELTA_THRESHOLD
+    steady_yaw_delta: float = STEADY_YAW_DELTA_THRESHOLD
+    steady_speed: float = STEADY_SPEED_THRESHOLD
+    major_roll_delta: float = MAJOR_ROLL_DELTA_THRESHOLD
+    major_pitch_delta: float = MAJOR_PITCH_DELTA_THRESHOLD
+    major_yaw_delta: float = MAJOR_YAW_DELTA_THRESHOLD
+    major_speed_delta: float = MAJOR_SPEED_DELTA_THRESHOLD
+
+    def is_steady(self, sample: SensorSample, previous: SensorSample | None) -> bool:
+        return sample.is_steady(
+            previous,
+            self.steady_roll_delta,
+            self.steady_pitch_delta,
+            self.steady_yaw_delta,
+            self.steady_speed,
+        )
+
+    def has_major_movement(self, sample: SensorSample, previous: SensorSample | None) -> bool:
+        return sample.has_major_movement(
+            previous,
+            self.major_roll_delta,
+            self.major_pitch_delta,
+            self.major_yaw_delta,
+            self.major_speed_delta,
+        )
+
+
+class EmotionStateMachine:
+    """Pick the emotion to show for each sample, including falling asleep.
+
+    While awake, every sample goes through the :class:`EmotionPolicy`.  Once
+    the robot has been steady for ``rest_delay`` seconds of receive time it
+    shows ``sleep_emotion`` until a major movement wakes it with the
+    policy's default emotion.  *available* restricts the result to the
+    emotions a face can show (``None`` accepts any name).
+    """
+
+    def __init__(
+        self,
+        policy: Optional[EmotionPolicy] = None,
+        *,
+        available: Sequence[str] | None = None,
+        initial: str = "neutral",
+        rest_delay: float = DEFAULT_REST_DELAY,
+        sleep_emotion: str = DEFAULT_SLEEP_EMOTION,
+        thresholds: MotionThresholds | None = None,
+    ) -> None:
+        self._policy = policy or EmotionPolicy()
+        self._available = tuple(available) if available is not None else None
+        self._thresholds = thresholds or MotionThresholds()
+        self._rest_delay = rest_delay
+        self._sleep_emotion = sleep_emotion
+        self._current_emotion: str | None = initial
+        if self._available and initial not in self._available:
+            self._current_emotion = self._available[0]
+        self._steady_start: float | None = None
+        self._sleeping = False
+        self._previous_sample: SensorSample | None = None
+
+    @property
+    def policy(self) -> EmotionPolicy:
+        return self._policy
+
+    @property
+    def current_emotion(self) -> Optional[str]:
+        return self._current_emotion
+
+    @property
+    def sleeping(self) -> bool:
+        return self._sleeping
+
+    def advance(self, sample: SensorSample) -> Optional[str]:
+        """Feed *sample* and return the emotion to show afterwards."""
+
+        # Rest detection runs on receive time so a late batch cannot shorten
+        # or stretch the steady interval.
+        now = sample.timestamp()
+        previous = self._previous_sample
+        major_movement = self._thresholds.has_major_movement(sample, previous)
+        steady = self._thresholds.is_steady(sample, previous)
+        next_emotion: Optional[str] = None
+
+        if self._sleeping:
+            if major_movement:
+                self._sleeping = False
+                self._steady_start = None
+                next_emotion = self._policy.default_emotion
+            else:
+                next_emotion = self._sleep_emotion
+        else:
+            if major_movement:
+                self._steady_start = None
+            elif steady:
+                if self._steady_start is None:
+                    self._steady_start = now
+                if (now - self._steady_start) >= self._rest_delay:
+                    self._sleeping = True
+                    next_emotion = self._sleep_emotion
+            else:
+                self._steady_start = None
+
+        if next_emotion is None:
+            if self._sleeping:
+                next_emotion = self._sleep_emotion
+            else:
+                next_emotion = self._policy.choose(
+                    sample,
+                    current=self._current_emotion,
+                    previous=previous,
+                )
+                if (
+                    next_emotion == self._current_emotion
+                    and self._current_emotion not in (
+                        None,
+                        self._policy.default_emotion,
+                        self._policy.alert_emotion,
+                        self._policy.tilt_emotion,
+                    )
+                ):
+                    next_emotion = self._policy.default_emotion
+
+        self._previous_sample = sample
+
+        if not next_emotion or next_emotion == self._current_emotion:
+            return self._current_emotion
+
+        available = self._available
+        if available is not None and next_emotion not in available:
+            fallback = self._policy.default_emotion
+            next_emotion = fallback if fallback in available else (available[0] if available else None)
+        if next_emotion:
+            self._current_emotion = next_emotion
+        return self._current_emotion
@@ -1,109 +1,107 @@
 from __future__ import annotations
 
-from time import monotonic
-from typing import Optional
+from typing import Dict, Optional, Sequence
 
 from PySide6.QtCore import QObject
 
 from axon_ui import RoboticFaceWidget
 
 from .emotion_policy import EmotionPolicy
+from .emotion_state import DEFAULT_REST_DELAY, EmotionStateMachine, MotionThresholds
 from .sensor_data import SensorSample
 
 
 class FaceController(QObject):
-    """Bridge between telemetry samples and the :class:`RoboticFaceWidget`."""
+    """Bridge between telemetry samples and the :class:`RoboticFaceWidget`.
+
+    The emotion logic lives in :class:`EmotionStateMachine`; *rest_delay* and
+    *thresholds* are passed through to it.
+    """
 
     def __init__(
         self,
         face: RoboticFaceWidget,
         policy: Optional[EmotionPolicy] = None,
         parent: QObject | None = None,
+        *,
+        rest_delay: float = DEFAULT_REST_DELAY,
+        thresholds: MotionThresholds | None = None,
     ) -> None:
         super().__init__(parent)
         self._face = face
+        # Faces without blending (e.g. the 3D visualizer's stand-in) only
+        # take discrete emotions through set_emotion().
+        self._set_weights = getattr(face, "set_emotion_weights", None)
+        self._set_battery = getattr(face, "set_battery_voltage", None)
+        self._shown_weights: Dict[str, float] | None = None
+        self._shown_emotion: str | None = None
         self._policy = policy or EmotionPolicy()
-        self._current_emotion: str | None = "neutral"
-        self._steady_start: float | None = None
-        self._rest_delay = 30.0
-        self._sleep_emotion = "sleepy"
-        self._sleeping = False
-        self._previous_sample: SensorSample | None = None
+        self._state = EmotionStateMachine(
+            self._policy,
+            available=tuple(face.available_emotions()),
+            rest_delay=rest_delay,
+            thresholds=thresholds,
+        )
         self._initialize_face()
 
+    @property
+    def face(self) -> RoboticFaceWidget:
+        return self._face
+
     def _initialize_face(self) -> None:
-        available = tuple(self._face.available_emotions())
-        if self._current_emotion and self._current_emotion in available:
-            self._face.set_emotion(self._current_emotion)
-        elif available:
-            choice = available[0]
-            self._face.set_emotion(choice)
-            self._current_emotion = choice
+        current = self._state.current_emotion
+        if current and current in tuple(self._face.available_emotions()):
+            self._face.set_emotion(current)
+            self._shown_emotion = current
+            self._shown_weights = {current: 1.0}
 
     def apply_sample(self, sample: SensorSample) -> None:
         """Update the face to reflect the latest telemetry sample."""
 
-        self._face.set_orientation(**sample.to_orientation())
-
-        now = monotonic()
-        previous = self._previous_sample
-        major_movement = sample.has_major_movement(previous)
-        steady = sample.is_steady(previous)
-        next_emotion: Optional[str] = None
-
-        if self._sleeping:
-            if major_movement:
-                self._sleeping = False
-                self._steady_start = None
-                next_emotion = self._policy.default_emotion
-            else:
-                next_emotion = self._sleep_emotion
-        else:
-            if major_movement:
-                self._steady_start = None
-            elif steady:
-                if self._steady_start is None:
-                    self._steady_start = now
-                if (now - self._steady_start) >= self._rest_delay:
-                    self._sleeping = True
-                    next_emotion = self._sleep_emotion
-            else:
-                self._steady_start = None
-
-        if next_emotion is None:
-            if self._sleeping:
-                next_emotion = self._sleep_emotion
-            else:
-                next_emotion = self._policy.choose(
-                    sample,
-                    current=self._current_emotion,
-                    previous=previous,
-                )
-                if (
-                    next_emotion == self._current_emotion
-                    and self._current_emotion not in (
-                        None,
-                        self._policy.default_emotion,
-                        self._policy.alert_emotion,
-                        self._policy.tilt_emotion,
-                    )
-                ):
-                    next_emotion = self._policy.default_emotion
-
-        self._previous_sample = sample
-
-        if not next_emotion or next_emotion == self._current_emotion:
+        self.apply_samples((sample,))
+
+    def apply_samples(self, samples: Sequence[SensorSample]) -> None:
+        """Run every sample through the emotion state machine, render the newest.
+
+        Rest and movement detection see each frame in arrival order, while the
+        face only receives the orientation of the final sample.  The emotions
+        are passed on as blend weights, each the share of the batch it held,
+        so a policy flickering within one frame shows as a blend rather than
+        a hard switch.  Weights are only pushed when they change, and faces
+        that cannot blend get the dominant emotion through ``set_emotion``
+        instead.  The newest battery reading is forwarded too, so the face can
+        hold its low-battery expression over whatever the policy picks.
+        """
+
+        if not samples:
             return
 
-        available = list(self._face.available_emotions())
-        if next_emotion not in available:
-            fallback = self._policy.default_emotion
-            next_emotion = fallback if fallback in available else (available[0] if available else None)
-        if next_emotion:
-            self._face.set_emotion(next_emotion)
-            self._current_emotion = next_emotion
+        weights: Dict[str, float] = {}
+        for sample in samples:
+            emotion = self._state.advance(sample)
+            if emotion:
+                weights[emotion] = weights.get(emotion, 0.0) + 1.0
+
+        latest = samples[-1]
+        self._face.set_orientation(**latest.to_orientation())
+        # A zero reading means the board has no voltage sense, not a flat battery.
+        if self._set_battery is not None and latest.voltage_v > 0.0:
+            self._set_battery(latest.voltage_v)
+        if not weights:
+            return
+        if self._set_weights is not None:
+            total = sum(weights.values())
+            shares = {emotion: count / total for emotion, count in weights.items()}
+            if shares != self._shown_weights:
+                self._set_weights(shares)
+                self._shown_weights = shares
+            return
+        dominant = max(weights, key=weights.__getitem__)
+        if dominant != self._shown_emotion:
+            self._face.set_emotion(dominant)
+            self._shown_emotion = dominant
 
     @property
     def current_emotion(self) -> Optional[str]:
-        return self._current_emotion
+        return self._state.current_emotion
 
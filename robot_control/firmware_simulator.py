@@ -0,0 +1,387 @@
+"""Simulate the robot's serial firmware on a pseudo-terminal.
+
+:class:`FirmwareSimulator` opens a pty pair and plays the micro-controller on
+the master side: it streams ``{"T":1001,...}`` telemetry lines at a
+configurable rate and answers the commands the UI sends.  Point
+:class:`~robot_control.serial_reader.SerialReadWriter` (or
+``robot_main.py --serial-port``) at :attr:`FirmwareSimulator.port` to run the
+reader thread, the runtime and the TCP bridge without hardware.
+
+Commands understood, as JSON lines:
+
+``T:1``
+    wheel speed targets ``L``/``R``; the reported speeds ramp towards them;
+``T:11``
+    raw PWM ``L``/``R`` (-255..255), mapped onto the same speed range;
+``T:3`` / ``T:-3``
+    write ``Text`` to OLED line ``lineNum`` / restore the default screen;
+``T:130``
+    emit one telemetry frame immediately;
+``T:131``
+    ``cmd`` 1/0 turns the continuous telemetry stream on or off;
+``T:132``
+    set the ``IO4``/``IO5`` PWM outputs;
+``T:143``
+    ``cmd`` 1/0 turns echoing of every received command on or off.
+
+A pty does not enforce a baud rate, so the stream can run far above what a
+115200 baud UART carries (about 1400 telemetry lines per second).  When the
+reader falls behind and the pty buffer fills, frames are dropped and counted
+the way a firmware TX buffer overruns.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import random
+import selectors
+import threading
+import tty
+from dataclasses import dataclass
+from enum import Enum
+from time import monotonic
+from typing import Dict, List, Optional
+
+from .sensor_data import PITCH_CALIBRATION, ROLL_CALIBRATION, YAW_CALIBRATION
+
+LOGGER = logging.getLogger(__name__)
+
+MAX_WHEEL_SPEED = 0.5
+"""Largest ``T:1`` wheel speed; ``T:11`` PWM of ±255 maps onto it."""
+
+_MAX_PENDING_BYTES = 64 * 1024
+_OLED_LINES = 4
+
+
+@dataclass(slots=True, frozen=True)
+class NoiseSettings:
+    """IMU and supply noise model, angles in degrees.
+
+    ``*_noise`` is white noise per sample, ``gyro_bias_walk`` the standard
+    deviation of the yaw bias random walk per second of running time, and
+    ``vibration`` the extra roll/pitch jitter at full wheel speed.
+    """
+
+    roll_noise: float
+    pitch_noise: float
+    yaw_noise: float
+    gyro_bias_walk: float
+    vibration: float
+    temperature_noise: float
+    voltage_noise: float
+
+
+class NoiseProfile(Enum):
+    """Canned IMU noise levels for the simulated firmware."""
+
+    QUIET = "quiet"
+    BENCH = "bench"
+    DRIVING = "driving"
+    ROUGH = "rough"
+
+    @classmethod
+    def parse(cls, value: str) -> "NoiseProfile":
+        try:
+            return cls(value.strip().lower())
+        except ValueError:
+            choices = ", ".join(member.value for member in cls)
+            raise ValueError(f"Unknown noise profile '{value}'. Available: {choices}") from None
+
+    @property
+    def settings(self) -> NoiseSettings:
+        return _NOISE_SETTINGS[self]
+
+
+_NOISE_SETTINGS: Dict[NoiseProfile, NoiseSettings] = {
+    NoiseProfile.QUIET: NoiseSettings(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0),
+    NoiseProfile.BENCH: NoiseSettings(0.05, 0.05, 0.08, 0.01, 0.3, 0.05, 0.01),
+    NoiseProfile.DRIVING: NoiseSettings(0.15, 0.15, 0.25, 0.05, 2.5, 0.1, 0.03),
+    NoiseProfile.ROUGH: NoiseSettings(0.6, 0.6, 0.8, 0.2, 9.0, 0.1, 0.08),
+}
+
+
+@dataclass(slots=True, frozen=True)
+class SimulatorStats:
+    """Counters of a :class:`FirmwareSimulator`."""
+
+    frames_sent: int
+    frames_dropped: int
+    commands: int
+    bytes_sent: int
+
+
+class FirmwareSimulator:
+    """Play the robot firmware on the master side of a pty pair.
+
+    ``rate`` is telemetry frames per second.  Frames due since the last wake
+    are formatted and written together, so rates of several kHz cost a few
+    ``write()`` calls per millisecond rather than one per frame.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float = 50.0,
+        profile: NoiseProfile = NoiseProfile.BENCH,
+        seed: int | None = None,
+        feedback: bool = True,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self._rate = rate
+        self._noise = profile.settings
+        self._random = random.Random(seed)
+        self._feedback = feedback
+        self._echo = False
+
+        self._master, self._slave = os.openpty()
+        tty.setraw(self._slave)
+        os.set_blocking(self._master, False)
+        self._port = os.ttyname(self._slave)
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pending = bytearray()
+        self._inbox = bytearray()
+
+        # Simulated robot state, only touched by the simulator thread.
+        self._target = [0.0, 0.0]
+        self._speed = [0.0, 0.0]
+        self._heading = 0.0
+        self._gyro_bias = 0.0
+        self._temperature = 38.0
+        self._oled: List[str] = [""] * _OLED_LINES
+        self._io = {"IO4": 0, "IO5": 0}
+
+        self._frames_sent = 0
+        self._frames_dropped = 0
+        self._commands = 0
+        self._bytes_sent = 0
+
+    # ------------------------------------------------------------------
+    # Properties
+    # ------------------------------------------------------------------
+    @property
+    def port(self) -> str:
+        """Path of the pty slave to open as the serial port."""
+
+        return self._port
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @property
+    def stats(self) -> SimulatorStats:
+        with self._lock:
+            return SimulatorStats(self._frames_sent, self._frames_dropped, self._commands, self._bytes_sent)
+
+    @property
+    def oled_lines(self) -> List[str]:
+        with self._lock:
+            return list(self._oled)
+
+    @property
+    def io_outputs(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._io)
+
+    def set_feedback(self, enabled: bool) -> None:
+        """Turn the continuous telemetry stream on or off, like ``T:131``."""
+
+        self._feedback = enabled
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="FirmwareSimulator", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def close(self) -> None:
+        """Stop the simulator and close both ends of the pty."""
+
+        self.stop()
+        for fd in (self._master, self._slave):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def __enter__(self) -> "FirmwareSimulator":
+        self.start()
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------
+    # Simulator thread
+    # ------------------------------------------------------------------
+    def _run(self) -> None:
+        selector = selectors.DefaultSelector()
+        selector.register(self._master, selectors.EVENT_READ)
+        period = 1.0 / self._rate
+        start = monotonic()
+        last = start
+        emitted = 0
+        try:
+            while not self._stop_event.is_set():
+                now = monotonic()
+                if self._feedback:
+                    due = int((now - start) * self._rate) - emitted
+                    if due > 0:
+                        self._emit(due, now - last)
+                        emitted += due
+                else:
+                    start, emitted = now, 0
+                self._step_state(now - last)
+                last = now
+                self._flush()
+                timeout = max(0.0, start + (emitted + 1) * period - monotonic()) if self._feedback else 0.05
+                for _ in selector.select(min(timeout, 0.05)):
+                    self._read_commands()
+        except OSError as exc:
+            LOGGER.error("Firmware simulator stopped: %s", exc)
+        finally:
+            selector.close()
+
+    def _step_state(self, dt: float) -> None:
+        if dt <= 0:
+            return
+        # Wheels approach their targets with a ~0.2 s time constant.
+        blend = 1.0 - math.exp(-dt / 0.2)
+        for side in (0, 1):
+            self._speed[side] += (self._target[side] - self._speed[side]) * blend
+        # Differential drive turns the robot; 0.2 m track width.
+        self._heading += math.degrees((self._speed[1] - self._speed[0]) / 0.2) * dt
+        if self._noise.gyro_bias_walk:
+            self._gyro_bias += self._random.gauss(0.0, self._noise.gyro_bias_walk * math.sqrt(dt))
+        load = (abs(self._speed[0]) + abs(self._speed[1])) / (2.0 * MAX_WHEEL_SPEED)
+        self._temperature += ((38.0 + 10.0 * load) - self._temperature) * (1.0 - math.exp(-dt / 60.0))
+
+    def _emit(self, count: int, dt: float) -> None:
+        gauss = self._random.gauss
+        noise = self._noise
+        left, right = self._speed
+        motion = min(1.0, (abs(left) + abs(right)) / (2.0 * MAX_WHEEL_SPEED))
+        jitter = noise.vibration * motion
+        yaw_base = _wrap(YAW_CALIBRATION + self._heading + self._gyro_bias)
+        voltage = 12.3 - 0.6 * motion
+        lines = []
+        for _ in range(count):
+            roll = ROLL_CALIBRATION + gauss(0.0, noise.roll_noise + jitter)
+            pitch = PITCH_CALIBRATION + gauss(0.0, noise.pitch_noise + jitter)
+            yaw = _wrap(yaw_base + gauss(0.0, noise.yaw_noise))
+            temperature = self._temperature + gauss(0.0, noise.temperature_noise)
+            volts = voltage + gauss(0.0, noise.voltage_noise)
+            lines.append(
+                f'{{"T":1001,"L":{left:.3f},"R":{right:.3f},"r":{roll:.2f},"p":{pitch:.2f},'
+                f'"y":{yaw:.2f},"temp":{temperature:.1f},"v":{volts:.2f}}}\n'
+            )
+        self._queue("".join(lines).encode("ascii"), frames=count)
+
+    def _queue(self, data: bytes, *, frames: int = 0) -> None:
+        with self._lock:
+            if len(self._pending) + len(data) > _MAX_PENDING_BYTES:
+                self._frames_dropped += frames
+                return
+            self._pending += data
+            self._frames_sent += frames
+
+    def _flush(self) -> None:
+        with self._lock:
+            if not self._pending:
+                return
+            try:
+                written = os.write(self._master, self._pending)
+            except BlockingIOError:
+                return
+            del self._pending[:written]
+            self._bytes_sent += written
+
+    def _read_commands(self) -> None:
+        try:
+            data = os.read(self._master, 4096)
+        except BlockingIOError:
+            return
+        if not data:
+            return
+        self._inbox += data
+        while b"\n" in self._inbox:
+            raw, _, rest = self._inbox.partition(b"\n")
+            self._inbox = bytearray(rest)
+            line = raw.decode("utf-8", errors="replace").strip()
+            if line:
+                self._handle_command(line)
+
+    # ------------------------------------------------------------------
+    # Commands
+    # ------------------------------------------------------------------
+    def _handle_command(self, line: str) -> None:
+        with self._lock:
+            self._commands += 1
+        if self._echo:
+            self._queue((line + "\n").encode("utf-8"))
+        try:
+            payload = json.loads(line)
+            kind = int(payload["T"])
+        except (ValueError, KeyError, TypeError):
+            LOGGER.debug("Simulator ignoring malformed command %r", line)
+            return
+        # A bad field value must not take down the streaming thread.
+        try:
+            self._apply_command(kind, payload)
+        except (ValueError, TypeError, OverflowError):
+            LOGGER.debug("Simulator ignoring command with invalid fields %r", line)
+
+    def _apply_command(self, kind: int, payload: dict) -> None:
+        if kind == 1:
+            self._target = [_clamp(float(payload.get("L", 0.0))), _clamp(float(payload.get("R", 0.0)))]
+        elif kind == 11:
+            self._target = [
+                _clamp(float(payload.get("L", 0)) / 255.0 * MAX_WHEEL_SPEED),
+                _clamp(float(payload.get("R", 0)) / 255.0 * MAX_WHEEL_SPEED),
+            ]
+        elif kind == 3:
+            line_number = int(payload.get("lineNum", 0))
+            if 0 <= line_number < _OLED_LINES:
+                with self._lock:
+                    self._oled[line_number] = str(payload.get("Text", ""))
+        elif kind == -3:
+            with self._lock:
+                self._oled = [""] * _OLED_LINES
+        elif kind == 130:
+            self._emit(1, 0.0)
+        elif kind == 131:
+            self.set_feedback(bool(int(payload.get("cmd", 1))))
+        elif kind == 132:
+            with self._lock:
+                for key in ("IO4", "IO5"):
+                    if key in payload:
+                        self._io[key] = max(0, min(255, int(payload[key])))
+        elif kind == 143:
+            self._echo = bool(int(payload.get("cmd", 0)))
+        else:
+            LOGGER.debug("Simulator ignoring unsupported command T:%d", kind)
+
+
+def _clamp(speed: float) -> float:
+    return max(-MAX_WHEEL_SPEED, min(MAX_WHEEL_SPEED, speed))
+
+
+def _wrap(angle: float) -> float:
+    return (angle + 180.0) % 360.0 - 180.0
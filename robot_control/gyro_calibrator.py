@@ -1,15 +1,64 @@
 from __future__ import annotations
 
 from collections import deque
-from statistics import mean
 from time import monotonic
 from typing import Deque, Tuple
 
 from .sensor_data import SensorSample, set_calibration_offsets
 
+# Running sums are rebuilt from the window after this many evictions so
+# floating point error cannot accumulate over long sessions.
+_RESYNC_INTERVAL = 4096
+
+
+class _AxisWindow:
+    """Running sum plus monotonic min/max queues for one axis of a sliding window.
+
+    Entries are keyed by a sequence number so eviction only needs to compare the
+    head of each queue; every operation is amortized O(1).
+    """
+
+    __slots__ = ("total", "_maxima", "_minima")
+
+    def __init__(self) -> None:
+        self.total = 0.0
+        self._maxima: Deque[Tuple[int, float]] = deque()
+        self._minima: Deque[Tuple[int, float]] = deque()
+
+    def push(self, seq: int, value: float) -> None:
+        self.total += value
+        maxima = self._maxima
+        while maxima and maxima[-1][1] <= value:
+            maxima.pop()
+        maxima.append((seq, value))
+        minima = self._minima
+        while minima and minima[-1][1] >= value:
+            minima.pop()
+        minima.append((seq, value))
+
+    def evict(self, seq: int, value: float) -> None:
+        self.total -= value
+        if self._maxima[0][0] == seq:
+            self._maxima.popleft()
+        if self._minima[0][0] == seq:
+            self._minima.popleft()
+
+    def spread(self) -> float:
+        return self._maxima[0][1] - self._minima[0][1]
+
+    def clear(self) -> None:
+        self.total = 0.0
+        self._maxima.clear()
+        self._minima.clear()
+
 
 class GyroCalibrator:
-    """Automatically learn gyro baselines when the robot is stationary."""
+    """Automatically learn gyro baselines when the robot is stationary.
+
+    The sliding window keeps running sums and monotonic min/max queues per axis,
+    so each :meth:`observe` call costs amortized O(1) regardless of how many
+    samples ``window_seconds`` spans.
+    """
 
     def __init__(
         self,
@@ -23,18 +72,30 @@ class GyroCalibrator:
         self._pitch_threshold = pitch_threshold
         self._yaw_threshold = yaw_threshold
         self._samples: Deque[Tuple[float, float, float, float]] = deque()
+        self._axes = (_AxisWindow(), _AxisWindow(), _AxisWindow())
+        # Sequence number of the oldest sample in the window and of the next one.
+        self._head_seq = 0
+        self._next_seq = 0
+        self._evictions = 0
         self._current_offsets: Tuple[float, float, float] | None = None
 
     def observe(self, sample: SensorSample, timestamp: float | None = None) -> bool:
         """Record *sample* and update the baseline when it rests for the window.
 
-        Returns ``True`` when a new set of offsets is applied.
+        *timestamp* defaults to the sample's receive time so batched or delayed
+        processing does not stretch the window.  Returns ``True`` when a new set
+        of offsets is applied.
         """
 
         if timestamp is None:
-            timestamp = monotonic()
-
-        self._samples.append((timestamp, sample.roll, sample.pitch, sample.yaw))
+            timestamp = sample.timestamp()
+
+        entry = (timestamp, sample.roll, sample.pitch, sample.yaw)
+        self._samples.append(entry)
+        seq = self._next_seq
+        self._next_seq += 1
+        for axis, value in zip(self._axes, entry[1:]):
+            axis.push(seq, value)
         self._prune(timestamp)
 
         if not self._has_full_window(timestamp):
@@ -56,6 +117,10 @@ class GyroCalibrator:
         """Clear the sliding window so a fresh baseline can be captured."""
 
         self._samples.clear()
+        for axis in self._axes:
+            axis.clear()
+        self._head_seq = self._next_seq
+        self._evictions = 0
         if forget_offsets:
             self._current_offsets = None
 
@@ -78,8 +143,23 @@ class GyroCalibrator:
     # Helpers
     # ------------------------------------------------------------------
     def _prune(self, now: float) -> None:
-        while self._samples and (now - self._samples[0][0]) > self._window:
-            self._samples.popleft()
+        samples = self._samples
+        while samples and (now - samples[0][0]) > self._window:
+            _, roll, pitch, yaw = samples.popleft()
+            seq = self._head_seq
+            self._head_seq += 1
+            roll_axis, pitch_axis, yaw_axis = self._axes
+            roll_axis.evict(seq, roll)
+            pitch_axis.evict(seq, pitch)
+            yaw_axis.evict(seq, yaw)
+            self._evictions += 1
+        if self._evictions >= _RESYNC_INTERVAL:
+            self._resync_totals()
+
+    def _resync_totals(self) -> None:
+        self._evictions = 0
+        for index, axis in enumerate(self._axes, start=1):
+            axis.total = sum(entry[index] for entry in self._samples)
 
     def _has_full_window(self, now: float) -> bool:
         if not self._samples:
@@ -87,21 +167,17 @@ class GyroCalibrator:
         return (now - self._samples[0][0]) >= self._window * 0.95
 
     def _is_stable(self) -> bool:
-        rolls = [sample[1] for sample in self._samples]
-        pitches = [sample[2] for sample in self._samples]
-        yaws = [sample[3] for sample in self._samples]
-
+        roll_axis, pitch_axis, yaw_axis = self._axes
         return (
-            (max(rolls) - min(rolls) <= self._roll_threshold)
-            and (max(pitches) - min(pitches) <= self._pitch_threshold)
-            and (max(yaws) - min(yaws) <= self._yaw_threshold)
+            (roll_axis.spread() <= self._roll_threshold)
+            and (pitch_axis.spread() <= self._pitch_threshold)
+            and (yaw_axis.spread() <= self._yaw_threshold)
         )
 
     def _window_average(self) -> Tuple[float, float, float]:
-        rolls = [sample[1] for sample in self._samples]
-        pitches = [sample[2] for sample in self._samples]
-        yaws = [sample[3] for sample in self._samples]
-        return (mean(rolls), mean(pitches), mean(yaws))
+        count = len(self._samples)
+        roll_axis, pitch_axis, yaw_axis = self._axes
+        return (roll_axis.total / count, pitch_axis.total / count, yaw_axis.total / count)
 
     def _offsets_close(
         self,
@@ -10,6 +10,7 @@ from PySide6.QtNetwork import QAbstractSocket
 from axon_ui import RoboticFaceWidget, TelemetryPanel
 from axon_ui.bridge_client import SerialBridgeConnection
 
+from .bridge_protocol import Subscription, WireFormat
 from .emotion_policy import EmotionPolicy
 from .face_controller import FaceController
 from .sensor_data import SensorSample
@@ -33,11 +34,17 @@ class RemoteBridgeController(QObject):
         telemetry_panel: TelemetryPanel,
         *,
         policy: Optional[EmotionPolicy] = None,
+        wire_format: WireFormat = WireFormat.JSON,
+        subscription: Subscription | None = None,
         parent: QObject | None = None,
     ) -> None:
         super().__init__(parent)
         self._telemetry_panel = telemetry_panel
-        self._connection = SerialBridgeConnection(self)
+        self._connection = SerialBridgeConnection(
+            self,
+            wire_format=wire_format,
+            subscription=subscription,
+        )
         self._connection.stateChanged.connect(self._handle_state_changed)
         self._connection.telemetryReceived.connect(self._handle_telemetry)
         self._connection.lineReceived.connect(self.lineReceived)
@@ -0,0 +1,115 @@
+"""Bounded FIFO that hands sensor samples from the serial thread to the UI."""
+
+from __future__ import annotations
+
+import threading
+from typing import List, Optional
+
+from .sensor_data import SensorSample
+
+
+class SampleRingBuffer:
+    """Thread-safe, preallocated ring buffer of :class:`SensorSample` objects.
+
+    The serial thread pushes every decoded frame while the Qt thread drains
+    them in batches.  When the consumer falls behind, the oldest samples are
+    overwritten so the buffer always holds the most recent ``capacity`` frames;
+    each overwrite is counted so dropped data is visible in diagnostics.
+    """
+
+    def __init__(self, capacity: int = 512) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be a positive integer")
+        self._capacity = capacity
+        self._slots: List[Optional[SensorSample]] = [None] * capacity
+        self._head = 0
+        self._size = 0
+        self._lock = threading.Lock()
+        self._pushed = 0
+        self._overflowed = 0
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+    def push(self, sample: SensorSample) -> bool:
+        """Append *sample*; return ``False`` when an unread sample was dropped."""
+
+        with self._lock:
+            self._pushed += 1
+            tail = (self._head + self._size) % self._capacity
+            self._slots[tail] = sample
+            if self._size < self._capacity:
+                self._size += 1
+                return True
+            # Buffer full: the write above replaced the oldest unread sample.
+            self._head = (self._head + 1) % self._capacity
+            self._overflowed += 1
+            return False
+
+    # ------------------------------------------------------------------
+    # Consumer side
+    # ------------------------------------------------------------------
+    def drain(self, max_n: int | None = None) -> List[SensorSample]:
+        """Remove and return up to *max_n* unread samples, oldest first."""
+
+        with self._lock:
+            count = self._size if max_n is None else max(0, min(max_n, self._size))
+            batch: List[SensorSample] = []
+            index = self._head
+            for _ in range(count):
+                batch.append(self._slots[index])  # type: ignore[arg-type]
+                self._slots[index] = None
+                index += 1
+                if index == self._capacity:
+                    index = 0
+            self._head = index
+            self._size -= count
+        return batch
+
+    def pop_batch(self) -> List[SensorSample]:
+        """Remove and return every unread sample, oldest first."""
+
+        return self.drain()
+
+    def pop_latest(self) -> Optional[SensorSample]:
+        """Return the newest unread sample and discard the older ones."""
+
+        with self._lock:
+            if not self._size:
+                return None
+            newest = (self._head + self._size - 1) % self._capacity
+            sample = self._slots[newest]
+            for offset in range(self._size):
+                self._slots[(self._head + offset) % self._capacity] = None
+            self._head = 0
+            self._size = 0
+        return sample
+
+    def clear(self) -> None:
+        with self._lock:
+            self._slots = [None] * self._capacity
+            self._head = 0
+            self._size = 0
+
+    # ------------------------------------------------------------------
+    # Diagnostics
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        with self._lock:
+            return self._size
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def pushed_count(self) -> int:
+        """Total number of samples ever pushed into the buffer."""
+
+        return self._pushed
+
+    @property
+    def overflow_count(self) -> int:
+        """Number of unread samples overwritten because the consumer lagged."""
+
+        return self._overflowed
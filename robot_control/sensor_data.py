@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
+from time import monotonic
 from typing import Any, Dict, Mapping
 
 
@@ -37,6 +39,20 @@ MAJOR_PITCH_DELTA_THRESHOLD = 6.0
 MAJOR_YAW_DELTA_THRESHOLD = 10.0
 MAJOR_SPEED_DELTA_THRESHOLD = 15.0
 
+_NUMBER = r"(-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)"
+
+# Exact layout of the 1001 telemetry frame emitted by the robot firmware.  Lines
+# that match are decoded without building an intermediate dict; anything else
+# (extra keys, different ordering, other message types) takes the JSON path.
+_ROBOT_FRAME_PATTERN = re.compile(
+    r"(?:Received:\s*)?"
+    r'\{"T":1001,'
+    rf'"L":{_NUMBER},"R":{_NUMBER},'
+    rf'"r":{_NUMBER},"p":{_NUMBER},"y":{_NUMBER},'
+    rf'"temp":{_NUMBER},"v":{_NUMBER}'
+    r"\}"
+)
+
 
 @dataclass(slots=True)
 class SensorSample:
@@ -50,9 +66,12 @@ class SensorSample:
     yaw: float
     temperature_c: float
     voltage_v: float
+    # ``time.monotonic()`` when the frame was read off the wire; ``None`` for
+    # samples that did not come from a local transport (mocks, TCP replays).
+    received_at: float | None = field(default=None, compare=False)
 
     @classmethod
-    def from_json(cls, payload: str) -> "SensorSample":
+    def from_json(cls, payload: str, *, received_at: float | None = None) -> "SensorSample":
         """Create a sample from a JSON payload.
 
         The micro-controller sends lines that look like::
@@ -60,18 +79,26 @@ class SensorSample:
             {"T":1001,"L":0,"R":0,"r":15.58,"p":-19.38,"y":126.92,"temp":47.7,"v":12.20}
 
         Some firmwares prepend the line with ``"Received: "``; this method tolerates that
-        automatically.
+        automatically.  Frames with exactly the layout above are decoded by a
+        precompiled scanner; everything else falls back to :func:`json.loads`.
         """
 
         payload = payload.strip()
+        match = _ROBOT_FRAME_PATTERN.fullmatch(payload)
+        if match is not None:
+            return cls(1001, *map(float, match.groups()), received_at)
+        return cls._from_json_generic(payload, received_at)
+
+    @classmethod
+    def _from_json_generic(cls, payload: str, received_at: float | None = None) -> "SensorSample":
         if payload.startswith("Received:"):
             payload = payload.split("Received:", 1)[1].strip()
 
         data = json.loads(payload)
-        return cls.from_dict(data)
+        return cls.from_dict(data, received_at=received_at)
 
     @classmethod
-    def from_dict(cls, payload: Mapping[str, Any]) -> "SensorSample":
+    def from_dict(cls, payload: Mapping[str, Any], *, received_at: float | None = None) -> "SensorSample":
         """Create a sample from a mapping.
 
         The TCP bridge uses human-readable keys such as ``"message_type"`` while the robot
@@ -97,8 +124,14 @@ class SensorSample:
             yaw=float(_lookup("yaw", "y")),
             temperature_c=float(_lookup("temperature_c", "temp")),
             voltage_v=float(_lookup("voltage_v", "v")),
+            received_at=received_at,
         )
 
+    def timestamp(self) -> float:
+        """Return :attr:`received_at`, or the current monotonic time when unstamped."""
+
+        return self.received_at if self.received_at is not None else monotonic()
+
     def to_orientation(self) -> Dict[str, float]:
         """Return a mapping compatible with :meth:`RoboticFaceWidget.set_orientation`."""
 
@@ -11,3 +11,5 @@ class SerialBridgeConfig:
     port: int = 8765
     welcome_message: str = "Axon serial bridge ready\n"
     encoding: str = "utf-8"
+    # Frames buffered per client before the oldest telemetry is dropped.
+    client_queue_size: int = 256
@@ -2,26 +2,314 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import selectors
 import socket
 import threading
-from typing import Optional
+from collections import deque
+from dataclasses import dataclass
+from itertools import islice
+from time import monotonic
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 from robot_control.sensor_data import SensorSample
 
+from .bridge_protocol import (
+    FORMAT_COMMAND,
+    SUBSCRIBE_COMMAND,
+    Subscription,
+    WireFormat,
+    encode_line,
+    encode_telemetry,
+    format_ack,
+    iter_lines,
+    subscribe_ack,
+)
 from .serial_bridge_config import SerialBridgeConfig
-from .serial_reader import SerialReadWriter
+from .serial_reader import SampleSource
 
 LOGGER = logging.getLogger(__name__)
 
+_RECV_SIZE = 4096
+_MAX_COMMAND_BYTES = 64 * 1024
+_MAX_BATCH = 64
+_HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+
+
+@dataclass(slots=True)
+class BridgeClientStats:
+    """Snapshot of one client's send queue, used to spot lagging observers."""
+
+    address: Tuple[str, int]
+    wire_format: WireFormat
+    subscription: Subscription
+    queued_frames: int
+    max_queued_frames: int
+    dropped_frames: int
+    sent_frames: int
+    sent_bytes: int
+    # Age of the oldest queued frame (from UART receipt for telemetry), or the
+    # age of the last frame when it was written if the queue is empty.
+    lag_seconds: float
+
+
+class _BridgeClient:
+    """Per-connection state: negotiated wire format plus a bounded send queue.
+
+    Publishers only append shared, already-encoded frames; the server's event
+    loop writes them out with non-blocking sends.  When the queue is full the
+    oldest telemetry frame is discarded so a slow link never back-pressures the
+    serial reader.  Replies and format acknowledgements are never dropped;
+    a client that lets them fill the queue is marked ``overflowed`` and
+    disconnected by the event loop.
+
+    Telemetry is additionally rate limited by the client's
+    :class:`Subscription`: samples arriving before the next slot replace a
+    single coalesced slot that the event loop releases once it is due.
+    """
+
+    def __init__(
+        self,
+        conn: socket.socket,
+        address: Tuple[str, int],
+        wire_format: WireFormat,
+        capacity: int,
+    ) -> None:
+        self.conn = conn
+        self.address = address
+        self.wire_format = wire_format
+        self.subscription = Subscription()
+        self.inbox = bytearray()
+        self.writing = False
+        self.overflowed = False
+        self._capacity = max(1, capacity)
+        # Entries are (origin time, frame, droppable).  Telemetry uses the
+        # sample's UART receive time so lag covers the whole robot-side path.
+        self._frames: Deque[Tuple[float, bytes, bool]] = deque()
+        # Unsent remainder of the head frame once a write has started on it.
+        self._pending: Optional[memoryview] = None
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._closed = False
+        self._dropped = 0
+        self._droppable = 0
+        self._max_depth = 0
+        self._sent_frames = 0
+        self._sent_bytes = 0
+        self._last_lag = 0.0
+        self._next_telemetry_at = 0.0
+        # Newest throttled telemetry as (shared frame cache, encoder, receive time).
+        self._coalesced: Optional[Tuple[Dict[WireFormat, bytes], Callable[[WireFormat], bytes], float]] = None
+
+    # ------------------------------------------------------------------
+    # Producer side (any thread)
+    # ------------------------------------------------------------------
+    def enqueue(self, frame: bytes, *, droppable: bool = True) -> None:
+        with self._lock:
+            self._append(frame, droppable, monotonic())
+
+    def enqueue_encoded(
+        self,
+        frames: Dict[WireFormat, bytes],
+        encode: Callable[[WireFormat], bytes],
+        *,
+        droppable: bool = True,
+    ) -> None:
+        """Queue the frame for this client's format, encoding it on first use."""
+
+        with self._lock:
+            frame = frames.get(self.wire_format)
+            if frame is None:
+                frame = frames[self.wire_format] = encode(self.wire_format)
+            self._append(frame, droppable, monotonic())
+
+    def offer_telemetry(
+        self,
+        frames: Dict[WireFormat, bytes],
+        encode: Callable[[WireFormat], bytes],
+        now: float,
+        received_at: float,
+    ) -> None:
+        """Queue telemetry now or coalesce it until the subscription allows another frame."""
+
+        with self._lock:
+            if not self.subscription.telemetry:
+                return
+            if now < self._next_telemetry_at:
+                self._coalesced = (frames, encode, received_at)
+                return
+            self._coalesced = None
+            self._emit_telemetry(frames, encode, now, received_at)
+
+    def release_coalesced(self, now: float) -> Optional[float]:
+        """Queue a due coalesced sample; return when the pending one becomes due."""
+
+        with self._lock:
+            if self._coalesced is None:
+                return None
+            if now < self._next_telemetry_at:
+                return self._next_telemetry_at
+            frames, encode, received_at = self._coalesced
+            self._coalesced = None
+            self._emit_telemetry(frames, encode, now, received_at)
+            return None
+
+    def _emit_telemetry(
+        self,
+        frames: Dict[WireFormat, bytes],
+        encode: Callable[[WireFormat], bytes],
+        now: float,
+        received_at: float,
+    ) -> None:
+        frame = frames.get(self.wire_format)
+        if frame is None:
+            try:
+                frame = frames[self.wire_format] = encode(self.wire_format)
+            except ValueError as exc:
+                # Only this sample is lost; the next one takes its slot.
+                self._dropped += 1
+                LOGGER.warning("Dropping telemetry for %s:%s: %s", self.address[0], self.address[1], exc)
+                return
+        self._append(frame, True, received_at)
+        interval = self.subscription.min_interval
+        if interval:
+            # Stay on the rate grid unless a whole slot was skipped.
+            scheduled = self._next_telemetry_at + interval
+            self._next_telemetry_at = scheduled if scheduled > now else now + interval
+
+    def subscribe(self, subscription: Subscription, ack: Callable[[WireFormat], bytes]) -> None:
+        """Apply *subscription* and queue its acknowledgement."""
+
+        with self._lock:
+            self.subscription = subscription
+            self._next_telemetry_at = 0.0
+            if not subscription.telemetry:
+                self._coalesced = None
+            self._append(ack(self.wire_format), False, monotonic())
+
+    def switch_format(self, wire_format: WireFormat, ack: Callable[[WireFormat], bytes]) -> None:
+        """Queue an acknowledgement in the current format, then switch."""
+
+        with self._lock:
+            self._append(ack(self.wire_format), False, monotonic())
+            self.wire_format = wire_format
+
+    def _append(self, frame: bytes, droppable: bool, stamp: float) -> None:
+        if self._closed or self.overflowed:
+            return
+        if len(self._frames) >= self._capacity and not self._drop_oldest():
+            if droppable:
+                self._dropped += 1
+                return
+            # Only replies are queued and the peer is not reading them: the
+            # queue stays bounded and the event loop disconnects the client.
+            self.overflowed = True
+            return
+        self._frames.append((stamp, frame, droppable))
+        self._droppable += droppable
+        self._max_depth = max(self._max_depth, len(self._frames))
+
+    def _drop_oldest(self) -> bool:
+        if not self._droppable:
+            return False
+        # Dropping a frame that is being written would corrupt the stream, so
+        # the search starts behind the in-flight batch.
+        for index in range(self._in_flight, len(self._frames)):
+            if self._frames[index][2]:
+                del self._frames[index]
+                self._droppable -= 1
+                self._dropped += 1
+                return True
+        return False
+
+    # ------------------------------------------------------------------
+    # Event-loop side
+    # ------------------------------------------------------------------
+    def has_output(self) -> bool:
+        with self._lock:
+            return bool(self._frames)
+
+    def flush(self) -> bool:
+        """Write as much queued data as the socket accepts; return ``True`` once drained."""
+
+        while True:
+            with self._lock:
+                if not self._frames:
+                    return True
+                batch = list(islice(self._frames, _MAX_BATCH))
+                if self._pending is None:
+                    self._pending = memoryview(batch[0][1])
+                buffers = [self._pending, *(frame for _, frame, _ in batch[1:])]
+                # Frames handed to the kernel must stay put until accounted for.
+                self._in_flight = len(batch)
+            try:
+                sent = self._send(buffers)
+            except (BlockingIOError, InterruptedError):
+                sent = 0
+            now = monotonic()
+            with self._lock:
+                self._in_flight = 0
+                for buffer, (queued_at, frame, _) in zip(buffers, batch):
+                    if sent < len(buffer):
+                        # Keep the partially written head pinned for the next flush.
+                        self._pending = memoryview(buffer)[sent:]
+                        self._in_flight = 1
+                        return False
+                    sent -= len(buffer)
+                    self._pending = None
+                    if self._frames:
+                        self._droppable -= self._frames.popleft()[2]
+                    self._last_lag = now - queued_at
+                    self._sent_frames += 1
+                    self._sent_bytes += len(frame)
+
+    def _send(self, buffers: List[memoryview | bytes]) -> int:
+        # Scatter/gather write: one syscall for the whole batch without joining.
+        if _HAS_SENDMSG:
+            return self.conn.sendmsg(buffers)
+        return self.conn.send(b"".join(buffers))
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            self._frames.clear()
+            self._droppable = 0
+            self._pending = None
+            self._coalesced = None
+        try:
+            self.conn.close()
+        except OSError:
+            pass
+
+    def stats(self) -> BridgeClientStats:
+        with self._lock:
+            queued = len(self._frames)
+            oldest = self._frames[0][0] if self._frames else None
+        lag = monotonic() - oldest if oldest is not None else self._last_lag
+        return BridgeClientStats(
+            address=self.address,
+            wire_format=self.wire_format,
+            subscription=self.subscription,
+            queued_frames=queued,
+            max_queued_frames=self._max_depth,
+            dropped_frames=self._dropped,
+            sent_frames=self._sent_frames,
+            sent_bytes=self._sent_bytes,
+            lag_seconds=lag,
+        )
+
 
 class SerialBridgeServer:
-    """Expose the serial transport over TCP so remote tools can issue commands."""
+    """Expose the serial transport over TCP so remote tools can issue commands.
+
+    All sockets are multiplexed by a single ``selectors`` loop on one background
+    thread.  ``publish_*`` may be called from any thread: frames are queued per
+    client and the loop is woken through a socket pair to flush them.
+    """
 
     def __init__(
         self,
-        reader: SerialReadWriter,
+        reader: SampleSource,
         *,
         config: SerialBridgeConfig | None = None,
     ) -> None:
@@ -30,15 +318,23 @@ class SerialBridgeServer:
         self._stop_event = threading.Event()
         self._server_thread: Optional[threading.Thread] = None
         self._server_socket: Optional[socket.socket] = None
-        self._client_threads: set[threading.Thread] = set()
-        self._client_sockets: set[socket.socket] = set()
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._wake_recv: Optional[socket.socket] = None
+        self._wake_send: Optional[socket.socket] = None
+        self._wake_pending = False
+        self._client_sockets: Dict[socket.socket, _BridgeClient] = {}
         self._clients_lock = threading.Lock()
+        self._recv_view = memoryview(bytearray(_RECV_SIZE))
         self._reader.add_line_consumer(self.publish_serial_line)
 
     def start(self) -> None:
         if self._server_thread and self._server_thread.is_alive():
             return
         self._stop_event.clear()
+        self._wake_recv, self._wake_send = socket.socketpair()
+        self._wake_recv.setblocking(False)
+        self._wake_send.setblocking(False)
+        self._wake_pending = False
         self._server_thread = threading.Thread(
             target=self._serve,
             name="SerialBridgeServer",
@@ -48,43 +344,61 @@ class SerialBridgeServer:
 
     def stop(self) -> None:
         self._stop_event.set()
-        if self._server_socket is not None:
-            try:
-                self._server_socket.close()
-            except OSError:
-                LOGGER.debug("Failed to close serial bridge socket cleanly")
-        with self._clients_lock:
-            for conn in list(self._client_sockets):
-                try:
-                    conn.close()
-                except OSError:
-                    pass
-            self._client_sockets.clear()
-        for thread in list(self._client_threads):
-            thread.join(timeout=0.5)
+        self._wake()
         if self._server_thread and self._server_thread.is_alive():
             self._server_thread.join(timeout=1.0)
         self._server_thread = None
-        self._server_socket = None
-        self._client_threads.clear()
+        for sock in (self._wake_recv, self._wake_send):
+            if sock is not None:
+                sock.close()
+        self._wake_recv = None
+        self._wake_send = None
+
+    @property
+    def server_address(self) -> Optional[Tuple[str, int]]:
+        """Return the bound ``(host, port)`` once the server is listening."""
+
+        sock = self._server_socket
+        if sock is None:
+            return None
+        try:
+            return sock.getsockname()
+        except OSError:
+            return None
 
     def publish_sample(self, sample: SensorSample) -> None:
-        payload = json.dumps(sample.as_dict())
-        frame = f"telemetry {payload}\n".encode(self._config.encoding)
-        self._broadcast(frame)
+        encoding = self._config.encoding
+        self._broadcast(
+            lambda wire_format: encode_telemetry(sample, wire_format, encoding),
+            received_at=sample.timestamp(),
+        )
 
     def publish_serial_line(self, line: str) -> None:
-        """Forward a raw serial line to every connected client."""
+        """Forward a raw serial line to every client subscribed to the raw log."""
+
+        encoding = self._config.encoding
+        self._broadcast(lambda wire_format: encode_line(line, wire_format, encoding))
 
-        frame = f"{line}\n".encode(self._config.encoding, errors="ignore")
-        self._broadcast(frame)
+    def client_stats(self) -> List[BridgeClientStats]:
+        """Return queue depth, drop and lag metrics for every connected client."""
 
+        with self._clients_lock:
+            clients = list(self._client_sockets.values())
+        return [client.stats() for client in clients]
+
+    # ------------------------------------------------------------------
+    # Event loop
+    # ------------------------------------------------------------------
     def _serve(self) -> None:
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         sock.bind((self._config.host, self._config.port))
         sock.listen()
-        sock.settimeout(1.0)
+        sock.setblocking(False)
+        selector = selectors.DefaultSelector()
+        selector.register(sock, selectors.EVENT_READ)
+        selector.register(self._wake_recv, selectors.EVENT_READ)
+        self._selector = selector
         self._server_socket = sock
         LOGGER.info(
             "Serial bridge listening on %s:%s",
@@ -93,81 +407,230 @@ class SerialBridgeServer:
         )
         try:
             while not self._stop_event.is_set():
-                try:
-                    client, address = sock.accept()
-                except socket.timeout:
-                    continue
-                thread = threading.Thread(
-                    target=self._handle_client,
-                    args=(client, address),
-                    name=f"SerialBridgeClient-{address[0]}:{address[1]}",
-                    daemon=True,
-                )
-                self._client_threads.add(thread)
-                thread.start()
+                due = self._flush_pending()
+                timeout = 1.0 if due is None else min(1.0, max(0.0, due - monotonic()))
+                for key, events in selector.select(timeout=timeout):
+                    if key.fileobj is sock:
+                        self._accept(sock)
+                    elif key.data is None:
+                        self._drain_wake()
+                    else:
+                        self._service_client(key.data, events)
         finally:
+            with self._clients_lock:
+                clients = list(self._client_sockets.values())
+                self._client_sockets.clear()
+            for client in clients:
+                client.close()
+            self._server_socket = None
+            self._selector = None
+            selector.close()
             try:
                 sock.close()
             except OSError:
                 pass
 
-    def _handle_client(self, conn: socket.socket, address: tuple[str, int]) -> None:
+    def _service_client(self, client: _BridgeClient, events: int) -> None:
+        # One misbehaving client (or a payload that cannot be encoded for it)
+        # must not end the loop that serves everybody else.
+        try:
+            if events & selectors.EVENT_READ:
+                self._read_client(client)
+            if events & selectors.EVENT_WRITE:
+                self._write_client(client)
+        except Exception:
+            LOGGER.exception("Dropping client %s:%s after an unexpected error", *client.address)
+            self._drop_client(client)
+
+    def _accept(self, sock: socket.socket) -> None:
+        try:
+            conn, address = sock.accept()
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as exc:
+            LOGGER.debug("Serial bridge accept failed: %s", exc)
+            return
         LOGGER.info("Client connected from %s:%s", *address)
-        buffer = b""
+        conn.setblocking(False)
+        client = _BridgeClient(conn, address, WireFormat.JSON, self._config.client_queue_size)
+        self._selector.register(conn, selectors.EVENT_READ, client)
+        with self._clients_lock:
+            self._client_sockets[conn] = client
+        client.enqueue(self._config.welcome_message.encode(self._config.encoding), droppable=False)
+        self._write_client(client)
+
+    def _read_client(self, client: _BridgeClient) -> None:
         try:
-            conn.sendall(self._config.welcome_message.encode(self._config.encoding))
-            conn.settimeout(1.0)
-            self._register_client(conn)
-            while not self._stop_event.is_set():
-                try:
-                    chunk = conn.recv(1024)
-                except socket.timeout:
-                    continue
-                if not chunk:
-                    break
-                buffer += chunk
-                while b"\n" in buffer:
-                    line, buffer = buffer.split(b"\n", 1)
-                    self._process_command(conn, line)
+            count = client.conn.recv_into(self._recv_view)
+        except (BlockingIOError, InterruptedError):
+            return
         except OSError as exc:
-            LOGGER.debug("Client %s:%s disconnected: %s", address[0], address[1], exc)
-        finally:
-            self._drop_client(conn)
-            LOGGER.info("Client disconnected from %s:%s", *address)
-            self._client_threads.discard(threading.current_thread())
+            LOGGER.debug("Client %s:%s disconnected: %s", client.address[0], client.address[1], exc)
+            self._drop_client(client)
+            return
+        if not count:
+            self._drop_client(client)
+            return
+        client.inbox += self._recv_view[:count]
+        for line in iter_lines(client.inbox):
+            self._process_command(client, line)
+            if client.overflowed:
+                break
+        if len(client.inbox) > _MAX_COMMAND_BYTES:
+            LOGGER.warning("Dropping client %s:%s: command line too long", *client.address)
+            self._drop_client(client)
+
+    def _write_client(self, client: _BridgeClient) -> None:
+        if client.conn.fileno() < 0:
+            return
+        if client.overflowed:
+            LOGGER.warning("Dropping client %s:%s: reply queue full", *client.address)
+            self._drop_client(client)
+            return
+        try:
+            drained = client.flush()
+        except OSError as exc:
+            LOGGER.debug("Client %s:%s send failed: %s", client.address[0], client.address[1], exc)
+            self._drop_client(client)
+            return
+        # Only watch for writability while data is stuck behind a full socket buffer.
+        if drained == client.writing:
+            client.writing = not drained
+            events = selectors.EVENT_READ | (selectors.EVENT_WRITE if client.writing else 0)
+            self._selector.modify(client.conn, events, client)
+
+    def _flush_pending(self) -> Optional[float]:
+        """Release due coalesced telemetry, flush idle queues, and return the next deadline."""
 
-    def _register_client(self, conn: socket.socket) -> None:
         with self._clients_lock:
-            self._client_sockets.add(conn)
+            clients = list(self._client_sockets.values())
+        now = monotonic()
+        next_due: Optional[float] = None
+        for client in clients:
+            try:
+                due = client.release_coalesced(now)
+            except Exception:
+                LOGGER.exception("Dropping client %s:%s after an unexpected error", *client.address)
+                self._drop_client(client)
+                continue
+            if due is not None:
+                next_due = due if next_due is None else min(next_due, due)
+            if not client.writing and client.has_output():
+                self._write_client(client)
+        return next_due
 
-    def _drop_client(self, conn: socket.socket) -> None:
+    def _drop_client(self, client: _BridgeClient) -> None:
         with self._clients_lock:
-            if conn in self._client_sockets:
-                self._client_sockets.remove(conn)
+            if self._client_sockets.pop(client.conn, None) is None:
+                return
         try:
-            conn.close()
+            self._selector.unregister(client.conn)
+        except (KeyError, ValueError):
+            pass
+        client.close()
+        LOGGER.info("Client disconnected from %s:%s", *client.address)
+
+    def _wake(self) -> None:
+        # Coalesce wake-ups: one pending byte is enough to flush every queue.
+        if self._wake_pending or self._wake_send is None:
+            return
+        self._wake_pending = True
+        try:
+            self._wake_send.send(b"\0")
         except OSError:
             pass
 
-    def _broadcast(self, frame: bytes) -> None:
+    def _drain_wake(self) -> None:
+        try:
+            while self._wake_recv.recv(_RECV_SIZE):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+        # Re-arm only after draining so a wake byte sent meanwhile is not lost;
+        # anything queued before this point is flushed by the next
+        # _flush_pending() pass at the top of the loop.
+        self._wake_pending = False
+
+    # ------------------------------------------------------------------
+    # Publishing and commands
+    # ------------------------------------------------------------------
+    def _broadcast(
+        self,
+        encode: Callable[[WireFormat], bytes],
+        *,
+        received_at: float | None = None,
+    ) -> None:
+        """Queue one payload for every client; *received_at* marks it as telemetry."""
+
         with self._clients_lock:
-            clients = list(self._client_sockets)
-        for conn in clients:
-            try:
-                conn.sendall(frame)
-            except OSError:
-                self._drop_client(conn)
+            clients = list(self._client_sockets.values())
+        if not clients:
+            return
+        # Encode at most once per wire format; every client sharing that format
+        # queues the same immutable bytes object.
+        frames: Dict[WireFormat, bytes] = {}
+        if received_at is not None:
+            now = monotonic()
+            for client in clients:
+                client.offer_telemetry(frames, encode, now, received_at)
+        else:
+            for client in clients:
+                if client.subscription.raw:
+                    client.enqueue_encoded(frames, encode)
+        self._wake()
 
-    def _process_command(self, conn: socket.socket, payload: bytes) -> None:
+    def _process_command(self, client: _BridgeClient, payload: bytearray) -> None:
         command = payload.decode(self._config.encoding, errors="ignore").strip()
         if not command:
             return
+        verb = command.split(" ", 1)[0]
+        if verb == FORMAT_COMMAND:
+            self._handle_format_command(client, command)
+            return
+        if verb == SUBSCRIBE_COMMAND:
+            self._handle_subscribe_command(client, command)
+            return
         try:
             self._reader.send_command(command)
-            response = f"echo: {command}\n".encode(self._config.encoding)
+            response = f"echo: {command}"
         except Exception as exc:
-            response = f"error: {exc}\n".encode(self._config.encoding)
+            response = f"error: {exc}"
+        self._reply(client, response)
+
+    def _handle_format_command(self, client: _BridgeClient, command: str) -> None:
+        _, _, argument = command.partition(" ")
         try:
-            conn.sendall(response)
-        except OSError:
-            self._drop_client(conn)
+            wire_format = WireFormat.parse(argument)
+        except ValueError as exc:
+            self._reply(client, f"error: {exc}")
+            return
+        # Acknowledge in the old format so the client can find the switch point.
+        encoding = self._config.encoding
+        client.switch_format(
+            wire_format,
+            lambda current: encode_line(format_ack(wire_format), current, encoding),
+        )
+        self._write_client(client)
+
+    def _handle_subscribe_command(self, client: _BridgeClient, command: str) -> None:
+        _, _, argument = command.partition(" ")
+        try:
+            subscription = Subscription.parse(argument)
+        except ValueError as exc:
+            self._reply(client, f"error: {exc}")
+            return
+        encoding = self._config.encoding
+        client.subscribe(
+            subscription,
+            lambda wire_format: encode_line(subscribe_ack(subscription), wire_format, encoding),
+        )
+        self._write_client(client)
+
+    def _reply(self, client: _BridgeClient, line: str) -> None:
+        encoding = self._config.encoding
+        client.enqueue_encoded(
+            {},
+            lambda wire_format: encode_line(line, wire_format, encoding),
+            droppable=False,
+        )
+        self._write_client(client)
@@ -2,44 +2,44 @@ from __future__ import annotations
 
 import logging
 import threading
-from typing import Callable, Optional
+from abc import ABC, abstractmethod
+from time import monotonic
+from typing import Callable, List, Optional
 
 import serial
 from serial import SerialException
 
+from .sample_buffer import SampleRingBuffer
 from .sensor_data import SensorSample
+from .telemetry_store import TelemetryStore
 
 LOGGER = logging.getLogger(__name__)
 
 
-class SerialReadWriter:
-    """Bidirectional serial transport that exposes reader/writer helpers."""
+class SampleSource(ABC):
+    """Buffering and consumer plumbing shared by live and replayed telemetry.
 
-    def __init__(
-        self,
-        port: str,
-        baudrate: int = 115200,
-        timeout: float = 0.05,
-    ) -> None:
-        try:
-            self._serial = serial.Serial(port=port, baudrate=baudrate, timeout=timeout)
-        except SerialException as exc:  # pragma: no cover - hardware specific
-            raise RuntimeError(f"Unable to open serial port {port!r}: {exc}") from exc
+    Subclasses implement :meth:`_run` (executed on a dedicated thread by
+    :meth:`start`), :meth:`send_command` and :meth:`_close_transport`, and hand
+    every decoded robot frame to :meth:`_publish_sample`.
+    """
 
-        self._lock = threading.Lock()
+    def __init__(self, buffer_size: int = 512, history: TelemetryStore | None = None) -> None:
         self._listeners_lock = threading.Lock()
-        self._latest: Optional[SensorSample] = None
+        self._samples = SampleRingBuffer(buffer_size)
+        self._history = history
         self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
         self._closed = False
         self._error: Optional[Exception] = None
         self._line_consumers: list[Callable[[str], None]] = []
+        self._sample_consumers: list[Callable[[SensorSample], None]] = []
 
     # ------------------------------------------------------------------
     # Lifecycle
     # ------------------------------------------------------------------
     def start(self) -> None:
-        """Start draining telemetry from the serial port on a dedicated thread."""
+        """Start producing telemetry on a dedicated thread."""
 
         if self._thread and self._thread.is_alive():
             return
@@ -47,13 +47,13 @@ class SerialReadWriter:
         self._stop_event.clear()
         self._thread = threading.Thread(
             target=self._run,
-            name="SerialReadWriter",
+            name=type(self).__name__,
             daemon=True,
         )
         self._thread.start()
 
     def stop(self) -> None:
-        """Stop the background reader and close the serial port."""
+        """Stop the background thread and release the transport."""
 
         if self._closed:
             return
@@ -62,7 +62,7 @@ class SerialReadWriter:
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=1.0)
 
-        self._close_serial()
+        self._close_transport()
         self._closed = True
 
     close = stop
@@ -71,23 +71,23 @@ class SerialReadWriter:
     # Reading + writing
     # ------------------------------------------------------------------
     def pop_latest(self) -> Optional[SensorSample]:
-        """Return the latest unread sample, if one is available."""
+        """Return the latest unread sample, discarding any older unread ones."""
 
-        with self._lock:
-            sample = self._latest
-            self._latest = None
-        return sample
+        return self._samples.pop_latest()
 
-    def send_command(self, command: str) -> None:
-        """Send a raw command over the serial transport."""
+    def drain(self, max_n: int | None = None) -> List[SensorSample]:
+        """Return up to *max_n* unread samples in arrival order."""
 
-        if self._closed:
-            raise RuntimeError("Serial connection is closed")
-        payload = command.rstrip("\n") + "\n"
-        data = payload.encode("utf-8")
-        with self._lock:
-            self._serial.write(data)
-            self._serial.flush()
+        return self._samples.drain(max_n)
+
+    def pop_batch(self) -> List[SensorSample]:
+        """Return every unread sample in arrival order."""
+
+        return self._samples.pop_batch()
+
+    @abstractmethod
+    def send_command(self, command: str) -> None:
+        """Forward *command* to the robot (or record it, for sources without one)."""
 
     # ------------------------------------------------------------------
     # Diagnostics + hooks
@@ -95,6 +95,24 @@ class SerialReadWriter:
     def has_error(self) -> bool:
         return self._error is not None
 
+    @property
+    def history(self) -> TelemetryStore | None:
+        """Columnar history fed by the reader thread, if one was supplied."""
+
+        return self._history
+
+    @property
+    def overflow_count(self) -> int:
+        """Number of samples dropped because nobody drained the buffer in time."""
+
+        return self._samples.overflow_count
+
+    @property
+    def received_count(self) -> int:
+        """Number of robot frames decoded since the reader was created."""
+
+        return self._samples.pushed_count
+
     def add_line_consumer(self, consumer: Callable[[str], None]) -> None:
         """Register *consumer* to receive every decoded serial line."""
 
@@ -108,9 +126,93 @@ class SerialReadWriter:
             if consumer in self._line_consumers:
                 self._line_consumers.remove(consumer)
 
+    def add_sample_consumer(self, consumer: Callable[[SensorSample], None]) -> None:
+        """Register *consumer* to be called on the reader thread after each buffered sample.
+
+        Consumers must be cheap and thread-safe; the usual pattern is to wake
+        another thread (e.g. a queued Qt signal) that then drains the buffer.
+        """
+
+        with self._listeners_lock:
+            self._sample_consumers.append(consumer)
+
+    def remove_sample_consumer(self, consumer: Callable[[SensorSample], None]) -> None:
+        """Remove a previously registered sample consumer."""
+
+        with self._listeners_lock:
+            if consumer in self._sample_consumers:
+                self._sample_consumers.remove(consumer)
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
+    @abstractmethod
+    def _run(self) -> None:
+        """Produce samples until :attr:`_stop_event` is set."""
+
+    def _close_transport(self) -> None:
+        pass
+
+    def _publish_sample(self, sample: SensorSample) -> None:
+        if self._history is not None:
+            self._history.append(sample)
+
+        if not self._samples.push(sample):
+            LOGGER.debug(
+                "Sample buffer full; dropped oldest frame (%d total)",
+                self._samples.overflow_count,
+            )
+        self._dispatch_sample(sample)
+
+    def _dispatch_line(self, line: str) -> None:
+        with self._listeners_lock:
+            listeners = list(self._line_consumers)
+        for consumer in listeners:
+            try:
+                consumer(line)
+            except Exception:  # pragma: no cover - diagnostic aid
+                LOGGER.exception("Serial line consumer raised an exception")
+
+    def _dispatch_sample(self, sample: SensorSample) -> None:
+        with self._listeners_lock:
+            listeners = list(self._sample_consumers)
+        for consumer in listeners:
+            try:
+                consumer(sample)
+            except Exception:  # pragma: no cover - diagnostic aid
+                LOGGER.exception("Sample consumer raised an exception")
+
+
+class SerialReadWriter(SampleSource):
+    """Bidirectional serial transport that exposes reader/writer helpers."""
+
+    def __init__(
+        self,
+        port: str,
+        baudrate: int = 115200,
+        timeout: float = 0.05,
+        buffer_size: int = 512,
+        history: TelemetryStore | None = None,
+    ) -> None:
+        try:
+            self._serial = serial.Serial(port=port, baudrate=baudrate, timeout=timeout)
+        except SerialException as exc:  # pragma: no cover - hardware specific
+            raise RuntimeError(f"Unable to open serial port {port!r}: {exc}") from exc
+
+        super().__init__(buffer_size, history)
+        self._lock = threading.Lock()
+
+    def send_command(self, command: str) -> None:
+        """Send a raw command over the serial transport."""
+
+        if self._closed:
+            raise RuntimeError("Serial connection is closed")
+        payload = command.rstrip("\n") + "\n"
+        data = payload.encode("utf-8")
+        with self._lock:
+            self._serial.write(data)
+            self._serial.flush()
+
     def _run(self) -> None:
         try:
             while not self._stop_event.is_set():
@@ -123,6 +225,7 @@ class SerialReadWriter:
 
                 if not raw:
                     continue
+                received_at = monotonic()
 
                 try:
                     text = raw.decode("utf-8", errors="ignore").strip()
@@ -136,7 +239,7 @@ class SerialReadWriter:
                 self._dispatch_line(text)
 
                 try:
-                    sample = SensorSample.from_json(text)
+                    sample = SensorSample.from_json(text, received_at=received_at)
                 except (ValueError, KeyError) as exc:
                     LOGGER.debug("Failed to parse payload %s: %s", text, exc)
                     continue
@@ -145,24 +248,14 @@ class SerialReadWriter:
                     LOGGER.debug("Skipping non-robot frame: %s", text)
                     continue
 
-                with self._lock:
-                    self._latest = sample
+                self._publish_sample(sample)
         finally:
             self._stop_event.set()
             if self._error is not None and not self._closed:
-                self._close_serial()
+                self._close_transport()
                 self._closed = True
 
-    def _dispatch_line(self, line: str) -> None:
-        with self._listeners_lock:
-            listeners = list(self._line_consumers)
-        for consumer in listeners:
-            try:
-                consumer(line)
-            except Exception:  # pragma: no cover - diagnostic aid
-                LOGGER.exception("Serial line consumer raised an exception")
-
-    def _close_serial(self) -> None:
+    def _close_transport(self) -> None:
         try:
             self._serial.close()
         except SerialException:  # pragma: no cover - hardware specific
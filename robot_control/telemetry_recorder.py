@@ -0,0 +1,331 @@
+"""Record telemetry samples to an append-only binary log on a background thread.
+
+A log starts with a fixed header followed by a sequence of chunks::
+
+    header  <8s magic "AXONTLOG"><u16 version><u16 record size>
+            <f64 wall-clock start><f64 monotonic start>
+    chunk   <4s kind><u8 compression><3x><u32 count><u32 stored size><u32 raw size>
+            <stored size bytes of payload>
+    trailer <u64 offset of the last index chunk><8s magic "AXONTEND">
+
+``RECS`` chunks hold ``count`` fixed-size records (:data:`RECORD_STRUCT`: the
+sample's monotonic receive time followed by the bridge's telemetry struct),
+compressed as a whole when the log uses gzip or zstd.  After every
+``index_every`` record chunks, and on close, an uncompressed ``INDX`` chunk
+lists ``count`` entries (:data:`INDEX_ENTRY`: chunk offset, first and last
+timestamp, record count) after the offset of the previous index chunk, so a
+reader can seek by time without decompressing anything.  The trailer is only
+written by :meth:`TelemetryRecorder.stop`; after a crash every complete chunk
+is still readable by walking the chunk headers from the start.
+"""
+
+from __future__ import annotations
+
+import gzip
+import logging
+import os
+import struct
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Deque, List, Optional, Tuple
+
+from .bridge_protocol import TELEMETRY_STRUCT
+from .sensor_data import SensorSample
+from .serial_reader import SampleSource
+
+try:  # zstd is optional; gzip from the standard library always works.
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None  # type: ignore[assignment]
+
+LOGGER = logging.getLogger(__name__)
+
+LOG_MAGIC = b"AXONTLOG"
+TRAILER_MAGIC = b"AXONTEND"
+LOG_VERSION = 1
+
+CHUNK_RECORDS = b"RECS"
+CHUNK_INDEX = b"INDX"
+
+LOG_HEADER = struct.Struct("<8sHHdd")
+CHUNK_HEADER = struct.Struct("<4sB3xIII")
+RECORD_STRUCT = struct.Struct("<d" + TELEMETRY_STRUCT.format.lstrip("<"))
+INDEX_HEAD = struct.Struct("<Q")
+INDEX_ENTRY = struct.Struct("<QddI")
+TRAILER = struct.Struct("<Q8s")
+
+
+class LogCompression(Enum):
+    """How record chunks are compressed; the code is stored in each chunk header."""
+
+    NONE = "none"
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+    @classmethod
+    def parse(cls, value: str) -> "LogCompression":
+        try:
+            return cls(value.strip().lower())
+        except ValueError:
+            choices = ", ".join(member.value for member in cls)
+            raise ValueError(f"Unknown log compression '{value}'. Available: {choices}") from None
+
+    @property
+    def code(self) -> int:
+        return _COMPRESSION_CODES[self]
+
+    @classmethod
+    def from_code(cls, code: int) -> "LogCompression":
+        for member, member_code in _COMPRESSION_CODES.items():
+            if member_code == code:
+                return member
+        raise ValueError(f"Unknown log compression code {code}")
+
+    def compress(self, data: bytes) -> bytes:
+        if self is LogCompression.GZIP:
+            return gzip.compress(data, compresslevel=1, mtime=0)
+        if self is LogCompression.ZSTD:
+            return _zstd_module().ZstdCompressor(level=3).compress(data)
+        return data
+
+    def decompress(self, data: bytes, raw_size: int) -> bytes:
+        if self is LogCompression.GZIP:
+            return gzip.decompress(data)
+        if self is LogCompression.ZSTD:
+            return _zstd_module().ZstdDecompressor().decompress(data, max_output_size=raw_size)
+        return data
+
+
+_COMPRESSION_CODES = {
+    LogCompression.NONE: 0,
+    LogCompression.GZIP: 1,
+    LogCompression.ZSTD: 2,
+}
+
+
+def _zstd_module():
+    if zstandard is None:
+        raise RuntimeError("zstd log compression needs the 'zstandard' package")
+    return zstandard
+
+
+def pack_record(sample: SensorSample) -> bytes:
+    """Encode *sample* as one fixed-size log record."""
+
+    return RECORD_STRUCT.pack(
+        sample.timestamp(),
+        sample.message_type,
+        sample.left_speed,
+        sample.right_speed,
+        sample.roll,
+        sample.pitch,
+        sample.yaw,
+        sample.temperature_c,
+        sample.voltage_v,
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class RecorderStats:
+    """Counters of a :class:`TelemetryRecorder`, safe to read from any thread."""
+
+    recorded: int
+    dropped: int
+    pending: int
+    chunks: int
+    bytes_written: int
+    #: Samples with values a record cannot hold (e.g. beyond float32 range).
+    skipped: int = 0
+
+
+class TelemetryRecorder:
+    """Append every sample to a binary telemetry log without blocking the caller.
+
+    :meth:`record` (or :meth:`attach`, which registers it as a
+    :class:`SerialReadWriter` sample consumer) only appends to a pending list.
+    A writer thread wakes every ``flush_interval`` seconds, or as soon as a
+    full chunk is pending, packs and optionally compresses whole chunks and
+    hands each one to the file in a single ``write()`` call, so a slow SD card
+    stalls the writer thread rather than the UART reader.  If more than
+    ``max_pending`` samples back up, the oldest are dropped and counted.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        compression: LogCompression = LogCompression.NONE,
+        chunk_records: int = 500,
+        index_every: int = 16,
+        flush_interval: float = 1.0,
+        max_pending: int = 50_000,
+    ) -> None:
+        if chunk_records <= 0 or index_every <= 0 or max_pending <= 0:
+            raise ValueError("chunk_records, index_every and max_pending must be positive")
+        if compression is LogCompression.ZSTD:
+            _zstd_module()
+        self._path = path
+        self._compression = compression
+        self._chunk_records = chunk_records
+        self._index_every = index_every
+        self._flush_interval = flush_interval
+        self._max_pending = max_pending
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop_event = threading.Event()
+        self._pending: Deque[SensorSample] = deque(maxlen=max_pending)
+        self._thread: Optional[threading.Thread] = None
+        self._reader: Optional[SampleSource] = None
+
+        self._recorded = 0
+        self._dropped = 0
+        self._skipped = 0
+        self._chunks = 0
+        self._bytes_written = 0
+        # Written only by the writer thread.
+        self._offset = 0
+        self._index: List[Tuple[int, float, float, int]] = []
+        self._last_index_offset = 0
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def stats(self) -> RecorderStats:
+        with self._lock:
+            pending = len(self._pending)
+        return RecorderStats(self._recorded, self._dropped, pending, self._chunks, self._bytes_written, self._skipped)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        """Create the log and start the writer; an existing file is never overwritten.
+
+        Raises :class:`FileExistsError` if *path* already exists.
+        """
+
+        if self._thread and self._thread.is_alive():
+            return
+        handle = open(self._path, "xb", buffering=0)
+        self._offset = 0
+        header = LOG_HEADER.pack(LOG_MAGIC, LOG_VERSION, RECORD_STRUCT.size, time.time(), time.monotonic())
+        self._write(handle, header)
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(handle,),
+            name="TelemetryRecorder",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Flush pending samples, write the final index and trailer, and close the log."""
+
+        self.detach()
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._wake.set()
+        self._thread.join()
+        self._thread = None
+
+    def attach(self, reader: SampleSource) -> None:
+        """Record every robot frame *reader* decodes."""
+
+        self.detach()
+        reader.add_sample_consumer(self.record)
+        self._reader = reader
+
+    def detach(self) -> None:
+        if self._reader is not None:
+            self._reader.remove_sample_consumer(self.record)
+            self._reader = None
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+    def record(self, sample: SensorSample) -> None:
+        """Queue *sample* for writing; cheap enough to call on the reader thread."""
+
+        with self._lock:
+            pending = self._pending
+            if len(pending) == self._max_pending:
+                self._dropped += 1
+            pending.append(sample)
+            self._recorded += 1
+            full = len(pending) >= self._chunk_records
+        if full:
+            self._wake.set()
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+    def _run(self, handle) -> None:
+        try:
+            while True:
+                self._wake.wait(self._flush_interval)
+                self._wake.clear()
+                stopping = self._stop_event.is_set()
+                with self._lock:
+                    batch = list(self._pending)
+                    self._pending.clear()
+                for start in range(0, len(batch), self._chunk_records):
+                    self._write_records(handle, batch[start : start + self._chunk_records])
+                if stopping:
+                    break
+            self._write_index(handle)
+            self._write(handle, TRAILER.pack(self._last_index_offset, TRAILER_MAGIC))
+            os.fsync(handle.fileno())
+        except OSError:
+            LOGGER.exception("Telemetry recording to %s failed", self._path)
+        finally:
+            handle.close()
+
+    def _write_records(self, handle, samples: List[SensorSample]) -> None:
+        records = []
+        kept = []
+        for sample in samples:
+            try:
+                records.append(pack_record(sample))
+            except (struct.error, OverflowError) as exc:
+                # One corrupt frame must not end the recording.
+                self._skipped += 1
+                LOGGER.warning("Skipping telemetry sample that cannot be recorded: %s", exc)
+                continue
+            kept.append(sample)
+        if not kept:
+            return
+        samples = kept
+        raw = b"".join(records)
+        payload = self._compression.compress(raw)
+        offset = self._offset
+        header = CHUNK_HEADER.pack(CHUNK_RECORDS, self._compression.code, len(samples), len(payload), len(raw))
+        self._write(handle, header + payload)
+        self._chunks += 1
+        self._index.append((offset, samples[0].timestamp(), samples[-1].timestamp(), len(samples)))
+        if len(self._index) >= self._index_every:
+            self._write_index(handle)
+
+    def _write_index(self, handle) -> None:
+        if not self._index:
+            return
+        body = INDEX_HEAD.pack(self._last_index_offset) + b"".join(INDEX_ENTRY.pack(*entry) for entry in self._index)
+        offset = self._offset
+        self._write(handle, CHUNK_HEADER.pack(CHUNK_INDEX, LogCompression.NONE.code, len(self._index), len(body), len(body)) + body)
+        self._last_index_offset = offset
+        self._index.clear()
+
+    def _write(self, handle, data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            written = handle.write(view)
+            view = view[written:]
+        self._offset += len(data)
+        self._bytes_written += len(data)
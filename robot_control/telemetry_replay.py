@@ -0,0 +1,406 @@
+"""Replay a recorded telemetry log in place of the serial reader.
+
+:class:`TelemetryLog` maps a log written by
+:class:`~robot_control.telemetry_recorder.TelemetryRecorder` into memory and
+locates its chunks through the index blocks (or by walking the chunk headers
+when the recording was cut short).  :class:`ReplayReader` feeds those records
+through the same buffer, history and consumer hooks as
+:class:`~robot_control.serial_reader.SerialReadWriter`, so the runtime, the TCP
+bridge and the remote UI run unchanged without hardware.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import math
+import mmap
+from collections import deque
+from dataclasses import dataclass
+from time import monotonic
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .bridge_protocol import TELEMETRY_FIELDS
+from .sensor_data import SensorSample
+from .serial_reader import SampleSource
+from .telemetry_recorder import (
+    CHUNK_HEADER,
+    CHUNK_INDEX,
+    CHUNK_RECORDS,
+    INDEX_ENTRY,
+    INDEX_HEAD,
+    LOG_HEADER,
+    LOG_MAGIC,
+    LOG_VERSION,
+    RECORD_STRUCT,
+    TRAILER,
+    TRAILER_MAGIC,
+    LogCompression,
+)
+from .telemetry_store import COLUMNS, TelemetryStore
+
+LOGGER = logging.getLogger(__name__)
+
+MAX_SPEED = math.inf
+
+Record = Tuple[float, int, float, float, float, float, float, float, float]
+
+# RECORD_STRUCT as a packed NumPy dtype, for decoding whole chunks at once.
+_RECORD_DTYPE = np.dtype(
+    [("time", "<f8"), ("message_type", "<i2")] + [(name, "<f4") for name in TELEMETRY_FIELDS[1:]]
+)
+
+
+def parse_speed(value: str) -> float:
+    """Parse a replay speed such as ``1``, ``4x`` or ``max``."""
+
+    text = value.strip().lower()
+    if text == "max":
+        return MAX_SPEED
+    text = text.removesuffix("x")
+    try:
+        speed = float(text)
+    except ValueError:
+        raise ValueError(f"Unknown replay speed '{value}'. Use a positive factor or 'max'") from None
+    if not speed > 0:
+        raise ValueError(f"Replay speed must be positive, got '{value}'")
+    return speed
+
+
+def format_robot_line(sample: SensorSample) -> str:
+    """Render *sample* as the firmware's ``T:1001`` JSON line."""
+
+    return (
+        f'{{"T":{sample.message_type},"L":{sample.left_speed:.7g},"R":{sample.right_speed:.7g},'
+        f'"r":{sample.roll:.7g},"p":{sample.pitch:.7g},"y":{sample.yaw:.7g},'
+        f'"temp":{sample.temperature_c:.7g},"v":{sample.voltage_v:.7g}}}'
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class ChunkInfo:
+    """Location and time range of one record chunk in a telemetry log."""
+
+    offset: int
+    compression: LogCompression
+    count: int
+    stored_size: int
+    raw_size: int
+    first_timestamp: float
+    last_timestamp: float
+
+
+class TelemetryLog:
+    """Read-only, memory-mapped view of a telemetry log.
+
+    Chunks are found by following the index chain from the trailer; a log
+    without a trailer (the recorder was killed) is scanned chunk by chunk
+    instead, and only the complete chunks are kept.  Records are decoded one
+    chunk at a time straight from the mapping.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path
+        with open(path, "rb") as handle:
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._read_header()
+            chunks = self._load_index()
+            self._chunks = chunks if chunks is not None else self._scan()
+        except Exception:
+            self._map.close()
+            raise
+        self._starts = [chunk.first_timestamp for chunk in self._chunks]
+
+    def _read_header(self) -> None:
+        if len(self._map) < LOG_HEADER.size:
+            raise ValueError(f"{self._path} is too short to be a telemetry log")
+        magic, version, record_size, started_at, started_monotonic = LOG_HEADER.unpack_from(self._map, 0)
+        if magic != LOG_MAGIC:
+            raise ValueError(f"{self._path} is not a telemetry log")
+        if version != LOG_VERSION or record_size != RECORD_STRUCT.size:
+            raise ValueError(f"Unsupported telemetry log version {version} (record size {record_size})")
+        self._started_at = started_at
+        self._started_monotonic = started_monotonic
+        self._complete = False
+
+    def _load_index(self) -> Optional[List[ChunkInfo]]:
+        size = len(self._map)
+        if size < LOG_HEADER.size + TRAILER.size:
+            return None
+        last_index, magic = TRAILER.unpack_from(self._map, size - TRAILER.size)
+        if magic != TRAILER_MAGIC:
+            return None
+        self._complete = True
+        entries: List[Tuple[int, float, float, int]] = []
+        offset = last_index
+        while offset:
+            kind, _, count, _, _ = CHUNK_HEADER.unpack_from(self._map, offset)
+            if kind != CHUNK_INDEX:
+                raise ValueError(f"Corrupt index chain in {self._path} at offset {offset}")
+            body = offset + CHUNK_HEADER.size
+            (offset,) = INDEX_HEAD.unpack_from(self._map, body)
+            block = [INDEX_ENTRY.unpack_from(self._map, body + INDEX_HEAD.size + i * INDEX_ENTRY.size) for i in range(count)]
+            entries[:0] = block
+        chunks = []
+        for chunk_offset, first, last, count in entries:
+            _, code, _, stored, raw = CHUNK_HEADER.unpack_from(self._map, chunk_offset)
+            chunks.append(ChunkInfo(chunk_offset, LogCompression.from_code(code), count, stored, raw, first, last))
+        return chunks
+
+    def _scan(self) -> List[ChunkInfo]:
+        chunks: List[ChunkInfo] = []
+        size = len(self._map)
+        offset = LOG_HEADER.size
+        while offset + CHUNK_HEADER.size <= size:
+            kind, code, count, stored, raw = CHUNK_HEADER.unpack_from(self._map, offset)
+            end = offset + CHUNK_HEADER.size + stored
+            if kind not in (CHUNK_RECORDS, CHUNK_INDEX) or end > size:
+                break
+            if kind == CHUNK_RECORDS and count:
+                chunk = ChunkInfo(offset, LogCompression.from_code(code), count, stored, raw, 0.0, 0.0)
+                try:
+                    records = self._decode(chunk)
+                except (OSError, ValueError, EOFError):
+                    break
+                chunks.append(ChunkInfo(offset, chunk.compression, count, stored, raw, records[0][0], records[-1][0]))
+            offset = end
+        LOGGER.warning("Telemetry log %s has no trailer; recovered %d complete chunks", self._path, len(chunks))
+        return chunks
+
+    # ------------------------------------------------------------------
+    # Metadata
+    # ------------------------------------------------------------------
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def complete(self) -> bool:
+        """``True`` when the recorder closed the log cleanly."""
+
+        return self._complete
+
+    @property
+    def started_at(self) -> float:
+        """Wall-clock time (``time.time()``) when recording started."""
+
+        return self._started_at
+
+    @property
+    def chunks(self) -> Tuple[ChunkInfo, ...]:
+        return tuple(self._chunks)
+
+    @property
+    def record_count(self) -> int:
+        return sum(chunk.count for chunk in self._chunks)
+
+    @property
+    def first_timestamp(self) -> float:
+        return self._chunks[0].first_timestamp if self._chunks else self._started_monotonic
+
+    @property
+    def duration(self) -> float:
+        """Seconds between the first and the last recorded sample."""
+
+        if not self._chunks:
+            return 0.0
+        return self._chunks[-1].last_timestamp - self._chunks[0].first_timestamp
+
+    # ------------------------------------------------------------------
+    # Records
+    # ------------------------------------------------------------------
+    def chunk_at(self, offset: float) -> int:
+        """Index of the chunk holding the sample *offset* seconds into the log."""
+
+        if not self._chunks:
+            return 0
+        position = bisect.bisect_right(self._starts, self.first_timestamp + offset) - 1
+        return max(0, position)
+
+    def records(self, offset: float = 0.0) -> Iterator[Record]:
+        """Yield ``(timestamp, *telemetry fields)`` from *offset* seconds on."""
+
+        start = self.first_timestamp + offset
+        for chunk in self._chunks[self.chunk_at(offset) :]:
+            for record in self._decode(chunk):
+                if record[0] >= start:
+                    yield record
+
+    def columns(self, offset: float = 0.0) -> Dict[str, np.ndarray]:
+        """Return every sample from *offset* seconds on as float64 columns.
+
+        The keys match :data:`~robot_control.telemetry_store.COLUMNS`, so the
+        result can stand in for :meth:`TelemetryStore.column` data in offline
+        analysis such as :meth:`EmotionPolicy.choose_batch`.
+        """
+
+        start = self.first_timestamp + offset
+        parts = [self._decode_array(chunk) for chunk in self._chunks[self.chunk_at(offset) :]]
+        rows = np.concatenate(parts) if parts else np.empty(0, dtype=_RECORD_DTYPE)
+        rows = rows[rows["time"] >= start]
+        return {name: rows[name].astype(np.float64) for name in COLUMNS}
+
+    def _decode_array(self, chunk: ChunkInfo) -> np.ndarray:
+        begin = chunk.offset + CHUNK_HEADER.size
+        if chunk.compression is LogCompression.NONE:
+            # Copy so no view into the mapping outlives this call.
+            return np.frombuffer(self._map, dtype=_RECORD_DTYPE, count=chunk.count, offset=begin).copy()
+        with memoryview(self._map) as view, view[begin : begin + chunk.stored_size] as payload:
+            raw = chunk.compression.decompress(payload, chunk.raw_size)
+        return np.frombuffer(raw, dtype=_RECORD_DTYPE, count=chunk.count)
+
+    def _decode(self, chunk: ChunkInfo) -> List[Record]:
+        begin = chunk.offset + CHUNK_HEADER.size
+        with memoryview(self._map) as view, view[begin : begin + chunk.stored_size] as payload:
+            if chunk.compression is LogCompression.NONE:
+                return list(RECORD_STRUCT.iter_unpack(payload))
+            raw = chunk.compression.decompress(payload, chunk.raw_size)
+        return list(RECORD_STRUCT.iter_unpack(raw))
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __enter__(self) -> "TelemetryLog":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+
+class ReplayReader(SampleSource):
+    """Stand-in for :class:`SerialReadWriter` that plays back a telemetry log.
+
+    Samples are released with their recorded spacing divided by *speed*
+    (``1.0`` is real time, :data:`MAX_SPEED` as fast as the consumers keep
+    up) and passed through the same buffer, history and consumers.  Their
+    ``received_at`` is taken from the recorded timestamps on the monotonic
+    clock, scaled by *speed*, so release jitter never reaches rest detection
+    or calibration windows.  Those windows still see a compressed or
+    stretched timeline at any paced speed other than ``1.0``.  At
+    :data:`MAX_SPEED` the stamps keep the recorded 1x spacing and run ahead
+    of the wall clock.  Line
+    consumers receive each record re-rendered as a firmware ``T:1001`` line,
+    so the bridge mirrors a raw log as well.  Commands are logged and kept in
+    :attr:`sent_commands` since there is no device to receive them.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        speed: float = 1.0,
+        start_at: float = 0.0,
+        loop: bool = False,
+        buffer_size: int = 512,
+        history: TelemetryStore | None = None,
+    ) -> None:
+        if not speed > 0:
+            raise ValueError("speed must be positive")
+        self._log = TelemetryLog(path)
+        super().__init__(buffer_size, history)
+        self._speed = speed
+        self._start_at = start_at
+        self._loop = loop
+        self._commands: Deque[str] = deque(maxlen=256)
+        self._passes = 0
+        self._exhausted = False
+        self._last_stamp = -math.inf
+
+    @property
+    def log(self) -> TelemetryLog:
+        return self._log
+
+    @property
+    def speed(self) -> float:
+        return self._speed
+
+    @property
+    def finished(self) -> bool:
+        """``True`` once the replay has released its last sample.
+
+        A looping replay only finishes when a pass has nothing to release.
+        """
+
+        return self._passes > 0 and (not self._loop or self._exhausted) and self._stop_event.is_set()
+
+    def wait_finished(self, timeout: float | None = None) -> bool:
+        """Block until the replay ends (or *timeout* passes); ``True`` if it ended."""
+
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+            return not thread.is_alive()
+        return self._stop_event.is_set()
+
+    @property
+    def sent_commands(self) -> List[str]:
+        """The most recent commands passed to :meth:`send_command`."""
+
+        return list(self._commands)
+
+    def send_command(self, command: str) -> None:
+        if self._closed:
+            raise RuntimeError("Replay is closed")
+        command = command.rstrip("\n")
+        LOGGER.info("Replay ignoring command %r", command)
+        self._commands.append(command)
+
+    # ------------------------------------------------------------------
+    # Replay thread
+    # ------------------------------------------------------------------
+    def _run(self) -> None:
+        try:
+            while not self._stop_event.is_set():
+                released = self._replay_once()
+                self._passes += 1
+                if not self._loop:
+                    break
+                if not released and not self._stop_event.is_set():
+                    # Looping a pass that releases nothing would spin forever.
+                    LOGGER.warning("Replay of %s has no samples after %.1fs; stopping", self._log.path, self._start_at)
+                    self._exhausted = True
+                    break
+        except (OSError, ValueError, EOFError) as exc:
+            self._error = exc
+            LOGGER.error("Telemetry replay failed: %s", exc)
+        finally:
+            self._stop_event.set()
+
+    def _replay_once(self) -> int:
+        """Release one pass over the log; return the number of records released."""
+
+        released = 0
+        paced = math.isfinite(self._speed)
+        scale = self._speed if paced else 1.0
+        origin = monotonic()
+        # Stamps must not run backwards when a fast pass loops around.
+        stamp_origin = max(origin, self._last_stamp)
+        log_origin: Optional[float] = None
+        stop = self._stop_event
+        for timestamp, message_type, *values in self._log.records(self._start_at):
+            if stop.is_set():
+                return released
+            if log_origin is None:
+                log_origin = timestamp
+            offset = (timestamp - log_origin) / scale
+            if paced:
+                delay = origin + offset - monotonic()
+                if delay > 0 and stop.wait(delay):
+                    return released
+            self._last_stamp = stamp_origin + offset
+            sample = SensorSample(message_type, *values, self._last_stamp)
+            if self._line_consumers:
+                self._dispatch_line(format_robot_line(sample))
+            if sample.is_robot_frame:
+                self._publish_sample(sample)
+            released += 1
+        return released
+
+    def _close_transport(self) -> None:
+        try:
+            self._log.close()
+        except BufferError:  # pragma: no cover - replay thread still decoding
+            LOGGER.debug("Replay thread still holds the log mapping; leaving it to the GC")
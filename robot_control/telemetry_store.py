@@ -0,0 +1,192 @@
+"""Columnar history of recent telemetry backed by a preallocated NumPy ring."""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .sensor_data import SensorSample
+
+COLUMNS: Tuple[str, ...] = (
+    "time",
+    "left_speed",
+    "right_speed",
+    "roll",
+    "pitch",
+    "yaw",
+    "temperature_c",
+    "voltage_v",
+)
+
+_COLUMN_INDEX: Dict[str, int] = {name: index for index, name in enumerate(COLUMNS)}
+
+
+class TelemetryStore:
+    """Fixed-capacity, column-major store of the most recent samples.
+
+    Every sample is written twice, at ``i`` and ``i + capacity``, so the newest
+    ``n`` rows are always one contiguous slice.  Queries therefore return NumPy
+    *views* instead of copies; a view of ``n`` rows stays valid for the next
+    ``capacity - n`` appends.  Use :meth:`snapshot` when data must outlive that.
+
+    ``time`` holds :meth:`SensorSample.timestamp` (monotonic seconds) and must be
+    non-decreasing, which lets window queries use a binary search.
+    """
+
+    def __init__(self, capacity: int = 6000) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be a positive integer")
+        self._capacity = capacity
+        self._data = np.zeros((len(COLUMNS), 2 * capacity), dtype=np.float64)
+        self._count = 0
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+    def append(self, sample: SensorSample) -> None:
+        values = (
+            sample.timestamp(),
+            sample.left_speed,
+            sample.right_speed,
+            sample.roll,
+            sample.pitch,
+            sample.yaw,
+            sample.temperature_c,
+            sample.voltage_v,
+        )
+        with self._lock:
+            slot = self._count % self._capacity
+            self._data[:, slot] = values
+            self._data[:, slot + self._capacity] = values
+            self._count += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._count = 0
+
+    # ------------------------------------------------------------------
+    # Views
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return min(self._count, self._capacity)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def total_appended(self) -> int:
+        return self._count
+
+    def last(self, n: Optional[int] = None) -> np.ndarray:
+        """Return a ``(len(COLUMNS), n)`` view of the newest *n* samples, oldest first."""
+
+        with self._lock:
+            size = min(self._count, self._capacity)
+            n = size if n is None else max(0, min(n, size))
+            end = (self._count - 1) % self._capacity + self._capacity + 1 if self._count else 0
+        return self._data[:, end - n:end]
+
+    def window(self, seconds: float, now: Optional[float] = None) -> np.ndarray:
+        """Return a view of every sample stamped within *seconds* of *now*.
+
+        *now* defaults to the newest sample's timestamp, so a stalled feed still
+        answers with its last window instead of an empty one.
+        """
+
+        with self._lock:
+            size = min(self._count, self._capacity)
+            end = (self._count - 1) % self._capacity + self._capacity + 1 if self._count else 0
+            # A full-capacity view starts at the slot the next append
+            # overwrites, so the binary search must not race the producer.
+            times = self._data[0, end - size:end]
+            if size:
+                reference = times[-1] if now is None else now
+                start = end - size + int(np.searchsorted(times, reference - seconds, side="left"))
+            else:
+                start = end
+        return self._data[:, start:end]
+
+    def column(self, name: str, seconds: Optional[float] = None) -> np.ndarray:
+        """Return a 1-D view of column *name*, optionally limited to a time window."""
+
+        rows = self.last() if seconds is None else self.window(seconds)
+        return rows[_column_index(name)]
+
+    def snapshot(self, seconds: Optional[float] = None) -> np.ndarray:
+        """Return an owned copy of the newest rows (all of them when *seconds* is ``None``)."""
+
+        rows = self.last() if seconds is None else self.window(seconds)
+        return rows.copy()
+
+    # ------------------------------------------------------------------
+    # Vectorized window statistics
+    # ------------------------------------------------------------------
+    def mean(self, seconds: float, columns: Sequence[str] | str | None = None) -> np.ndarray | float:
+        return self._reduce(np.mean, seconds, columns)
+
+    def minimum(self, seconds: float, columns: Sequence[str] | str | None = None) -> np.ndarray | float:
+        return self._reduce(np.min, seconds, columns)
+
+    def maximum(self, seconds: float, columns: Sequence[str] | str | None = None) -> np.ndarray | float:
+        return self._reduce(np.max, seconds, columns)
+
+    def spread(self, seconds: float, columns: Sequence[str] | str | None = None) -> np.ndarray | float:
+        """Return ``max - min`` over the window (the calibrator's stability test)."""
+
+        return self._reduce(np.ptp, seconds, columns)
+
+    def percentile(
+        self,
+        q: float,
+        seconds: float,
+        columns: Sequence[str] | str | None = None,
+    ) -> np.ndarray | float:
+        return self._reduce(lambda rows, axis: np.percentile(rows, q, axis=axis), seconds, columns)
+
+    def slope(self, seconds: float, columns: Sequence[str] | str | None = None) -> np.ndarray | float:
+        """Return the least-squares trend over the window in units per second."""
+
+        rows = self.window(seconds)
+        selected = _select(rows, columns)
+        if rows.shape[1] < 2:
+            return _empty_like(selected)
+        times = rows[0] - rows[0].mean()
+        denominator = float(np.dot(times, times))
+        if denominator == 0.0:
+            return _empty_like(selected)
+        centered = selected - selected.mean(axis=-1, keepdims=True)
+        result = centered @ times / denominator
+        return float(result) if np.ndim(result) == 0 else result
+
+    def _reduce(self, reducer, seconds: float, columns: Sequence[str] | str | None) -> np.ndarray | float:
+        rows = self.window(seconds)
+        selected = _select(rows, columns)
+        if not rows.shape[1]:
+            return _empty_like(selected)
+        result = reducer(selected, axis=-1)
+        return float(result) if np.ndim(result) == 0 else result
+
+
+def _column_index(name: str) -> int:
+    try:
+        return _COLUMN_INDEX[name]
+    except KeyError:
+        raise KeyError(f"Unknown telemetry column '{name}'. Available: {', '.join(COLUMNS)}") from None
+
+
+def _select(rows: np.ndarray, columns: Sequence[str] | str | None) -> np.ndarray:
+    if columns is None:
+        return rows
+    if isinstance(columns, str):
+        return rows[_column_index(columns)]
+    return rows[[_column_index(name) for name in columns]]
+
+
+def _empty_like(selected: np.ndarray) -> np.ndarray | float:
+    if selected.ndim == 1:
+        return float("nan")
+    return np.full(selected.shape[0], np.nan)
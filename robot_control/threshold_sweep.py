@@ -0,0 +1,416 @@
+"""Score emotion policy and rest-detection settings against recorded telemetry.
+
+Each :class:`SweepConfig` is replayed over the columns of one or more
+telemetry logs with the same decisions :class:`EmotionStateMachine` makes on
+the robot, but evaluated column-wise: the policy through
+:meth:`EmotionPolicy.choose_batch`, the steady and major-movement tests as
+array comparisons, and rest detection as a scan over steady runs rather than
+over samples.  :func:`verify` replays a prefix through the real state machine
+so the two paths cannot drift apart.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields, replace
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+
+import numpy as np
+
+from .emotion_policy import CODE_ALERT, CODE_DEFAULT, EmotionPolicy
+from .emotion_state import DEFAULT_REST_DELAY, DEFAULT_SLEEP_EMOTION, EmotionStateMachine, MotionThresholds
+from .sensor_data import SensorSample, get_calibration_offsets, set_calibration_offsets
+from .telemetry_replay import TelemetryLog
+
+#: Emotion code for the sleep emotion, following the ``CODE_*`` values of
+#: :meth:`EmotionPolicy.choose_batch` (``CODE_CURRENT`` never occurs here).
+CODE_SLEEP = 4
+
+_POLICY_PARAMETERS = tuple(
+    item.name for item in fields(EmotionPolicy) if not item.name.endswith("_emotion")
+)
+_MOTION_PARAMETERS = tuple(item.name for item in fields(MotionThresholds))
+
+#: Every name accepted by :meth:`SweepConfig.from_overrides` and :func:`parse_grid`.
+SWEEP_PARAMETERS: Tuple[str, ...] = _POLICY_PARAMETERS + _MOTION_PARAMETERS + ("rest_delay",)
+
+Columns = Mapping[str, np.ndarray]
+
+
+# ---------------------------------------------------------------------------
+# Configurations
+# ---------------------------------------------------------------------------
+
+
+@dataclass(slots=True, frozen=True)
+class SweepConfig:
+    """One candidate set of policy thresholds, motion thresholds and rest delay."""
+
+    policy: EmotionPolicy = field(default_factory=EmotionPolicy)
+    thresholds: MotionThresholds = field(default_factory=MotionThresholds)
+    rest_delay: float = DEFAULT_REST_DELAY
+
+    @classmethod
+    def from_overrides(cls, overrides: Mapping[str, float]) -> "SweepConfig":
+        """Build a configuration from defaults with the named values replaced."""
+
+        policy: Dict[str, float] = {}
+        motion: Dict[str, float] = {}
+        rest_delay = DEFAULT_REST_DELAY
+        for name, value in overrides.items():
+            if name in _POLICY_PARAMETERS:
+                policy[name] = float(value)
+            elif name in _MOTION_PARAMETERS:
+                motion[name] = float(value)
+            elif name == "rest_delay":
+                rest_delay = float(value)
+            else:
+                available = ", ".join(SWEEP_PARAMETERS)
+                raise ValueError(f"Unknown sweep parameter '{name}'. Available: {available}")
+        return cls(replace(EmotionPolicy(), **policy), MotionThresholds(**motion), rest_delay)
+
+    def overrides(self) -> Dict[str, float]:
+        """Return the values that differ from the defaults, by parameter name."""
+
+        baseline = SweepConfig()
+        changed: Dict[str, float] = {}
+        for name in _POLICY_PARAMETERS:
+            if getattr(self.policy, name) != getattr(baseline.policy, name):
+                changed[name] = getattr(self.policy, name)
+        for name in _MOTION_PARAMETERS:
+            if getattr(self.thresholds, name) != getattr(baseline.thresholds, name):
+                changed[name] = getattr(self.thresholds, name)
+        if self.rest_delay != baseline.rest_delay:
+            changed["rest_delay"] = self.rest_delay
+        return changed
+
+    def label(self) -> str:
+        changed = self.overrides()
+        return " ".join(f"{name}={value:g}" for name, value in changed.items()) or "defaults"
+
+    def state_machine(self) -> EmotionStateMachine:
+        return EmotionStateMachine(self.policy, rest_delay=self.rest_delay, thresholds=self.thresholds)
+
+
+def _parse_values(text: str) -> List[float]:
+    if ":" in text:
+        parts = [float(part) for part in text.split(":")]
+        if len(parts) != 3 or parts[2] <= 0:
+            raise ValueError(f"Invalid range '{text}', expected START:STOP:STEP")
+        start, stop, step = parts
+        count = int(math.floor((stop - start) / step + 1e-9)) + 1
+        return [round(start + index * step, 9) for index in range(max(0, count))]
+    return [float(part) for part in text.split(",") if part.strip()]
+
+
+def parse_grid(specs: Iterable[str]) -> List[SweepConfig]:
+    """Expand ``NAME=V1,V2,...`` or ``NAME=START:STOP:STEP`` specs into their cartesian product."""
+
+    axes: Dict[str, List[float]] = {}
+    for spec in specs:
+        name, separator, values = spec.partition("=")
+        name = name.strip().replace("-", "_")
+        if not separator:
+            raise ValueError(f"Invalid grid spec '{spec}', expected NAME=VALUES")
+        if name not in SWEEP_PARAMETERS:
+            available = ", ".join(SWEEP_PARAMETERS)
+            raise ValueError(f"Unknown sweep parameter '{name}'. Available: {available}")
+        parsed = _parse_values(values)
+        if not parsed:
+            raise ValueError(f"Grid spec '{spec}' has no values")
+        axes[name] = parsed
+    names = list(axes)
+    return [
+        SweepConfig.from_overrides(dict(zip(names, combination)))
+        for combination in itertools.product(*(axes[name] for name in names))
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Simulation
+# ---------------------------------------------------------------------------
+
+
+def _wrap(angle: np.ndarray) -> np.ndarray:
+    wrapped = (angle + 180.0) % 360.0 - 180.0
+    return np.where((wrapped == -180.0) & (angle > 0), 180.0, wrapped)
+
+
+def motion_flags(columns: Columns, thresholds: MotionThresholds) -> Tuple[np.ndarray, np.ndarray]:
+    """Return ``(major, steady)`` masks matching :class:`MotionThresholds` per sample."""
+
+    offsets = get_calibration_offsets()
+    roll = columns["roll"] - offsets["roll"]
+    pitch = columns["pitch"] - offsets["pitch"]
+    yaw = _wrap(columns["yaw"] - offsets["yaw"])
+    left, right = columns["left_speed"], columns["right_speed"]
+
+    roll_delta = np.abs(np.diff(roll))
+    pitch_delta = np.abs(np.diff(pitch))
+    yaw_delta = np.abs(_wrap(np.diff(yaw)))
+    speed = np.maximum(np.abs(left), np.abs(right))
+    speed_delta = np.maximum(np.abs(np.diff(left)), np.abs(np.diff(right)))
+
+    major = np.ones(len(roll), dtype=bool)
+    major[1:] = (
+        (roll_delta >= thresholds.major_roll_delta)
+        | (pitch_delta >= thresholds.major_pitch_delta)
+        | (yaw_delta >= thresholds.major_yaw_delta)
+        | (speed_delta >= thresholds.major_speed_delta)
+    )
+    steady = np.zeros(len(roll), dtype=bool)
+    steady[1:] = (
+        (roll_delta <= thresholds.steady_roll_delta)
+        & (pitch_delta <= thresholds.steady_pitch_delta)
+        & (yaw_delta <= thresholds.steady_yaw_delta)
+        & (speed[1:] <= thresholds.steady_speed)
+        & (speed[:-1] <= thresholds.steady_speed)
+    )
+    return major, steady
+
+
+@dataclass(slots=True)
+class _Trace:
+    codes: np.ndarray
+    major: np.ndarray
+    sleep_onsets: List[int]
+
+
+def _simulate(columns: Columns, config: SweepConfig) -> _Trace:
+    times = columns["time"]
+    major, steady = motion_flags(columns, config.thresholds)
+    # Awake, the state machine shows whatever the policy picks, with a held
+    # emotion resolved to the default.
+    codes = config.policy.choose_batch(columns["roll"], columns["pitch"], columns["yaw"])
+
+    resting = steady & ~major
+    edges = np.diff(resting.astype(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    # Only runs lasting rest_delay can put the robot to sleep; the same
+    # subtraction as the state machine keeps the comparison exact.
+    long_enough = (times[ends - 1] - times[starts]) >= config.rest_delay
+    major_indices = np.flatnonzero(major)
+
+    onsets: List[int] = []
+    awake_from = 0
+    for start, end in zip(starts[long_enough].tolist(), ends[long_enough].tolist()):
+        if start < awake_from:
+            continue
+        onset = start + int(np.argmax((times[start:end] - times[start]) >= config.rest_delay))
+        position = int(np.searchsorted(major_indices, onset, side="right"))
+        wake = int(major_indices[position]) if position < len(major_indices) else len(codes)
+        codes[onset:wake] = CODE_SLEEP
+        if wake < len(codes):
+            codes[wake] = CODE_DEFAULT
+        onsets.append(onset)
+        awake_from = wake + 1
+    return _Trace(codes, major, onsets)
+
+
+def emotion_names(config: SweepConfig) -> Tuple[str, ...]:
+    """Emotion names indexed by the codes :func:`simulate` returns."""
+
+    return config.policy.labels() + (DEFAULT_SLEEP_EMOTION,)
+
+
+def simulate(columns: Columns, config: SweepConfig) -> np.ndarray:
+    """Return the emotion code shown after each sample of *columns* under *config*."""
+
+    return _simulate(columns, config).codes
+
+
+def _samples(columns: Columns, limit: int) -> Iterable[SensorSample]:
+    names = ("left_speed", "right_speed", "roll", "pitch", "yaw", "temperature_c", "voltage_v")
+    values = [columns[name][:limit].tolist() for name in names]
+    for received_at, *row in zip(columns["time"][:limit].tolist(), *values):
+        yield SensorSample(1001, *row, received_at=received_at)
+
+
+def verify(columns: Columns, config: SweepConfig, limit: int | None = None) -> int:
+    """Replay up to *limit* samples through :class:`EmotionStateMachine`; return the mismatch count."""
+
+    count = len(columns["time"]) if limit is None else min(limit, len(columns["time"]))
+    names = emotion_names(config)
+    expected = simulate({name: values[:count] for name, values in columns.items()}, config)
+    machine = config.state_machine()
+    mismatches = 0
+    for code, sample in zip(expected.tolist(), _samples(columns, count)):
+        if machine.advance(sample) != names[code]:
+            mismatches += 1
+    return mismatches
+
+
+# ---------------------------------------------------------------------------
+# Scoring
+# ---------------------------------------------------------------------------
+
+
+@dataclass(slots=True, frozen=True)
+class SweepResult:
+    """How one configuration behaved over every log of a sweep.
+
+    Rates are per minute of telemetry.  A *blip* is an emotion that was
+    replaced again within ``blip_seconds``.  Time-to-sleep runs from the last
+    major movement to the sleep emotion.  Alert latency runs from each onset
+    of the default policy's alert condition to the alert emotion; onsets not
+    answered within ``alert_window`` seconds count as missed.  Undefined
+    medians are ``nan``.
+    """
+
+    config: SweepConfig
+    samples: int
+    duration: float
+    flips_per_minute: float
+    blips_per_minute: float
+    alerts_per_minute: float
+    sleeps: int
+    asleep_share: float
+    time_to_sleep: float
+    alert_events: int
+    alert_latency: float
+    alert_latency_p95: float
+    alert_missed: int
+    mismatches: int = 0
+
+    def as_dict(self) -> Dict[str, object]:
+        data: Dict[str, object] = {"label": self.config.label(), "overrides": self.config.overrides()}
+        for item in fields(self):
+            if item.name != "config":
+                value = getattr(self, item.name)
+                data[item.name] = None if isinstance(value, float) and math.isnan(value) else value
+        return data
+
+
+def _median(values: Sequence[float], quantile: float = 0.5) -> float:
+    return float(np.quantile(values, quantile)) if len(values) else math.nan
+
+
+def evaluate(
+    logs: Sequence[Columns],
+    config: SweepConfig,
+    *,
+    blip_seconds: float = 0.5,
+    alert_window: float = 2.0,
+    check_samples: int = 0,
+) -> SweepResult:
+    """Score *config* over the columns of every log in *logs*."""
+
+    reference = EmotionPolicy()
+    samples = flips = blips = alerts = 0
+    duration = asleep = 0.0
+    sleep_delays: List[float] = []
+    latencies: List[float] = []
+    alert_events = missed = mismatches = 0
+
+    for columns in logs:
+        times = columns["time"]
+        if not len(times):
+            continue
+        trace = _simulate(columns, config)
+        codes = trace.codes
+        samples += len(codes)
+        duration += float(times[-1] - times[0])
+
+        changes = np.flatnonzero(codes[1:] != codes[:-1]) + 1
+        flips += len(changes)
+        # Segments that started at a change and ended at the next one.
+        held = times[changes[1:]] - times[changes[:-1]]
+        blips += int(np.count_nonzero(held < blip_seconds))
+        alerts += int(np.count_nonzero(codes[changes] == CODE_ALERT)) + int(codes[0] == CODE_ALERT)
+
+        boundaries = np.concatenate(([0], changes, [len(codes)]))
+        spans = times[np.minimum(boundaries[1:], len(codes) - 1)] - times[boundaries[:-1]]
+        asleep += float(spans[codes[boundaries[:-1]] == CODE_SLEEP].sum())
+
+        major_indices = np.flatnonzero(trace.major)
+        for onset in trace.sleep_onsets:
+            last = major_indices[np.searchsorted(major_indices, onset, side="right") - 1]
+            sleep_delays.append(float(times[onset] - times[last]))
+
+        expected = reference.choose_batch(columns["roll"], columns["pitch"], columns["yaw"]) == CODE_ALERT
+        onsets = np.flatnonzero(expected & ~np.concatenate(([False], expected[:-1])))
+        shown = np.flatnonzero(codes == CODE_ALERT)
+        answers = np.searchsorted(shown, onsets)
+        alert_events += len(onsets)
+        for onset, answer in zip(onsets.tolist(), answers.tolist()):
+            delay = float(times[shown[answer]] - times[onset]) if answer < len(shown) else math.inf
+            if delay <= alert_window:
+                latencies.append(delay)
+            else:
+                missed += 1
+
+        if check_samples:
+            mismatches += verify(columns, config, check_samples)
+
+    minutes = duration / 60.0 if duration > 0 else math.nan
+    return SweepResult(
+        config=config,
+        samples=samples,
+        duration=duration,
+        flips_per_minute=flips / minutes,
+        blips_per_minute=blips / minutes,
+        alerts_per_minute=alerts / minutes,
+        sleeps=len(sleep_delays),
+        asleep_share=asleep / duration if duration > 0 else math.nan,
+        time_to_sleep=_median(sleep_delays),
+        alert_events=alert_events,
+        alert_latency=_median(latencies),
+        alert_latency_p95=_median(latencies, 0.95),
+        alert_missed=missed,
+        mismatches=mismatches,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Parallel sweep
+# ---------------------------------------------------------------------------
+
+_WORKER_LOGS: List[Dict[str, np.ndarray]] = []
+
+
+def load_columns(paths: Sequence[str], offset: float = 0.0) -> List[Dict[str, np.ndarray]]:
+    """Read the columns of every telemetry log in *paths*."""
+
+    loaded = []
+    for path in paths:
+        with TelemetryLog(path) as log:
+            loaded.append(log.columns(offset))
+    return loaded
+
+
+def _init_worker(paths: Sequence[str], offset: float, calibration: Mapping[str, float]) -> None:
+    set_calibration_offsets(**calibration)
+    _WORKER_LOGS[:] = load_columns(paths, offset)
+
+
+def _evaluate_in_worker(config: SweepConfig, options: Mapping[str, float]) -> SweepResult:
+    return evaluate(_WORKER_LOGS, config, **options)
+
+
+def run_sweep(
+    paths: Sequence[str],
+    configs: Sequence[SweepConfig],
+    *,
+    workers: int | None = None,
+    offset: float = 0.0,
+    blip_seconds: float = 0.5,
+    alert_window: float = 2.0,
+    check_samples: int = 0,
+) -> List[SweepResult]:
+    """Evaluate *configs* over the logs at *paths* on a process pool.
+
+    Each worker decodes the logs once and then scores whole configurations,
+    so the cost of a sweep grows with the grid, not with pickled columns.
+    Results come back in the order of *configs*.
+    """
+
+    options = {"blip_seconds": blip_seconds, "alert_window": alert_window, "check_samples": check_samples}
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(list(paths), offset, get_calibration_offsets()),
+    ) as pool:
+        return list(pool.map(_evaluate_in_worker, configs, itertools.repeat(options)))
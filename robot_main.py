@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import argparse
 import logging
 import signal
 import sys
@@ -9,10 +10,21 @@ from PySide6.QtWidgets import QApplication
 
 from axon_ros.osi import OsiLayer, OsiStack, describe_stack
 from axon_ros.runtime import RobotMainWindow, RobotRuntime
-from axon_ui import InfoPanel, RoboticFaceWidget, TelemetryPanel
-from robot_control import EmotionPolicy, FaceController, GyroCalibrator, SerialReadWriter
+from axon_ui import FrameProfiler, FrameProfilerPanel, InfoPanel, TelemetryPanel
+from axon_ui.face_backend import FaceBackend, create_face_widget
+from axon_ui.frame_pacer import PacingConfig, PowerProfile
+from robot_control import (
+    EmotionPolicy,
+    FaceController,
+    GyroCalibrator,
+    LogCompression,
+    SerialReadWriter,
+    TelemetryRecorder,
+    TelemetryStore,
+)
 from robot_control.serial_bridge_config import SerialBridgeConfig
 from robot_control.serial_bridge_server import SerialBridgeServer
+from robot_control.telemetry_replay import ReplayReader, parse_speed
 
 try:  # Reuse the palette from the interactive demo when available.
     from axon_ui import apply_dark_palette as apply_palette
@@ -23,7 +35,6 @@ LOGGER = logging.getLogger(__name__)
 
 DEFAULT_SERIAL_PORT = "/dev/ttyAMA0"
 DEFAULT_BAUDRATE = 115200
-DEFAULT_POLL_INTERVAL_MS = 40
 DEFAULT_LOG_LEVEL = "INFO"
 DEFAULT_BRIDGE_HOST = "0.0.0.0"
 DEFAULT_BRIDGE_PORT = 8765
@@ -36,25 +47,117 @@ def _configure_logging(level: str) -> None:
     )
 
 
-def main() -> int:
-    # Allow the hardware stack to settle before attempting to connect.
-    time.sleep(5)
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Axon robot runtime")
+    parser.add_argument(
+        "--serial-port",
+        default=DEFAULT_SERIAL_PORT,
+        help="UART device to read telemetry from (e.g. the pty printed by misc/firmware_simulator.py)",
+    )
+    parser.add_argument("--baudrate", type=int, default=DEFAULT_BAUDRATE, help="UART baud rate")
+    parser.add_argument(
+        "--power-profile",
+        choices=[profile.value for profile in PowerProfile],
+        default=PowerProfile.BALANCED.value,
+        help="Animation frame-rate trade-off: full rate always, throttled when idle, or low rate",
+    )
+    parser.add_argument(
+        "--fps-cap",
+        type=float,
+        default=None,
+        help="Upper bound for face animation and telemetry frames per second (overrides the profile)",
+    )
+    parser.add_argument(
+        "--face-backend",
+        choices=[backend.value for backend in FaceBackend],
+        default=FaceBackend.SOFTWARE.value,
+        help="Face renderer: auto (OpenGL when a context can be created), software (QPainter) or opengl (shaders)",
+    )
+    parser.add_argument(
+        "--profile-face",
+        action="store_true",
+        help="Time each face drawing section, add a frame-time overlay panel and log the percentiles on exit",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="PATH",
+        default=None,
+        help="Record every telemetry frame to a new binary log at PATH",
+    )
+    parser.add_argument(
+        "--record-compression",
+        choices=[compression.value for compression in LogCompression],
+        default=LogCompression.NONE.value,
+        help="Compress recorded chunks with gzip or zstd (needs the zstandard package)",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="PATH",
+        default=None,
+        help="Play back a recorded telemetry log instead of opening the UART",
+    )
+    parser.add_argument(
+        "--replay-speed",
+        type=parse_speed,
+        default=1.0,
+        help="Replay speed factor (e.g. 1, 4x) or 'max'",
+    )
+    parser.add_argument(
+        "--replay-loop",
+        action="store_true",
+        help="Restart the replay from the beginning when the log ends",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    pacing = PacingConfig.for_profile(PowerProfile(args.power_profile), fps_cap=args.fps_cap)
+
+    if args.replay is None and args.serial_port == DEFAULT_SERIAL_PORT:
+        # Allow the hardware stack to settle before attempting to connect.
+        time.sleep(5)
     _configure_logging(DEFAULT_LOG_LEVEL)
 
     stack = OsiStack("Robot runtime")
 
+    reader: SerialReadWriter | ReplayReader
     try:
-        reader = SerialReadWriter(port=DEFAULT_SERIAL_PORT, baudrate=DEFAULT_BAUDRATE)
-    except RuntimeError as exc:
+        if args.replay is not None:
+            reader = ReplayReader(
+                args.replay,
+                speed=args.replay_speed,
+                loop=args.replay_loop,
+                history=TelemetryStore(),
+            )
+        else:
+            reader = SerialReadWriter(
+                port=args.serial_port,
+                baudrate=args.baudrate,
+                history=TelemetryStore(),
+            )
+    except (OSError, RuntimeError, ValueError) as exc:
         LOGGER.error("%s", exc)
         return 1
     stack.register(
         OsiLayer.PHYSICAL,
-        "SerialReadWriter",
+        type(reader).__name__,
         reader,
-        description="UART sensor feed",
+        description="Recorded telemetry replay" if args.replay is not None else "UART sensor feed",
     )
 
+    recorder: TelemetryRecorder | None = None
+    if args.record:
+        try:
+            recorder = TelemetryRecorder(args.record, compression=LogCompression.parse(args.record_compression))
+            recorder.start()
+        except (OSError, RuntimeError) as exc:
+            LOGGER.error("Cannot record telemetry to %s: %s", args.record, exc)
+            reader.close()
+            return 1
+        recorder.attach(reader)
+        LOGGER.info("Recording telemetry to %s (%s)", args.record, args.record_compression)
+
     bridge = SerialBridgeServer(
         reader,
         config=SerialBridgeConfig(host=DEFAULT_BRIDGE_HOST, port=DEFAULT_BRIDGE_PORT),
@@ -73,13 +176,21 @@ def main() -> int:
     if apply_palette is not None:
         apply_palette(app)
 
-    face = RoboticFaceWidget()
+    face = create_face_widget(args.face_backend)
+    face.set_frame_pacing(pacing)
     policy = EmotionPolicy()
     calibrator = GyroCalibrator()
     controller = FaceController(face, policy)
     telemetry = TelemetryPanel()
+    telemetry.set_history(reader.history)
     info_panel = InfoPanel()
-    window = RobotMainWindow(face, (info_panel, telemetry))
+    overlays = [info_panel, telemetry]
+    profiler: FrameProfiler | None = None
+    if args.profile_face:
+        profiler = FrameProfiler()
+        profiler.attach(face)
+        overlays.insert(0, FrameProfilerPanel(profiler))
+    window = RobotMainWindow(face, tuple(overlays))
     stack.register(OsiLayer.PRESENTATION, "EmotionPolicy", policy)
     stack.register(OsiLayer.PRESENTATION, "GyroCalibrator", calibrator)
     stack.register(OsiLayer.APPLICATION, "RobotMainWindow", window)
@@ -88,19 +199,26 @@ def main() -> int:
         reader,
         controller,
         telemetry,
-        poll_interval_ms=DEFAULT_POLL_INTERVAL_MS,
         calibrator=calibrator,
         bridge=bridge,
+        max_fps=pacing.fps_cap,
     )
     stack.register(
         OsiLayer.SESSION,
         "RobotRuntime",
         runtime,
-        description="Qt polling loop",
+        description="Event-driven Qt loop",
     )
     app.aboutToQuit.connect(runtime.stop)
 
     LOGGER.info("%s", describe_stack(stack))
+    LOGGER.info(
+        "Face pacing: %s profile, %.0f fps cap, %.0f fps when idle",
+        args.power_profile,
+        pacing.fps_cap,
+        pacing.idle_fps,
+    )
+    LOGGER.info("Face renderer: %s", type(face).__name__)
 
     # Support clean shutdown when Ctrl+C is pressed on the console.
     signal.signal(signal.SIGINT, lambda *_: app.quit())
@@ -116,6 +234,11 @@ def main() -> int:
         return 0
     finally:
         runtime.stop()
+        if recorder is not None:
+            recorder.stop()
+            LOGGER.info("Telemetry log %s: %s", recorder.path, recorder.stats)
+        if profiler is not None:
+            LOGGER.info("Face frame times:\n%s", profiler.describe())
 
 
 if __name__ == "__main__":